@@ -0,0 +1 @@
+# Performance benchmarks for the Zackry CLI (not shipped with the package)
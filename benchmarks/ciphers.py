@@ -0,0 +1,70 @@
+# benchmarks/ciphers.py
+"""
+Token size and encrypt/decrypt throughput per cipher backend.
+
+    python -m benchmarks.ciphers run -o ciphers.json
+    python -m benchmarks.ciphers compare baseline.json ciphers.json
+"""
+
+import os
+import sys
+import time
+
+from benchmarks.common import build_parser, compare_files, write_results
+
+SIZES = (16, 256, 4096)
+
+
+def _ops_s(func, values: list, repeat: int) -> int:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for value in values:
+            func(value)
+        best = min(best, time.perf_counter() - start)
+    return round(len(values) / best)
+
+
+def bench_cipher(cipher: str, key: str, size: int, count: int, repeat: int) -> dict:
+    from dev_cli.utils.encryption import decrypt_token, encrypt_data
+
+    values = [os.urandom(size // 2 + 1).hex()[:size] for _ in range(count)]
+    tokens = [encrypt_data(v, key, cipher) for v in values]
+    assert decrypt_token(tokens[0], key) == values[0]
+
+    return {
+        "token_bytes": len(tokens[0]),
+        "overhead": round(len(tokens[0]) / size, 2),
+        "encrypt": {"ops_s": _ops_s(lambda v: encrypt_data(v, key, cipher), values, repeat)},
+        "decrypt": {"ops_s": _ops_s(lambda t: decrypt_token(t, key), tokens, repeat)},
+    }
+
+
+def main(argv=None) -> int:
+    parser, run = build_parser("Cipher backend token size and throughput", "bench_ciphers.json")
+    run.add_argument("--values", type=int, default=5_000, help="Values per measurement")
+    args = parser.parse_args(argv)
+
+    if args.action == "compare":
+        return compare_files(args.baseline, args.current, args.threshold, args.min_delta)
+
+    from cryptography.fernet import Fernet
+    from dev_cli.utils.ciphers import CIPHERS
+
+    key = Fernet.generate_key().decode()
+    results = {
+        cipher: {f"{size}B": bench_cipher(cipher, key, size, args.values, args.repeat) for size in SIZES}
+        for cipher in CIPHERS
+    }
+    path = write_results(args.output, "ciphers", results)
+    print(f"✅ Results written to {path}")
+    print(f"  {'cipher':<10}{'size':>7}{'token':>8}{'encrypt/s':>12}{'decrypt/s':>12}")
+    for cipher, by_size in results.items():
+        for size, data in by_size.items():
+            print(f"  {cipher:<10}{size:>7}{data['token_bytes']:>8}"
+                  f"{data['encrypt']['ops_s']:>12,}{data['decrypt']['ops_s']:>12,}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,255 @@
+# benchmarks/cli.py
+"""
+CLI import-time and command-latency benchmarks.
+
+    python -m benchmarks.cli run -o cli.json
+    python -m benchmarks.cli compare baseline.json cli.json --threshold 0.2
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from benchmarks.common import measure, write_results, compare_files, build_parser
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ENTRY_POINTS = ["i", "e", "b", "d", "g", "r", "zackry", "--help"]
+
+# Runs one entry point in a fresh interpreter. Interactive commands are
+# resolved (module + dependencies imported) but not started, so the timing
+# is the start-up cost every invocation pays before the first prompt.
+DRIVER = """
+import io, json, sys
+from contextlib import redirect_stdout
+from dev_cli import main as cli
+name = sys.argv[1]
+with redirect_stdout(io.StringIO()):
+    if name in cli.COMMANDS:
+        cli.load_command(name)
+    else:
+        sys.argv = ["zackry", name]
+        try:
+            cli.main()
+        except SystemExit:
+            pass
+loaded = sorted(m for m in sys.modules if m.startswith("dev_cli.commands."))
+print("__BENCH__" + json.dumps(loaded))
+"""
+
+
+# ----------------------------
+# -X importtime parsing
+# ----------------------------
+def parse_importtime(stderr: str, top: int = 15) -> dict:
+    """Return the `top` modules by cumulative import time (µs)"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = (p.strip() for p in line.split(":", 1)[1].split("|"))
+        modules[name.strip()] = int(cumulative_us)
+    ranked = sorted(modules.items(), key=lambda kv: kv[1], reverse=True)
+    return dict(ranked[:top])
+
+
+def run_entry_point(name: str, pycache: str) -> tuple[float, str, list[str]]:
+    env = dict(os.environ, PYTHONPATH=str(ROOT), PYTHONPYCACHEPREFIX=pycache)
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", DRIVER, name],
+        capture_output=True, text=True, env=env, cwd=tempfile.gettempdir(),
+    )
+    elapsed = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        raise RuntimeError(f"Entry point {name!r} failed:\n{proc.stderr[-2000:]}")
+    marker = next(l for l in proc.stdout.splitlines() if l.startswith("__BENCH__"))
+    return elapsed, proc.stderr, json.loads(marker[len("__BENCH__"):])
+
+
+def bench_entry_points(repeat: int) -> dict:
+    """
+    cold: the first process start with an empty bytecode cache (its own
+    PYTHONPYCACHEPREFIX), so every module is compiled. warm: the following
+    `repeat` process starts, reusing those .pyc files and the OS file cache.
+    """
+    results = {}
+    for name in ENTRY_POINTS:
+        with tempfile.TemporaryDirectory() as pycache:
+            cold, _, _ = run_entry_point(name, pycache)
+            samples, stderr, loaded = [], "", []
+            for _ in range(repeat):
+                elapsed, stderr, loaded = run_entry_point(name, pycache)
+                samples.append(elapsed)
+        samples.sort()
+
+        results[name] = {
+            "cold": {"median_ms": round(cold, 3), "runs": 1},
+            "warm": {"median_ms": round(samples[len(samples) // 2], 3), "min_ms": round(samples[0], 3),
+                     "runs": repeat},
+            "command_modules": loaded,
+            "importtime_us": parse_importtime(stderr),
+        }
+    return results
+
+
+# ----------------------------
+# Non-interactive cores
+# ----------------------------
+class _Answer:
+    def __init__(self, value):
+        self.value = value
+
+    def ask(self):
+        return self.value
+
+
+@contextmanager
+def stub_questionary(**scripted):
+    """
+    Replace questionary prompts: each prompt returns the next scripted value
+    for its kind (text/select/confirm/...), falling back to its default or
+    first choice. Lets interactive commands run unattended.
+    """
+    import questionary
+
+    queues = {kind: list(values) for kind, values in scripted.items()}
+    originals = {}
+
+    def make(kind):
+        def prompt(message="", choices=None, default=None, **kwargs):
+            if queues.get(kind):
+                return _Answer(queues[kind].pop(0))
+            if default is not None:
+                return _Answer(default)
+            if choices:
+                return _Answer(choices[0] if kind == "select" else [choices[0]])
+            return _Answer(True if kind == "confirm" else "")
+        return prompt
+
+    for kind in ("text", "select", "confirm", "password", "checkbox"):
+        originals[kind] = getattr(questionary, kind)
+        setattr(questionary, kind, make(kind))
+    try:
+        yield
+    finally:
+        for kind, func in originals.items():
+            setattr(questionary, kind, func)
+
+
+@contextmanager
+def quiet_commands():
+    """Silence rich consoles and loguru output from the command modules"""
+    from loguru import logger
+    from dev_cli.commands import encrypt, init, api_generator, request
+
+    consoles = [encrypt.console, init.console, api_generator.console, request.console]
+    for c in consoles:
+        c.quiet = True
+    logger.disable("dev_cli")
+    try:
+        yield
+    finally:
+        for c in consoles:
+            c.quiet = False
+        logger.enable("dev_cli")
+
+
+@contextmanager
+def chdir(path: Path):
+    previous = Path.cwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def bench_cores(repeat: int, env_lines: int = 200, excel_rows: int = 1000) -> dict:
+    from cryptography.fernet import Fernet
+    from dev_cli.commands import encrypt, init, api_generator, request
+
+    results = {}
+    key = Fernet.generate_key().decode()
+    env_text = f"KEY={key}\n" + "".join(f"VAR_{i}=value_{i}\n" for i in range(env_lines))
+    env_rows = {f"VAR_{i}": f"value_{i}" for i in range(excel_rows)}
+
+    with tempfile.TemporaryDirectory() as tmp, quiet_commands():
+        tmp = Path(tmp)
+        counter = iter(range(10**9))
+
+        def fresh_dir():
+            path = tmp / f"run_{next(counter)}"
+            path.mkdir()
+            return (path,)
+
+        def in_dir(func):
+            def run(path):
+                with chdir(path):
+                    func()
+            return run
+
+        def with_env(path):
+            (path / ".env").write_text(env_text)
+            return (path,)
+
+        results["generate_key"] = measure(in_dir(encrypt.generate_key), repeat, setup=fresh_dir)
+
+        with stub_questionary():
+            results["encrypt_entire_env"] = measure(
+                in_dir(encrypt.encrypt_entire_env), repeat, setup=lambda: with_env(*fresh_dir())
+            )
+            results["encrypt_entire_env"]["lines"] = env_lines
+
+        results["save_env_to_excel"] = measure(
+            lambda path: request.save_env_to_excel(path / "env.xlsx", env_rows), repeat, setup=fresh_dir
+        )
+        results["save_env_to_excel"]["rows"] = excel_rows
+
+        with stub_questionary():
+            results["init_project"] = measure(in_dir(init.init_project), repeat, setup=fresh_dir)
+
+        api_names = [f"api_{i}" for i in range(repeat)]
+        with stub_questionary(text=[n for name in api_names for n in (name, name)]):
+            results["generate_api"] = measure(in_dir(api_generator.generate_api), repeat, setup=fresh_dir)
+
+    return results
+
+
+# ----------------------------
+# Entry point
+# ----------------------------
+def main(argv=None) -> int:
+    parser, run = build_parser("Zackry CLI start-up and command benchmarks", "bench_cli.json")
+    run.add_argument("--skip-cores", action="store_true", help="Only measure entry points")
+
+    args = parser.parse_args(argv)
+
+    if args.action == "compare":
+        return compare_files(args.baseline, args.current, args.threshold, args.min_delta)
+
+    results = {"entry_points": bench_entry_points(args.repeat)}
+    if not args.skip_cores:
+        results["cores"] = bench_cores(args.repeat)
+
+    leaked = results["entry_points"]["--help"]["command_modules"]
+    path = write_results(args.output, "cli", results)
+    print(f"✅ Results written to {path}")
+    for name, data in results["entry_points"].items():
+        print(f"  • {name:<8} cold {data['cold']['median_ms']:>8.1f} ms   warm {data['warm']['median_ms']:>8.1f} ms")
+    for name, data in results.get("cores", {}).items():
+        print(f"  • {name:<20} {data['median_ms']:>8.1f} ms")
+
+    if leaked:
+        print(f"❌ --help imported command modules: {', '.join(leaked)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+# benchmarks/common.py
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# ----------------------------
+# Timing
+# ----------------------------
+def measure(func, repeat: int = 5, setup=None) -> dict:
+    """Run func `repeat` times and return timing stats in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        args = setup() if setup else ()
+        start = time.perf_counter()
+        func(*args)
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "max_ms": round(max(samples), 3),
+        "runs": repeat,
+    }
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process (None where unsupported)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return round(rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 2)
+
+
+# ----------------------------
+# Results I/O
+# ----------------------------
+def write_results(path: str | Path, suite: str, results: dict) -> Path:
+    path = Path(path)
+    payload = {
+        "suite": suite,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    path.write_text(json.dumps(payload, indent=2))
+    return path
+
+
+def load_results(path: str | Path) -> dict:
+    return json.loads(Path(path).read_text())["results"]
+
+
+# ----------------------------
+# Regression comparison
+# ----------------------------
+# Metric suffix -> True when lower is better
+METRICS = {
+    "median_ms": True,
+    "ops_s": False,
+    "mb_s": False,
+    "rss_mb": True,
+    "alloc_mb": True,
+    "bytes": True,
+}
+
+
+def _flatten(data: dict, prefix: str = "") -> dict:
+    flat = {}
+    for key, value in data.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(_flatten(value, name))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.2, min_delta: float = 5.0) -> list[dict]:
+    """
+    Return metrics that regressed by more than `threshold` (relative).
+    `min_delta` ignores tiny absolute changes (ms for timings) that are just noise.
+    """
+    regressions = []
+    base, cur = _flatten(baseline), _flatten(current)
+    for name, old in base.items():
+        suffix = next((s for s in METRICS if name.endswith(s)), None)
+        if suffix is None or name not in cur or not old:
+            continue
+        new = cur[name]
+        lower_is_better = METRICS[suffix]
+        change = (new - old) / old if lower_is_better else (old - new) / old
+        if suffix == "median_ms" and abs(new - old) < min_delta:
+            continue
+        if change > threshold:
+            regressions.append({"metric": name, "baseline": old, "current": new, "change": round(change, 3)})
+    return regressions
+
+
+def compare_files(baseline_path: str, current_path: str, threshold: float, min_delta: float) -> int:
+    """Print a comparison report; return a process exit code (1 on regression)"""
+    regressions = compare(load_results(baseline_path), load_results(current_path), threshold, min_delta)
+    if not regressions:
+        print(f"✅ No regressions above {threshold:.0%}")
+        return 0
+    print(f"❌ {len(regressions)} regression(s) above {threshold:.0%}:")
+    for r in regressions:
+        print(f"  • {r['metric']}: {r['baseline']} → {r['current']} (+{r['change']:.0%})")
+    return 1
+
+
+# ----------------------------
+# Shared command line
+# ----------------------------
+def build_parser(description: str, default_output: str, repeat: int = 5):
+    """
+    `run` / `compare` parser shared by every suite.
+    Returns (parser, run_parser) so suites can add their own run options.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    sub = parser.add_subparsers(dest="action", required=True)
+
+    run = sub.add_parser("run", help="Run the benchmarks and write JSON results")
+    run.add_argument("-o", "--output", default=default_output)
+    run.add_argument("-n", "--repeat", type=int, default=repeat)
+
+    cmp = sub.add_parser("compare", help="Fail when current results regress against a baseline")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--threshold", type=float, default=0.2, help="Relative regression allowed (0.2 = 20%%)")
+    cmp.add_argument("--min-delta", type=float, default=5.0, help="Ignore timing changes below this many ms")
+    return parser, run
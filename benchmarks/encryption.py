@@ -0,0 +1,158 @@
+# benchmarks/encryption.py
+"""
+Encryption throughput: single values and whole .env files.
+
+    python -m benchmarks.encryption run -o encryption.json
+    python -m benchmarks.encryption run --max-lines 10000 --cipher aesgcm
+    python -m benchmarks.encryption compare baseline.json encryption.json
+
+* encrypt_data / decrypt_data for values from 16 B to 64 KiB
+* encrypt_entire_env / decrypt_entire_env (unattended) for .env files of
+  10 to 100k lines, decrypt at several ciphertext ratios
+* ops/s, MB/s, Python allocation peak per case and process peak RSS
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.cli import chdir, quiet_commands, stub_questionary
+from benchmarks.common import build_parser, compare_files, measure, peak_rss_mb, write_results
+
+VALUE_SIZES = (16, 256, 4096, 65536)
+ENV_LINES = (10, 1_000, 10_000, 100_000)
+CIPHERTEXT_RATIOS = (0.0, 0.5, 1.0)
+VALUE_BUDGET = 8 * 1024 * 1024  # bytes per value-size measurement
+
+
+def _traced_peak_mb(func, *args) -> float:
+    """Peak Python allocation of one (untimed) call"""
+    tracemalloc.start()
+    try:
+        func(*args)
+        return round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 2)
+    finally:
+        tracemalloc.stop()
+
+
+def _throughput(stats: dict, ops: int, size: int) -> dict:
+    seconds = stats["min_ms"] / 1000 or 1e-9
+    return {**stats, "ops_s": round(ops / seconds), "mb_s": round(size / (1024 * 1024) / seconds, 2)}
+
+
+# ----------------------------
+# Single values
+# ----------------------------
+def bench_values(key: str, cipher: str, repeat: int) -> dict:
+    from dev_cli.utils.encryption import decrypt_data, encrypt_data
+
+    results = {}
+    for size in VALUE_SIZES:
+        count = max(50, min(5_000, VALUE_BUDGET // size))
+        values = [os.urandom(size // 2 + 1).hex()[:size] for _ in range(count)]
+        tokens = [encrypt_data(v, key, cipher) for v in values]
+
+        def encrypt_all():
+            for v in values:
+                encrypt_data(v, key, cipher)
+
+        def decrypt_all():
+            for t in tokens:
+                decrypt_data(t, key)
+
+        results[f"{size}B"] = {
+            "values": count,
+            "encrypt_data": _throughput(measure(encrypt_all, repeat), count, count * size),
+            "decrypt_data": _throughput(measure(decrypt_all, repeat), count, count * size),
+        }
+    return results
+
+
+# ----------------------------
+# Whole .env files
+# ----------------------------
+def env_text(key: str, cipher: str, lines: int, ratio: float) -> str:
+    """`lines` variables; `ratio` of them (spread evenly) already encrypted"""
+    from dev_cli.utils.encryption import encrypt_many
+
+    values = {f"VAR_{i}": f"value_{i:06d}_{'x' * 16}" for i in range(lines)}
+    encrypted = {k: v for i, (k, v) in enumerate(values.items()) if (i * 100) // lines < ratio * 100}
+    values.update(encrypt_many(encrypted, key, cipher))
+    header = f"KEY={key}\n" + (f"KEY_CIPHER={cipher}\n" if cipher != "fernet" else "")
+    return header + "".join(f"{k}={v}\n" for k, v in values.items())
+
+
+def bench_env_files(key: str, cipher: str, repeat: int, max_lines: int) -> dict:
+    from dev_cli.commands import encrypt
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp, quiet_commands(), stub_questionary():
+        tmp = Path(tmp)
+
+        def run_in(text: str, func):
+            (tmp / ".env").write_text(text)
+            with chdir(tmp):
+                func()
+
+        for lines in (n for n in ENV_LINES if n <= max_lines):
+            case = {}
+            plain = env_text(key, cipher, lines, 0.0)
+            setup = lambda text=plain: (text,)
+            stats = measure(lambda text: run_in(text, encrypt.encrypt_entire_env), repeat, setup=setup)
+            case["encrypt_entire_env"] = {
+                **_throughput(stats, lines, len(plain)),
+                "alloc_mb": _traced_peak_mb(run_in, plain, encrypt.encrypt_entire_env),
+            }
+
+            for ratio in CIPHERTEXT_RATIOS:
+                text = env_text(key, cipher, lines, ratio)
+                setup = lambda text=text: (text,)
+                stats = measure(lambda text: run_in(text, encrypt.decrypt_entire_env), repeat, setup=setup)
+                case[f"decrypt_entire_env_{int(ratio * 100)}pct"] = {
+                    **_throughput(stats, lines, len(text)),
+                    "alloc_mb": _traced_peak_mb(run_in, text, encrypt.decrypt_entire_env),
+                }
+            results[f"{lines}_lines"] = case
+    return results
+
+
+# ----------------------------
+# Entry point
+# ----------------------------
+def main(argv=None) -> int:
+    parser, run = build_parser("Encryption throughput (values and .env files)", "bench_encryption.json", repeat=3)
+    run.add_argument("--cipher", default="fernet", help="fernet, aesgcm or chacha20")
+    run.add_argument("--max-lines", type=int, default=max(ENV_LINES), help="Largest .env file to measure")
+    args = parser.parse_args(argv)
+
+    if args.action == "compare":
+        return compare_files(args.baseline, args.current, args.threshold, args.min_delta)
+
+    from cryptography.fernet import Fernet
+
+    key = Fernet.generate_key().decode()
+    start = time.perf_counter()
+    results = {
+        "cipher": args.cipher,
+        "values": bench_values(key, args.cipher, args.repeat),
+        "env_files": bench_env_files(key, args.cipher, args.repeat, args.max_lines),
+    }
+    results["rss_mb"] = peak_rss_mb()
+    path = write_results(args.output, "encryption", results)
+
+    print(f"✅ Results written to {path} ({time.perf_counter() - start:.1f}s, peak RSS {results['rss_mb']} MB)")
+    for size, data in results["values"].items():
+        print(f"  • {size:>7} encrypt {data['encrypt_data']['ops_s']:>9,}/s {data['encrypt_data']['mb_s']:>8.2f} MB/s"
+              f"   decrypt {data['decrypt_data']['ops_s']:>9,}/s {data['decrypt_data']['mb_s']:>8.2f} MB/s")
+    for lines, case in results["env_files"].items():
+        for name, data in case.items():
+            print(f"  • {lines:>13} {name:<26} {data['median_ms']:>10.1f} ms "
+                  f"{data['ops_s']:>9,} lines/s {data['alloc_mb']:>8.2f} MB alloc")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+# benchmarks/excel.py
+"""
+Request export (Excel) time, memory and file size for large configs.
+
+    python -m benchmarks.excel run -o excel.json             # 100k rows
+    python -m benchmarks.excel compare baseline.json excel.json
+"""
+
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.common import build_parser, compare_files, measure, peak_rss_mb, write_results
+
+
+def _rows(count: int) -> dict:
+    return {f"CONFIG_KEY_{i:06d}": f"value-{i}-{'x' * 24}" for i in range(count)}
+
+
+def _in_memory_reference(path: Path, env_data: dict, letter: str):
+    """The previous export: a full in-memory Workbook per sheet"""
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["Name", "Value"])
+    for k, v in env_data.items():
+        ws.append([k, v])
+    ws = wb.create_sheet("Request Letter")
+    for line in letter.splitlines():
+        ws.append([line])
+    wb.save(path)
+
+
+def _traced(func, *args) -> float:
+    tracemalloc.start()
+    try:
+        func(*args)
+        return round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 2)
+    finally:
+        tracemalloc.stop()
+
+
+def bench_export(rows: int, repeat: int, reference: bool) -> dict:
+    from dev_cli.commands.request import export_request, generate_request_letter
+
+    env_data = _rows(rows)
+    letter = generate_request_letter("Update Config Map", "PROD", "bench_job", "/srv/bench")
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "export.xlsx"
+        cases = {"streaming": export_request}
+        if reference:
+            cases["in_memory_reference"] = _in_memory_reference
+
+        for name, func in cases.items():
+            stats = measure(lambda: func(path, env_data, letter), repeat)
+            seconds = stats["min_ms"] / 1000 or 1e-9
+            results[name] = {
+                **stats,
+                "rows": rows,
+                "ops_s": round(rows / seconds),
+                "alloc_mb": _traced(func, path, env_data, letter),
+                "file_bytes": path.stat().st_size,
+            }
+    return results
+
+
+def main(argv=None) -> int:
+    parser, run = build_parser("Request Excel export for large configs", "bench_excel.json", repeat=3)
+    run.add_argument("--rows", type=int, default=100_000, help="Environment variables to export")
+    run.add_argument("--no-reference", action="store_true", help="Skip the in-memory Workbook reference")
+    args = parser.parse_args(argv)
+
+    if args.action == "compare":
+        return compare_files(args.baseline, args.current, args.threshold, args.min_delta)
+
+    results = {"export": bench_export(args.rows, args.repeat, not args.no_reference)}
+    results["rss_mb"] = peak_rss_mb()
+    path = write_results(args.output, "excel", results)
+    print(f"✅ Results written to {path}")
+    for name, data in results["export"].items():
+        print(f"  • {name:<20} {data['median_ms']:>9.1f} ms {data['ops_s']:>9,} rows/s "
+              f"{data['alloc_mb']:>8.1f} MB alloc {data['file_bytes'] / 1024:>8.0f} KiB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
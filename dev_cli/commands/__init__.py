@@ -1,4 +1,2 @@
-from .init import init_project
-from .encrypt import encrypt_menu
-
-import typer 
+# Command modules are loaded lazily by dev_cli.main (see COMMANDS);
+# do not import them here or every CLI invocation pays for their dependencies.
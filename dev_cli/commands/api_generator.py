@@ -5,10 +5,58 @@ from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
-from cnb_cli.utils.helper import create_file, modify_file
+from dev_cli.templates import engine, files  # noqa: F401 (registers templates)
+from dev_cli.utils.helper import create_file, modify_file
+from dev_cli.utils.lock import tracked
+from dev_cli.utils.vfs import staged
 
 console = Console()
 
+DB_REQUIREMENTS = "sqlmodel~=0.0.22, sqlalchemy~=2.0.36, asyncpg, psycopg2-binary\n"
+
+
+def create_api(api_name: str, crud: bool = True, folder_name: str | None = None, root: str | Path = ".") -> list[tuple[str, str]]:
+    """Create the API component files under `root`; return (kind, path) pairs"""
+    base_path = folder_name or api_name
+
+    # (label, path, stub kind)
+    if crud:
+        components = [
+            ("Model", f"app/models/{base_path}/models.py", "models"),
+            ("Repository", f"app/repositories/{base_path}/repos.py", "repository"),
+            ("Service", f"app/services/{base_path}/services.py", "service"),
+            ("Controller", f"app/controllers/v1/{base_path}/api.py", "controller"),
+            ("Schema", f"app/schemas/{base_path}/create/schema.py", "schema"),
+            ("Schema", f"app/schemas/{base_path}/update/schema.py", "schema"),
+            ("Schema", f"app/schemas/{base_path}/response/list.py", "schema"),
+            ("Schema", f"app/schemas/{base_path}/response/one.py", "schema"),
+            ("Schema", f"app/schemas/{base_path}/response/delete.py", "schema"),
+            ("Schema", f"app/schemas/{base_path}/response/remote.py", "schema"),
+        ]
+    else:  # Simple API: Services & Controllers only
+        components = [
+            ("Service", f"app/services/{base_path}/services.py", "service"),
+            ("Controller", f"app/controllers/v1/{base_path}/api.py", "controller"),
+        ]
+
+    # One compiled template, rendered for every component
+    contents = engine.render_many(
+        "component_stub", [{"kind": kind, "api_name": api_name} for _, _, kind in components]
+    )
+    for (_, path, _), content in zip(components, contents):
+        create_file(str(Path(root) / path), content)
+
+    if crud:
+        # Register default files if not exist
+        create_file(str(Path(root) / "app/controllers/register_api.py"), "# Register all APIs")
+        create_file(str(Path(root) / "app/models/register_models.py"), "# Register all models")
+
+        # Update requirements.txt
+        modify_file(str(Path(root) / "requirements.txt"), DB_REQUIREMENTS)
+
+    return [(label, path) for label, path, _ in components]
+
+
 def generate_api():
     console.print(Panel.fit("⚡ [bold cyan]Quick API Creation[/bold cyan]", border_style="green"))
 
@@ -36,62 +84,11 @@ def generate_api():
     console.print(f"\n🚀 Creating {api_type.split('-')[0].strip()} API: [bold]{api_name}[/bold]")
     console.print("Creating API components...\n")
 
-    base_path = folder_name
-
-    created_files = []
-
-    if "CRUD" in api_type:
-        # Models
-        model_file = f"app/models/{base_path}/models.py"
-        create_file(model_file, f"# Auto-generated models for {api_name}")
-        created_files.append(("Model", model_file))
-
-        # Repositories
-        repo_file = f"app/repositories/{base_path}/repos.py"
-        create_file(repo_file, f"# Auto-generated repository for {api_name}")
-        created_files.append(("Repository", repo_file))
-
-        # Services
-        service_file = f"app/services/{base_path}/services.py"
-        create_file(service_file, f"# Auto-generated service for {api_name}")
-        created_files.append(("Service", service_file))
-
-        # Controllers
-        controller_file = f"app/controllers/v1/{base_path}/api.py"
-        create_file(controller_file, f"# Auto-generated controller for {api_name}")
-        created_files.append(("Controller", controller_file))
-
-        # Schemas
-        schema_paths = [
-            f"app/schemas/{base_path}/create/schema.py",
-            f"app/schemas/{base_path}/update/schema.py",
-            f"app/schemas/{base_path}/response/list.py",
-            f"app/schemas/{base_path}/response/one.py",
-            f"app/schemas/{base_path}/response/delete.py",
-            f"app/schemas/{base_path}/response/remote.py",
-        ]
-        for path in schema_paths:
-            create_file(path, f"# Auto-generated schema for {api_name}")
-            created_files.append(("Schema", path))
-
-        # Register default files if not exist
-        create_file("app/controllers/register_api.py", "# Register all APIs")
-        create_file("app/models/register_models.py", "# Register all models")
-
-        # Update requirements.txt
-        deps = "sqlmodel~=0.0.22, sqlalchemy~=2.0.36, asyncpg, psycopg2-binary\n"
-        modify_file("requirements.txt", deps)
-        console.print(f"\n[green]Updated requirements.txt with database dependencies: {deps.strip()}[/green]")
-
-    else:  # Simple API
-        # Services & Controllers only
-        service_file = f"app/services/{base_path}/services.py"
-        create_file(service_file, f"# Auto-generated service for {api_name}")
-        created_files.append(("Service", service_file))
-
-        controller_file = f"app/controllers/v1/{base_path}/api.py"
-        create_file(controller_file, f"# Auto-generated controller for {api_name}")
-        created_files.append(("Controller", controller_file))
+    crud = "CRUD" in api_type
+    with staged(), tracked("."):
+        created_files = create_api(api_name, crud=crud, folder_name=folder_name)
+    if crud:
+        console.print(f"\n[green]Updated requirements.txt with database dependencies: {DB_REQUIREMENTS.strip()}[/green]")
 
     # Summary
     console.print(Panel.fit(
@@ -0,0 +1,198 @@
+# dev_cli/commands/apply.py
+"""
+Scaffold many services from one manifest, without prompts.
+
+    services:
+      - name: orders
+        path: services/orders        # default: the service name
+        db: true
+        apis:
+          - {name: order, type: crud}  # crud | simple, optional folder
+        consumers:
+          - {name: order_created, connection: Kafka, topic: orders}
+        utils: [Redis]
+        docker:
+          databases: [Postgres]
+          services: [Redis]
+"""
+
+import contextvars
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from dev_cli.commands.init import create_project
+from dev_cli.commands.api_generator import create_api
+from dev_cli.commands.consumer_generator import create_consumer
+from dev_cli.commands.utils_generator import create_utils, UTILS_TEMPLATES
+from dev_cli.commands.docker_generator import create_docker_compose
+from dev_cli.utils.lock import tracked, DRIFT
+from dev_cli.utils.vfs import staged
+
+console = Console()
+
+API_TYPES = {"crud": True, "simple": False}
+CONNECTIONS = ["RabbitMQ", "Kafka"]
+
+
+class ManifestError(ValueError):
+    """Raised when a manifest is malformed"""
+
+
+# ----------------------------
+# Load & validate manifest
+# ----------------------------
+def load_manifest(path: str | Path) -> dict:
+    path = Path(path)
+    if not path.exists():
+        raise ManifestError(f"Manifest not found: {path}")
+
+    text = path.read_text()
+    if path.suffix == ".json":
+        try:
+            data = json.loads(text)
+        except ValueError as e:
+            raise ManifestError(f"{path}: invalid JSON ({e})") from None
+    else:
+        import yaml
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            mark = getattr(e, "problem_mark", None)
+            where = f"{path}:{mark.line + 1}" if mark else str(path)
+            raise ManifestError(f"{where}: invalid YAML ({getattr(e, 'problem', None) or e})") from None
+
+    if not isinstance(data, dict) or not isinstance(data.get("services"), list):
+        raise ManifestError("Manifest must contain a 'services' list")
+
+    names, paths = set(), set()
+    for i, service in enumerate(data["services"]):
+        where = f"services[{i}]"
+        if not isinstance(service, dict) or not service.get("name"):
+            raise ManifestError(f"{where}: every service needs a 'name'")
+        if service["name"] in names:
+            raise ManifestError(f"{where}: duplicate service name '{service['name']}'")
+        names.add(service["name"])
+        service_path = os.path.normpath(str(service.get("path", service["name"])))
+        if service_path in paths:
+            raise ManifestError(f"{where}: another service already uses path '{service_path}'")
+        paths.add(service_path)
+
+        for key in ("apis", "consumers", "utils"):
+            if not isinstance(service.get(key, []), list):
+                raise ManifestError(f"{where}: '{key}' must be a list")
+        for j, api in enumerate(service.get("apis", [])):
+            if not isinstance(api, dict):
+                raise ManifestError(f"{where}.apis[{j}]: expected a mapping with a 'name'")
+            if not str(api.get("name", "")).isidentifier():
+                raise ManifestError(f"{where}: API name must be a valid snake_case identifier")
+            if api.get("type", "crud") not in API_TYPES:
+                raise ManifestError(f"{where}: API type must be one of {', '.join(API_TYPES)}")
+        for j, consumer in enumerate(service.get("consumers", [])):
+            if not isinstance(consumer, dict):
+                raise ManifestError(f"{where}.consumers[{j}]: expected a mapping")
+            if consumer.get("connection") not in CONNECTIONS:
+                raise ManifestError(f"{where}: consumer connection must be one of {', '.join(CONNECTIONS)}")
+            if not consumer.get("name") or not consumer.get("topic"):
+                raise ManifestError(f"{where}: consumers need a 'name' and a 'topic'")
+        for util in service.get("utils", []):
+            if util not in UTILS_TEMPLATES:
+                raise ManifestError(f"{where}: unknown util '{util}'")
+    return data
+
+
+# ----------------------------
+# Generate one service
+# ----------------------------
+def apply_service(service: dict, base: Path) -> dict:
+    """Generate every component of one service; return a summary"""
+    start = time.perf_counter()
+    root = base / service.get("path", service["name"])
+    with tracked(root) as lockfile:
+        create_project(root, need_db=service.get("db", True))
+
+        for util in service.get("utils", []):
+            create_utils(util, root)
+
+        for api in service.get("apis", []):
+            crud = API_TYPES[api.get("type", "crud")]
+            create_api(api["name"], crud, api.get("folder"), root)
+
+        for consumer in service.get("consumers", []):
+            create_consumer(consumer["connection"], consumer["name"], consumer["topic"], root)
+
+        docker = service.get("docker")
+        if docker is not None:
+            create_docker_compose(docker.get("databases", []), docker.get("services", []), root)
+
+    return {
+        "name": service["name"],
+        "path": str(root),
+        "lock": lockfile.summary(),
+        "drift": lockfile.report[DRIFT],
+        "seconds": time.perf_counter() - start,
+    }
+
+
+# ----------------------------
+# Apply manifest
+# ----------------------------
+def apply_manifest(manifest_path: str | Path, workers: int | None = None, dry_run: bool = False) -> bool:
+    """
+    Generate every service in the manifest into one staged filesystem,
+    services concurrently on a thread pool (one service per task, each in
+    its own lockfile context), then write all files in a single parallel,
+    all-or-nothing flush. Returns True on success.
+    """
+    try:
+        manifest = load_manifest(manifest_path)
+    except (ManifestError, ValueError) as e:
+        console.print(f"[red]❌ Invalid manifest: {e}[/red]")
+        return False
+
+    services = manifest["services"]
+    base = Path(manifest_path).resolve().parent
+    workers = workers or min(32, (os.cpu_count() or 1) * 4)
+
+    console.print(f"\n📜 [bold cyan]Applying manifest[/bold cyan] {manifest_path} ({len(services)} services)\n")
+
+    start = time.perf_counter()
+    try:
+        with staged(dry_run=dry_run, workers=workers) as fs:
+            # Pool threads do not inherit context variables: each service
+            # runs in a copy of this context, which holds the staged FS
+            contexts = [contextvars.copy_context() for _ in services]
+            with ThreadPoolExecutor(max_workers=min(workers, len(services) or 1)) as pool:
+                summaries = list(pool.map(lambda ctx, service: ctx.run(apply_service, service, base),
+                                          contexts, services))
+            changes = len(fs.changes)
+            diff = fs.diff() if dry_run else ""
+    except Exception as e:
+        console.print(f"[red]❌ Apply failed, no files were written: {e}[/red]")
+        return False
+
+    table = Table(title="Generated services")
+    table.add_column("Service", style="cyan")
+    table.add_column("Path")
+    table.add_column("Files")
+    table.add_column("Time", justify="right")
+    for s in summaries:
+        table.add_row(s["name"], s["path"], s["lock"], f"{s['seconds'] * 1000:.0f} ms")
+    console.print(table)
+
+    for s in summaries:
+        for path in s["drift"]:
+            console.print(f"[yellow]⚠️ {s['name']}: {path} modified locally, not overwritten[/yellow]")
+
+    elapsed = time.perf_counter() - start
+    if dry_run:
+        console.print(diff, markup=False, highlight=False, soft_wrap=True)
+        console.print(f"\n🔍 Dry run: {changes} file(s) would be written, nothing changed on disk\n")
+    else:
+        console.print(f"\n✨ {len(summaries)} services generated, {changes} file(s) written in {elapsed:.2f}s\n")
+    return True
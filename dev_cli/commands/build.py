@@ -1,9 +1,285 @@
-# cnb_cli/commands/build.py
-import typer
+# dev_cli/commands/build.py
+"""
+Build every service image at once.
 
-app = typer.Typer(help="Docker Build Tools 🐳")
+    zackry b --all                       # every directory with a Dockerfile
+    zackry b --all -m services.yaml      # the services of an `apply` manifest
+    zackry b --all -w 8 --tag 1.4.0 --dry-run
 
-@app.command("b")
-def build():
-    """Build Docker images"""
-    typer.echo("Docker build tool placeholder")
+Images form a graph through their FROM lines (or `depends_on` in the
+manifest): a service whose base image is another service's image is
+built after it. Independent images build concurrently on a bounded pool,
+with each log line prefixed by its service. Unchanged build contexts are
+reused through the content-hash label (see docker.ensure_image).
+"""
+
+import os
+import re
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+from dev_cli.commands.apply import ManifestError, load_manifest
+from dev_cli.commands.docker import (
+    HASH_LABEL, build_image, cached_image, check_docker_installed, tag_image,
+)
+from dev_cli.utils.build_context import context_hash
+
+console = Console()
+
+SKIP_DIRS = {".git", ".venv", "venv", "node_modules", "__pycache__", ".mypy_cache", ".pytest_cache", "dist", "build"}
+MAX_DEPTH = 4
+DEFAULT_WORKERS = 4  # builds run in the daemon; the client only streams
+COLORS = ("cyan", "magenta", "green", "yellow", "blue", "bright_red", "bright_cyan", "bright_magenta")
+_FROM = re.compile(r"^\s*FROM\s+(?:--\S+\s+)*(\S+)(?:\s+AS\s+(\S+))?", re.IGNORECASE | re.MULTILINE)
+
+BUILT, CACHED, RETAGGED, FAILED, SKIPPED = "built", "cached", "retagged", "failed", "skipped"
+
+
+class BuildGraphError(ValueError):
+    """Raised for service graphs that cannot be built (e.g. cycles)"""
+
+
+# ----------------------------
+# Services
+# ----------------------------
+def _image_name(name: str) -> str:
+    return re.sub(r"[^a-z0-9._-]+", "-", name.lower()).strip("-._") or "app"
+
+
+def _normalise_ref(ref: str) -> str:
+    return ref if ":" in ref.rsplit("/", 1)[-1] or "@" in ref else f"{ref}:latest"
+
+
+def discover_services(root: Path, tag: str = "latest") -> list[dict]:
+    """
+    Every directory under `root` (depth <= MAX_DEPTH) that has a Dockerfile.
+    Images are named after the directory (`services/api` -> `api`), or after
+    the whole relative path when two directories share a name (`a-api`, `b-api`).
+    """
+    found = []
+    for directory, dirs, files in os.walk(root):
+        rel = Path(directory).relative_to(root)
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS and not d.startswith(".")
+                         and len(rel.parts) < MAX_DEPTH)
+        if "Dockerfile" in files:
+            found.append((Path(directory), rel))
+
+    leaves = Counter(_image_name(rel.name or root.resolve().name) for _, rel in found)
+    services = []
+    for directory, rel in found:
+        name = rel.as_posix() if rel.parts else root.resolve().name
+        image = _image_name(rel.name or root.resolve().name)
+        if leaves[image] > 1:
+            image = _image_name("-".join(rel.parts) or root.resolve().name)
+        services.append({"name": name, "path": directory, "dockerfile": "Dockerfile",
+                         "image": f"{image}:{tag}", "depends_on": []})
+    return services
+
+
+def manifest_services(manifest_path: Path, tag: str = "latest") -> list[dict]:
+    """Services of an `apply` manifest; optional `image`, `dockerfile`, `depends_on`, `build: false`"""
+    base = manifest_path.resolve().parent
+    services = []
+    for service in load_manifest(manifest_path)["services"]:
+        if service.get("build", True) is False:
+            continue
+        services.append({
+            "name": service["name"],
+            "path": base / service.get("path", service["name"]),
+            "dockerfile": service.get("dockerfile", "Dockerfile"),
+            "image": service.get("image") or f"{_image_name(service['name'])}:{tag}",
+            "depends_on": list(service.get("depends_on", [])),
+        })
+    return services
+
+
+def base_images(dockerfile: Path) -> list[str]:
+    """External images named in FROM lines (build stages excluded)"""
+    text = dockerfile.read_text(encoding="utf-8").replace("\\\n", " ")
+    stages, bases = set(), []
+    for ref, alias in _FROM.findall(text):
+        if ref.lower() not in stages:
+            bases.append(_normalise_ref(ref))
+        if alias:
+            stages.add(alias.lower())
+    return bases
+
+
+def build_graph(services: list[dict]) -> dict:
+    """{service name: set of service names it depends on}; raises on shared images, unknown deps and cycles"""
+    by_image = {}
+    for service in services:
+        image = _normalise_ref(service["image"])
+        if image in by_image:
+            raise BuildGraphError(f"{by_image[image]} and {service['name']} would both be tagged {image}")
+        by_image[image] = service["name"]
+    names = {s["name"] for s in services}
+    graph = {}
+    for service in services:
+        deps = set()
+        dockerfile = service["path"] / service["dockerfile"]
+        if dockerfile.is_file():
+            deps.update(by_image[ref] for ref in base_images(dockerfile) if ref in by_image)
+        for dep in service["depends_on"]:
+            if dep not in names:
+                raise BuildGraphError(f"{service['name']}: depends on unknown service '{dep}'")
+            deps.add(dep)
+        deps.discard(service["name"])
+        graph[service["name"]] = deps
+
+    # Kahn's algorithm, only to find cycles
+    remaining = {name: set(deps) for name, deps in graph.items()}
+    ready = [name for name, deps in remaining.items() if not deps]
+    while ready:
+        done = ready.pop()
+        for name, deps in remaining.items():
+            if done in deps:
+                deps.discard(done)
+                if not deps:
+                    ready.append(name)
+        remaining = {n: d for n, d in remaining.items() if d}
+    if remaining:
+        raise BuildGraphError(f"Dependency cycle between: {', '.join(sorted(remaining))}")
+    return graph
+
+
+# ----------------------------
+# Build one image
+# ----------------------------
+def build_service(service: dict, color: str, width: int) -> dict:
+    prefix = f"[{color}]{escape(service['name']).ljust(width)}[/{color}] │ "
+    start = time.perf_counter()
+
+    def log(line: str):
+        console.print(prefix + escape(line), highlight=False)
+
+    result = {"name": service["name"], "image": service["image"], "status": FAILED, "error": None}
+    try:
+        digest = context_hash(service["path"], service["dockerfile"])
+        action, match = cached_image(service["image"], digest)
+        if action == "current":
+            log("context unchanged, using existing image")
+            result["status"] = CACHED
+        elif action == "match":
+            log(f"context matches {match.split(':')[-1][:12]}, re-tagging")
+            result["status"] = RETAGGED if tag_image(match, service["image"]) else FAILED
+        else:
+            log(f"building {service['image']}")
+            ok = build_image(service["image"], service["path"], labels={HASH_LABEL: digest},
+                             dockerfile=service["dockerfile"], log=log)
+            result["status"] = BUILT if ok else FAILED
+    except Exception as e:
+        result["error"] = str(e)
+        log(f"✗ {e}")
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+# ----------------------------
+# Build everything
+# ----------------------------
+def build_all(root: str | Path = ".", manifest: str | Path | None = None, workers: int | None = None,
+              tag: str = "latest", dry_run: bool = False) -> bool:
+    try:
+        services = manifest_services(Path(manifest), tag) if manifest else discover_services(Path(root), tag)
+        graph = build_graph(services)
+    except (ManifestError, BuildGraphError, OSError) as e:
+        console.print(f"[red]❌ {e}[/red]")
+        return False
+    if not services:
+        console.print("[yellow]⚠️ No Dockerfile found[/yellow]")
+        return False
+
+    by_name = {s["name"]: s for s in services}
+    workers = max(1, min(workers or DEFAULT_WORKERS, len(services)))
+    console.print(f"\n🐳 [bold cyan]Building {len(services)} image(s)[/bold cyan] with {workers} worker(s)\n")
+    for service in services:
+        deps = ", ".join(sorted(graph[service["name"]])) or "-"
+        console.print(f"  • {service['name']} → {service['image']}  [dim](after: {deps})[/dim]")
+    if dry_run:
+        console.print("\n🔍 Dry run: nothing built\n")
+        return True
+    if not check_docker_installed():
+        console.print("[red]❌ Docker is not installed or not running[/red]")
+        return False
+    console.print()
+
+    width = max(len(name) for name in by_name)
+    colors = {name: COLORS[i % len(COLORS)] for i, name in enumerate(by_name)}
+    pending = {name: set(deps) for name, deps in graph.items()}
+    results = {}
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        running = {}
+
+        def schedule():
+            for name in [n for n, deps in pending.items() if not deps]:
+                del pending[name]
+                running[pool.submit(build_service, by_name[name], colors[name], width)] = name
+
+        schedule()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                result = future.result()
+                results[name] = result
+                if result["status"] == FAILED:
+                    for skipped in _dependents(name, pending):
+                        del pending[skipped]
+                        results[skipped] = {"name": skipped, "image": by_name[skipped]["image"],
+                                            "status": SKIPPED, "seconds": 0.0, "error": f"{name} failed"}
+                for deps in pending.values():
+                    deps.discard(name)
+            schedule()
+
+    return _summary([results[s["name"]] for s in services], time.perf_counter() - start)
+
+
+def build_command(all_images: bool = False, manifest: str | Path | None = None, workers: int | None = None,
+                  tag: str = "latest", dry_run: bool = False) -> bool | None:
+    """`zackry b`: the interactive Docker menu, or `--all` / `--manifest` builds"""
+    if not all_images and manifest is None:
+        from dev_cli.commands.docker import docker_menu
+        return docker_menu()
+    return build_all(manifest=manifest, workers=workers, tag=tag, dry_run=dry_run)
+
+
+def _dependents(name: str, pending: dict) -> list[str]:
+    """Pending services that (transitively) depend on `name`"""
+    found, frontier = [], {name}
+    while frontier:
+        frontier = {n for n, deps in pending.items() if deps & frontier and n not in found}
+        found.extend(frontier)
+    return found
+
+
+def _summary(results: list[dict], elapsed: float) -> bool:
+    styles = {BUILT: "green", CACHED: "cyan", RETAGGED: "cyan", FAILED: "red", SKIPPED: "yellow"}
+    table = Table(title="Build summary")
+    table.add_column("Service", style="cyan")
+    table.add_column("Image")
+    table.add_column("Result")
+    table.add_column("Time", justify="right")
+    for r in results:
+        status = f"[{styles[r['status']]}]{r['status']}[/{styles[r['status']]}]"
+        if r["error"] and r["status"] == SKIPPED:
+            status += f" [dim]({escape(r['error'])})[/dim]"
+        table.add_row(r["name"], r["image"], status, f"{r['seconds']:.1f}s")
+    console.print()
+    console.print(table)
+
+    counts = {status: sum(1 for r in results if r["status"] == status) for status in styles}
+    hits = counts[CACHED] + counts[RETAGGED]
+    serial = sum(r["seconds"] for r in results)
+    console.print(f"\n✨ {counts[BUILT]} built, {hits} from cache ({hits / len(results):.0%} hit rate), "
+                  f"{counts[FAILED]} failed, {counts[SKIPPED]} skipped in {elapsed:.1f}s "
+                  f"(sum of builds {serial:.1f}s)\n")
+    return not (counts[FAILED] or counts[SKIPPED])
@@ -0,0 +1,301 @@
+# dev_cli/commands/bulk_env.py
+"""
+Non-interactive bulk operations over many .env files.
+
+    zackry crypt encrypt 'services/*/.env*' --workers 8
+    zackry crypt decrypt 'services/**/.env' --dry-run
+    zackry rotate 'services/*/.env*'
+
+Each file is handled by a process-pool worker and written back atomically
+(temp file + rename). A file's own KEY (and KEY_PREVIOUS keyring) is used;
+files without one fall back to the keyring of --key-file.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from cryptography.fernet import Fernet, InvalidToken
+from rich.console import Console
+from rich.table import Table
+
+from dev_cli.utils.encryption import (
+    CIPHER_VAR, DEFAULT_CIPHER, KEY_VARS, KEYRING_VAR, decrypt_token, encrypt_data, is_encrypted, keyring,
+    rotate_many, split_keyring,
+)
+from dev_cli.utils.envfile import EnvFile
+
+console = Console()
+
+ACTIONS = ("encrypt", "decrypt")
+JOURNAL_NAME = ".zackry-rotate.json"
+
+
+# ----------------------------
+# Helpers
+# ----------------------------
+def expand_patterns(patterns: list[str]) -> list[Path]:
+    """Resolve glob patterns to a sorted, de-duplicated list of files"""
+    found = {}
+    for pattern in patterns:
+        for match in glob.glob(pattern, recursive=True):
+            path = Path(match)
+            if path.is_file():
+                found[path.resolve()] = path
+    return [found[k] for k in sorted(found)]
+
+
+def env_keyring(env: EnvFile) -> str:
+    return keyring(env.get("KEY", ""), env.get(KEYRING_VAR, ""))
+
+
+def key_id(key: str) -> str:
+    """Short fingerprint of a key, safe to write to disk"""
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+def _new_result(path: str) -> dict:
+    return {"path": path, "changed": 0, "skipped": 0, "failed": 0, "bytes": 0, "error": None}
+
+
+def _run(worker, jobs: list[tuple], workers: int, on_done=None) -> list[dict]:
+    """Run `worker(*job)` for every job, in-process for one worker, else on a process pool"""
+    results = []
+    if workers == 1:
+        for job in jobs:
+            results.append(worker(*job))
+            if on_done:
+                on_done(results[-1])
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for future in as_completed([pool.submit(worker, *job) for job in jobs]):
+            results.append(future.result())
+            if on_done:
+                on_done(results[-1])
+    return sorted(results, key=lambda r: r["path"])
+
+
+def _report(title: str, verb: str, results: list[dict], elapsed: float, dry_run: bool) -> bool:
+    # Summarised preview: one row per file, not one line per value
+    table = Table(title=title)
+    table.add_column("File", style="cyan")
+    table.add_column(verb.title(), justify="right")
+    table.add_column("Skipped", justify="right")
+    table.add_column("Status")
+    for r in results:
+        if r["error"]:
+            status = f"[red]{r['error']}[/red]"
+        elif r["failed"]:
+            status = f"[yellow]{r['failed']} not decryptable[/yellow]"
+        else:
+            status = "[green]ok[/green]"
+        table.add_row(r["path"], str(r["changed"]), str(r["skipped"]), status)
+    console.print(table)
+
+    elapsed = max(elapsed, 1e-9)
+    changed = sum(r["changed"] for r in results)
+    size_mb = sum(r["bytes"] for r in results) / (1024 * 1024)
+    failed = [r for r in results if r["error"]]
+    console.print(
+        f"\n✨ {changed} value(s) {verb} in {len(results) - len(failed)}/{len(results)} file(s) "
+        f"in {elapsed:.2f}s — {len(results) / elapsed:.1f} files/s, "
+        f"{changed / elapsed:.0f} values/s, {size_mb / elapsed:.2f} MB/s\n"
+    )
+    if dry_run:
+        console.print("[yellow]Dry run: no files were modified[/yellow]")
+    return not failed
+
+
+def _load_fallback(key_file: str) -> str | None:
+    if Path(key_file).is_file():
+        return env_keyring(EnvFile.load(key_file)) or None
+    return None
+
+
+# ----------------------------
+# Encrypt / decrypt
+# ----------------------------
+def process_file(path: str, action: str, fallback_key: str | None = None, dry_run: bool = False,
+                 cipher: str | None = None) -> dict:
+    """Encrypt or decrypt one .env file; runs in a worker process"""
+    result = _new_result(path)
+    try:
+        env = EnvFile.load(path)
+        result["bytes"] = Path(path).stat().st_size
+        key = env_keyring(env) or fallback_key
+        if not key:
+            result["error"] = "no KEY"
+            return result
+
+        cipher = cipher or env.get(CIPHER_VAR) or DEFAULT_CIPHER
+        for name, value in env.items():
+            if name in KEY_VARS or not value:
+                continue
+            if action == "encrypt":
+                if is_encrypted(value):
+                    result["skipped"] += 1
+                    continue
+                env.set(name, encrypt_data(value, key, cipher))
+            else:
+                if not is_encrypted(value):
+                    result["skipped"] += 1
+                    continue
+                try:
+                    env.set(name, decrypt_token(value, key))
+                except InvalidToken:
+                    result["failed"] += 1
+                    continue
+            result["changed"] += 1
+
+        if not dry_run:
+            env.save()
+    except Exception as e:
+        result["error"] = str(e)
+    return result
+
+
+def bulk_env(action: str, patterns: list[str], workers: int | None = None,
+             key_file: str = ".env", dry_run: bool = False, cipher: str | None = None) -> bool:
+    """Run `action` over every file matching `patterns`; return True if no file failed"""
+    if action not in ACTIONS:
+        console.print(f"[red]❌ Unknown action '{action}' (use {' or '.join(ACTIONS)})[/red]")
+        return False
+
+    files = expand_patterns(patterns)
+    if not files:
+        console.print("[yellow]⚠️ No files matched[/yellow]")
+        return False
+
+    fallback_key = _load_fallback(key_file)
+    workers = workers or min(len(files), os.cpu_count() or 1)
+    console.print(f"\n🔐 [bold cyan]Bulk {action}[/bold cyan]: {len(files)} file(s), {workers} worker(s)"
+                  f"{' [yellow](dry run)[/yellow]' if dry_run else ''}\n")
+
+    start = time.perf_counter()
+    results = _run(process_file, [(str(f), action, fallback_key, dry_run, cipher) for f in files], workers)
+    return _report(f"{action.title()} summary", f"{action}ed", results, time.perf_counter() - start, dry_run)
+
+
+# ----------------------------
+# Key rotation
+# ----------------------------
+def rotate_file(path: str, ring: str, dry_run: bool = False) -> dict:
+    """
+    Re-encrypt one file's values under the ring's primary key in a single batch.
+    A file that carries its own KEY gets KEY / KEY_PREVIOUS updated so the
+    service can still read values encrypted under older keys while it rolls out.
+    """
+    result = _new_result(path)
+    try:
+        env = EnvFile.load(path)
+        result["bytes"] = Path(path).stat().st_size
+        own = env_keyring(env)
+        full_ring = keyring(ring, own)
+
+        values = {k: v for k, v in env.items() if k not in KEY_VARS and v}
+        encrypted = {k: v for k, v in values.items() if is_encrypted(v)}
+        result["skipped"] = len(values) - len(encrypted)
+
+        rotated, failed = rotate_many(encrypted, full_ring)
+        for name, value in rotated.items():
+            if name not in failed:
+                env.set(name, value)
+        result["changed"] = len(encrypted) - len(failed)
+
+        if own:
+            primary, *previous = split_keyring(full_ring)
+            env.set("KEY", primary)
+            env.set(KEYRING_VAR, ",".join(previous))
+
+        if failed:
+            result["error"] = f"{len(failed)} value(s) not decryptable with the keyring"
+        elif not dry_run:
+            env.save()
+    except Exception as e:
+        result["error"] = str(e)
+    return result
+
+
+def _write_journal(path: Path, journal: dict) -> None:
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(journal, indent=2))
+    os.replace(tmp, path)
+
+
+def rotate_env(patterns: list[str], workers: int | None = None, key_file: str = ".env",
+               dry_run: bool = False) -> bool:
+    """
+    Rotate to a new KEY and re-encrypt every file matching `patterns`.
+
+    The old keys move to KEY_PREVIOUS in `key_file`, so nothing becomes
+    undecryptable. Progress is journaled next to `key_file`; re-running
+    after an interruption resumes with the same new key and skips files
+    already done.
+    """
+    key_path = Path(key_file)
+    if not key_path.is_file():
+        console.print(f"[red]❌ {key_file} not found! Generate a key first.[/red]")
+        return False
+    key_env = EnvFile.load(key_path)
+    if not key_env.get("KEY"):
+        console.print(f"[red]❌ KEY not found in {key_file}! Generate a key first.[/red]")
+        return False
+
+    files = expand_patterns(patterns)
+    if not files:
+        console.print("[yellow]⚠️ No files matched[/yellow]")
+        return False
+
+    journal_path = key_path.parent / JOURNAL_NAME
+    journal = None
+    if journal_path.exists():
+        try:
+            journal = json.loads(journal_path.read_text())
+        except ValueError:
+            journal = None
+
+    if journal and journal.get("key_id") == key_id(key_env["KEY"]):
+        # Interrupted run: the key file already holds the new key
+        ring = env_keyring(key_env)
+        done = set(journal.get("done", []))
+        console.print(f"[yellow]↻ Resuming rotation: {len(done)} file(s) already re-encrypted[/yellow]")
+    else:
+        new_key = Fernet.generate_key().decode()
+        ring = keyring(new_key, env_keyring(key_env))
+        done = set()
+        journal = {"key_id": key_id(new_key), "started": time.strftime("%Y-%m-%dT%H:%M:%S"), "done": []}
+        if not dry_run:
+            # Journal first: if we stop before the key file is saved, the
+            # fingerprint will not match and the next run starts afresh.
+            _write_journal(journal_path, journal)
+            key_env.set("KEY", new_key)
+            key_env.set(KEYRING_VAR, ",".join(split_keyring(ring)[1:]))
+            key_env.save()
+        console.print(f"[green]✅ New KEY generated[/green], "
+                      f"{len(split_keyring(ring)) - 1} previous key(s) kept in {KEYRING_VAR}")
+
+    todo = [f for f in files if str(f.resolve()) not in done]
+    workers = workers or max(1, min(len(todo), os.cpu_count() or 1))
+    console.print(f"\n🔑 [bold cyan]Key rotation[/bold cyan]: {len(todo)} file(s), {workers} worker(s)"
+                  f"{' [yellow](dry run)[/yellow]' if dry_run else ''}\n")
+
+    def record(result: dict):
+        if not result["error"] and not dry_run:
+            journal["done"].append(str(Path(result["path"]).resolve()))
+            _write_journal(journal_path, journal)
+
+    start = time.perf_counter()
+    results = _run(rotate_file, [(str(f), ring, dry_run) for f in todo], workers, on_done=record)
+    ok = _report("Rotation summary", "rotated", results, time.perf_counter() - start, dry_run)
+
+    if ok and not dry_run:
+        journal_path.unlink(missing_ok=True)
+        console.print(f"[green]✅ Rotation complete.[/green] Remove {KEYRING_VAR} once every service is redeployed.")
+    elif not ok:
+        console.print("[yellow]Fix the failed files and run the same command again to resume.[/yellow]")
+    return ok
@@ -1,10 +1,37 @@
 # cnb_cli/commands/consumer_generator.py
 import questionary
+from pathlib import Path
 from rich.console import Console
-from cnb_cli.utils.helper import create_file, modify_file
+from dev_cli.templates import engine, files  # noqa: F401 (registers templates)
+from dev_cli.utils.helper import create_file, modify_file
+from dev_cli.utils.lock import tracked
+from dev_cli.utils.vfs import staged
 
 console = Console()
 
+def create_consumer(connection_type: str, consumer_name: str, topic_name: str, root: str | Path = ".") -> str:
+    """Create a consumer and its support files under `root`; return the consumer path"""
+    root = Path(root)
+    consumer_file = f"app/consumers/{consumer_name}.py"
+    core_file = "app/core/core_consumer.py"
+    register_file = "app/consumers/register.py"
+
+    content = engine.render(
+        "consumer_py",
+        module=connection_type.lower(),
+        connection=connection_type,
+        class_name=consumer_name.title().replace('_', ''),
+        topic=topic_name,
+    )
+
+    create_file(str(root / consumer_file), content)
+    create_file(str(root / core_file), "# Core consumer base placeholder\n")
+    create_file(str(root / register_file), "# Consumer register placeholder\n")
+
+    modify_file(str(root / ".env"), f"{connection_type.upper()}_{topic_name.upper()}_TOPIC={topic_name}\n")
+    return consumer_file
+
+
 def generate_consumer():
     console.print("🔌 [bold cyan]Consumer Generation[/bold cyan]\n")
 
@@ -24,28 +51,8 @@ def generate_consumer():
     console.print(f"🚀 Creating {connection_type} consumer: {consumer_name}")
     console.print(f"Topic: {topic_name}")
 
-    consumer_file = f"app/consumers/{consumer_name}.py"
-    core_file = "app/core/core_consumer.py"
-    register_file = "app/consumers/register.py"
-
-    content = f"""from app.utils.{connection_type.lower()} import {connection_type}
-from app.core.core_consumer import CoreConsumer
-from loguru import logger
-
-class {consumer_name.title().replace('_','')}Consumer(CoreConsumer):
-    def __init__(self):
-        self.connection = {connection_type}()
-        self.topic = "{topic_name}"
-
-    async def process(self, message, request_id):
-        logger.info(f"{{request_id}} - Processing message: {{message}}")
-"""
-
-    create_file(consumer_file, content)
-    create_file(core_file, "# Core consumer base placeholder\n")
-    create_file(register_file, "# Consumer register placeholder\n")
-
-    modify_file(".env", f"{connection_type.upper()}_{topic_name.upper()}_TOPIC={topic_name}\n")
+    with staged(), tracked("."):
+        consumer_file = create_consumer(connection_type, consumer_name, topic_name)
 
     console.print(f"✨ Successfully created consumer: {consumer_name.title().replace('_','')}Consumer")
     console.print(f"📁 Files created:\n  • Consumer: {consumer_file}\n")
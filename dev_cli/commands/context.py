@@ -0,0 +1,208 @@
+# dev_cli/commands/context.py
+"""
+What does `docker build` actually upload?
+
+    zackry context                     # size by directory, largest files, suggested patterns
+    zackry context services/api --depth 2 --top 20
+    zackry context --write             # create / extend .dockerignore with the suggestions
+
+The context is walked with the same .dockerignore rules the docker CLI
+uses (see utils.build_context), so the numbers are what gets sent.
+Suggestions come from the default .dockerignore template; a pattern that
+would hide a COPY / ADD source of the Dockerfile is never suggested.
+"""
+
+import json
+import posixpath
+import re
+import shlex
+import stat
+from pathlib import Path
+
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+from dev_cli.templates.docker import DOCKERIGNORE
+from dev_cli.utils.build_context import IGNORE_NAME, IgnoreMatcher, iter_context, parse_patterns
+
+console = Console()
+
+ROOT_FILES = "(files in context root)"
+UPDATE_HEADER = "# Added by `zackry context --write`"
+_COPY = re.compile(r"^\s*(?:COPY|ADD)\s+(.+)$", re.IGNORECASE | re.MULTILINE)
+_GLOB = re.compile(r"[*?\[]")
+
+
+# ----------------------------
+# Scan
+# ----------------------------
+def scan_context(root: Path, dockerfile: str = "Dockerfile") -> list[tuple[str, int]]:
+    """(relative path, bytes) of every file and link sent to the daemon"""
+    files = []
+    for rel, entry in iter_context(root, dockerfile=dockerfile):
+        st = entry.stat(follow_symlinks=False)
+        if not stat.S_ISDIR(st.st_mode):
+            files.append((rel, st.st_size if stat.S_ISREG(st.st_mode) else 0))
+    return files
+
+
+def tar_size(files: list[tuple[str, int]]) -> int:
+    """Approximate upload size: a 512-byte header per file, data padded to 512, 1 KB trailer"""
+    return sum(512 + -(-size // 512) * 512 for _, size in files) + 1024
+
+
+def directory_sizes(files: list[tuple[str, int]], depth: int = 1) -> dict[str, list[int]]:
+    """{directory (first `depth` levels): [files, bytes]}"""
+    sizes: dict[str, list[int]] = {}
+    for rel, size in files:
+        parts = rel.split("/")[:-1][:depth]
+        key = "/".join(parts) + "/" if parts else ROOT_FILES
+        entry = sizes.setdefault(key, [0, 0])
+        entry[0] += 1
+        entry[1] += size
+    return sizes
+
+
+# ----------------------------
+# Suggestions
+# ----------------------------
+def dockerfile_sources(dockerfile: Path) -> list[str]:
+    """Context paths read by COPY / ADD (multi-stage `--from` copies and URLs excluded)"""
+    if not dockerfile.is_file():
+        return []
+    sources = []
+    for args in _COPY.findall(dockerfile.read_text(encoding="utf-8").replace("\\\n", " ")):
+        args = args.strip()
+        try:
+            words = json.loads(args) if args.startswith("[") else shlex.split(args)
+        except ValueError:
+            continue
+        flags = [w for w in words if w.startswith("--")]
+        words = [w for w in words if not w.startswith("--")]
+        if any(f.startswith("--from") for f in flags) or len(words) < 2:
+            continue
+        for source in words[:-1]:
+            if "://" in source:
+                continue
+            source = _GLOB.split(source, 1)[0].rsplit("/", 1)[0] if _GLOB.search(source) else source
+            source = posixpath.normpath(source.strip("/")) if source.strip("/") else "."
+            if source != ".":
+                sources.append(source)
+    return sources
+
+
+def default_patterns() -> list[str]:
+    return parse_patterns(DOCKERIGNORE)
+
+
+def protected(pattern: str, sources: list[str]) -> bool:
+    """True if `pattern` would exclude something the Dockerfile copies"""
+    matcher = IgnoreMatcher([pattern])
+    return any(matcher.matches(source) for source in sources)
+
+
+def suggest(files: list[tuple[str, int]], current: list[str], sources: list[str]) -> list[tuple[str, int, int]]:
+    """
+    (pattern, files, bytes) for each default pattern missing from `current`
+    that would drop something now sent, appended after `current` (so
+    existing `!` re-includes keep their effect where they come later).
+    """
+    present = set(current)
+    suggestions = []
+    for pattern in default_patterns():
+        if pattern in present or protected(pattern, sources):
+            continue
+        matcher = IgnoreMatcher(current + [pattern])
+        dropped = [size for rel, size in files if matcher.matches(rel)]
+        if dropped:
+            suggestions.append((pattern, len(dropped), sum(dropped)))
+    return sorted(suggestions, key=lambda s: -s[2])
+
+
+def write_ignore(root: Path, suggestions: list[tuple[str, int, int]], sources: list[str]) -> Path:
+    """Create .dockerignore from the template (minus protected patterns) or append the suggestions"""
+    path = root / IGNORE_NAME
+    if not path.exists():
+        lines = [line for line in DOCKERIGNORE.splitlines()
+                 if not line.strip() or line.startswith("#") or not protected(line.strip(), sources)]
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    elif suggestions:
+        text = path.read_text(encoding="utf-8")
+        block = "\n".join([UPDATE_HEADER, *(pattern for pattern, _, _ in suggestions)])
+        path.write_text(text + ("\n" if text and not text.endswith("\n") else "") + "\n" + block + "\n",
+                        encoding="utf-8")
+    return path
+
+
+# ----------------------------
+# Report
+# ----------------------------
+def _mb(size: int) -> str:
+    return f"{size / 1024 ** 2:,.1f} MB" if size >= 1024 ** 2 else f"{size / 1024:,.1f} KB"
+
+
+def analyze_context(root: str | Path = ".", dockerfile: str = "Dockerfile", depth: int = 1, top: int = 10,
+                    write: bool = False) -> bool:
+    root = Path(root)
+    if not root.is_dir():
+        console.print(f"[red]❌ {root} is not a directory[/red]")
+        return False
+
+    ignore = root / IGNORE_NAME
+    try:
+        current = parse_patterns(ignore.read_text(encoding="utf-8")) if ignore.is_file() else []
+        files = scan_context(root, dockerfile)
+        sources = dockerfile_sources(root / dockerfile)
+    except OSError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        return False
+    total = sum(size for _, size in files)
+
+    console.print(f"\n📦 [bold cyan]Build context: {escape(str(root.resolve()))}[/bold cyan]")
+    console.print(f"  {len(files):,} files, {_mb(total)} (≈ {_mb(tar_size(files))} uploaded per build)")
+    console.print(f"  {IGNORE_NAME}: " + (f"{len(current)} pattern(s)" if ignore.is_file() else "[yellow]none[/yellow]"))
+
+    table = Table(title="Size by directory")
+    table.add_column("Directory", style="cyan")
+    table.add_column("Files", justify="right")
+    table.add_column("Size", justify="right")
+    table.add_column("Share", justify="right")
+    directories = sorted(directory_sizes(files, depth).items(), key=lambda item: -item[1][1])
+    for name, (count, size) in directories[:top]:
+        table.add_row(escape(name), f"{count:,}", _mb(size), f"{size / total:.0%}" if total else "-")
+    if len(directories) > top:
+        rest = directories[top:]
+        table.add_row(f"... {len(rest)} more", f"{sum(c for _, (c, _) in rest):,}", _mb(sum(s for _, (_, s) in rest)), "")
+    console.print(table)
+
+    table = Table(title="Largest files")
+    table.add_column("File", style="cyan")
+    table.add_column("Size", justify="right")
+    for rel, size in sorted(files, key=lambda f: -f[1])[:top]:
+        table.add_row(escape(rel), _mb(size))
+    console.print(table)
+
+    suggestions = suggest(files, current, sources)
+    if suggestions:
+        table = Table(title=f"Suggested {IGNORE_NAME} patterns")
+        table.add_column("Pattern", style="yellow")
+        table.add_column("Files", justify="right")
+        table.add_column("Saves", justify="right")
+        for pattern, count, size in suggestions:
+            table.add_row(escape(pattern), f"{count:,}", _mb(size))
+        console.print(table)
+        matcher = IgnoreMatcher(current + [pattern for pattern, _, _ in suggestions])
+        kept = [(rel, size) for rel, size in files if not matcher.matches(rel)]
+        saved = total - sum(size for _, size in kept)
+        console.print(f"\n✨ With these, the context drops from {_mb(total)} to {_mb(total - saved)} "
+                      f"({saved / (total or 1):.0%} smaller, {len(files) - len(kept):,} fewer files)")
+    else:
+        console.print(f"\n[green]✅ Nothing left to suggest for {IGNORE_NAME}[/green]")
+
+    if write and (suggestions or not ignore.is_file()):
+        path = write_ignore(root, suggestions, sources)
+        console.print(f"📄 [green]{escape(str(path))} {'updated' if current else 'written'}[/green]\n")
+    elif suggestions:
+        console.print(f"💡 Run `zackry context{' ' + str(root) if str(root) != '.' else ''} --write` to apply\n")
+    return True
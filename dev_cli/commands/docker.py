@@ -6,9 +6,14 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from pathlib import Path
+from functools import lru_cache
 import subprocess
 import platform
 import shlex
+import json
+
+from dev_cli.utils.build_context import HASH_LABEL, IGNORE_NAME, context_hash, context_tar
+from dev_cli.utils.docker_api import DockerClient, DockerError
 
 console = Console()
 app = typer.Typer(help="Docker Build Tools 🐳")
@@ -21,7 +26,20 @@ IS_WINDOWS = platform.system() == "Windows"
 # ----------------------------
 # Helpers
 # ----------------------------
+@lru_cache(maxsize=1)
+def docker_client() -> DockerClient | None:
+    """
+    Engine API client over the daemon socket, shared by every call in this
+    process. None when the socket is not reachable (e.g. Windows named
+    pipes): callers then fall back to the docker CLI.
+    """
+    client = DockerClient()
+    return client if client.ping() else None
+
+
 def check_docker_installed() -> bool:
+    if docker_client():
+        return True
     try:
         subprocess.run(["docker", "--version"], check=True, capture_output=True)
         return True
@@ -62,6 +80,7 @@ def run_command(cmd: list[str], show_spinner: bool = True) -> bool:
 
 def ensure_dockerfile(path: Path) -> Path:
     dockerfile = path / "Dockerfile"
+    ignore = path / IGNORE_NAME
     if not dockerfile.exists():
         console.print("[yellow]⚠️ Dockerfile not found! Creating a minimal Dockerfile...[/yellow]")
         dockerfile.write_text(
@@ -70,11 +89,21 @@ def ensure_dockerfile(path: Path) -> Path:
             "COPY . /app\n"
             "CMD [\"python3\", \"--version\"]\n"
         )
+        if not ignore.exists():
+            from dev_cli.templates.docker import DOCKERIGNORE
+            ignore.write_text(DOCKERIGNORE)
+    elif not ignore.exists():
+        # An existing Dockerfile may COPY anything; suggest rather than write
+        console.print(f"[yellow]⚠️ No {IGNORE_NAME}: the whole directory is sent to the daemon "
+                      f"(run `zackry context` to see what it costs)[/yellow]")
     return dockerfile
 
 
 def image_exists(image: str) -> bool:
     """Check if a Docker image exists locally"""
+    client = docker_client()
+    if client:
+        return client.image_exists(image)
     result = subprocess.run(
         ["docker", "images", "-q", image],
         capture_output=True,
@@ -83,6 +112,178 @@ def image_exists(image: str) -> bool:
     return bool(result.stdout.strip())
 
 
+# ----------------------------
+# Engine API operations (docker CLI fallback)
+# ----------------------------
+def print_events(events, log=None) -> str | None:
+    """
+    Print build / pull / load progress (or pass each line to `log`);
+    returns the built image id, if any.
+    """
+    image_id = None
+    for event in events:
+        if "stream" in event:
+            if log:
+                for line in event["stream"].splitlines():
+                    log(line)
+            else:
+                console.out(event["stream"], end="", highlight=False)
+        elif "status" in event and not event.get("progressDetail"):
+            line = " ".join(filter(None, (event.get("id"), event["status"])))
+            if log:
+                log(line)
+            else:
+                console.print(f"[dim]{line}[/dim]")
+        if "ID" in event.get("aux", {}):
+            image_id = event["aux"]["ID"]
+    return image_id
+
+
+def build_image(image: str, context_dir: Path, labels: dict | None = None,
+                dockerfile: str = "Dockerfile", log=None) -> bool:
+    """Build `image`; with `log`, output goes line by line to it instead of the console"""
+    client = docker_client()
+    if client is None:
+        cmd = ["docker", "build", "-t", image, "-f", str(Path(context_dir) / dockerfile)]
+        for name, value in (labels or {}).items():
+            cmd += ["--label", f"{name}={value}"]
+        cmd.append(str(context_dir))
+        if log is None:
+            return run_command(cmd)
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        for line in process.stdout:
+            log(line.rstrip("\n"))
+        return process.wait() == 0
+
+    if log is None:
+        console.print(f"[cyan]$ docker build -t {image} {context_dir}[/cyan]")
+    try:
+        events = client.build(context_tar(context_dir, dockerfile), image, dockerfile=dockerfile, labels=labels)
+        image_id = print_events(events, log)
+    except (DockerError, OSError) as e:
+        if log:
+            log(f"✗ Build failed: {e}")
+        else:
+            console.print(f"[red]✗ Build failed: {e}[/red]")
+        return False
+    if log is None:
+        console.print(f"[green]✔ Built {image}{f' ({image_id[:19]})' if image_id else ''}[/green]")
+    return True
+
+
+def run_container(image: str, host_port: str) -> bool:
+    """Run in the foreground, streaming logs; Ctrl+C stops the container"""
+    client = docker_client()
+    if client is None:
+        return run_command(["docker", "run", "-p", f"{host_port}:80", image])
+
+    container = None
+    try:
+        container = client.run(image, ports={80: host_port})
+        console.print(f"[green]✔ Container {container[:12]} started (localhost:{host_port} → 80), "
+                      f"Ctrl+C to stop[/green]")
+        for _, data in client.logs(container):
+            console.out(data.decode(errors="replace"), end="", highlight=False)
+        code = client.wait(container)
+        console.print(f"Container exited with code {code}")
+        return code == 0
+    except KeyboardInterrupt:
+        if container:
+            client.stop(container)
+            console.print(f"\n[yellow]⏹ Container {container[:12]} stopped[/yellow]")
+        return True
+    except DockerError as e:
+        console.print(f"[red]✗ Run failed: {e}[/red]")
+        return False
+
+
+# ----------------------------
+# Content-addressed build cache
+# ----------------------------
+def image_label(image: str, name: str) -> str | None:
+    client = docker_client()
+    if client:
+        info = client.inspect_image(image)
+        return ((info or {}).get("Config") or {}).get("Labels", {}).get(name) if info else None
+    result = subprocess.run(
+        ["docker", "image", "inspect", "--format", "{{json .Config.Labels}}", image],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return None
+    return (json.loads(result.stdout or "null") or {}).get(name)
+
+
+def find_image(label: str) -> str | None:
+    """Id of a local image carrying `label` ("name=value")"""
+    client = docker_client()
+    if client:
+        images = client.images(label)
+        return images[0]["Id"] if images else None
+    result = subprocess.run(
+        ["docker", "images", "-q", "--no-trunc", "--filter", f"label={label}"],
+        capture_output=True, text=True
+    )
+    ids = result.stdout.split()
+    return ids[0] if ids else None
+
+
+def tag_image(image: str, target: str) -> bool:
+    client = docker_client()
+    if client is None:
+        return run_command(["docker", "tag", image, target], show_spinner=False)
+    try:
+        client.tag(image, target)
+        return True
+    except DockerError as e:
+        console.print(f"[red]✗ Tag failed: {e}[/red]")
+        return False
+
+
+def cached_image(image: str, digest: str) -> tuple[str, str | None]:
+    """
+    What to do for `image` given its context hash:
+    ("current", None) the tag was built from this context,
+    ("match", id)     another image was, re-tag it,
+    ("build", None)   nothing was.
+    """
+    if image_label(image, HASH_LABEL) == digest:
+        return "current", None
+    match = find_image(f"{HASH_LABEL}={digest}")
+    if match:
+        return "match", match
+    return "build", None
+
+
+def ensure_image(image: str, context_dir: Path) -> bool:
+    """
+    Build `image` unless an image built from the same context exists.
+
+    The context hash (files after .dockerignore, plus the Dockerfile) is
+    stored as a label: a matching tag is reused, a matching image under
+    another tag is re-tagged, and a stale tag is rebuilt.
+    """
+    with console.status("⠋ Hashing build context...", spinner="dots"):
+        digest = context_hash(context_dir)
+
+    action, match = cached_image(image, digest)
+    if action == "current":
+        console.print(f"[green]✅ Using existing image: {image} (context unchanged)[/green]\n")
+        return True
+    if action == "match":
+        console.print(f"[green]♻️ Context matches image {match.split(':')[-1][:12]}, tagging it as {image}[/green]\n")
+        return tag_image(match, image)
+
+    if image_exists(image):
+        console.print(f"[yellow]🔄 Build context changed since {image} was built, rebuilding...[/yellow]\n")
+    else:
+        console.print("\n🚀 Building Docker image...\n")
+    if not build_image(image, context_dir, labels={HASH_LABEL: digest}):
+        console.print(f"[red]❌ Build failed: {image}[/red]")
+        return False
+    return True
+
+
 def get_docker_service_guide() -> str:
     if IS_LINUX:
         return (
@@ -134,30 +335,17 @@ def build_and_run_local():
 
     full_image = f"{image_name}:{tag}"
 
-    if not image_exists(full_image):
-        console.print("\n🚀 Building Docker image...\n")
-        if not run_command([
-            "docker", "build",
-            "-t", full_image,
-            "."
-        ]):
-            console.print(f"[red]❌ Build failed: {full_image}[/red]")
-            return
-    else:
-        console.print(f"[green]✅ Using existing image: {full_image}[/green]\n")
+    if not ensure_image(full_image, project_dir):
+        return
 
     if questionary.confirm("Run container now?", default=True).ask():
         console.print("\n▶️ Running container...\n")
-        run_command([
-            "docker", "run",
-            "-p", f"{host_port}:80",
-            full_image
-        ])
+        run_container(full_image, host_port)
 
     # Display guide
     console.print(Panel.fit(
         f"💡 Guide:\n"
-        "1️⃣ Builds Docker image from current directory (or uses existing)\n"
+        "1️⃣ Builds Docker image from current directory (reused while the context is unchanged)\n"
         "2️⃣ Maps host port → container port 80\n"
         "3️⃣ Runs container locally\n\n"
         f"{get_docker_service_guide()}"
@@ -174,6 +362,8 @@ def build_and_run_local():
 # Build & Export TAR
 # ----------------------------
 def build_docker_tar():
+    from dev_cli.commands.image_transfer import DEFAULT_CODEC, export_image
+
     project_dir = Path.cwd()
 
     image_name = questionary.text(
@@ -186,38 +376,34 @@ def build_docker_tar():
         default="latest"
     ).ask()
 
+    codec = questionary.select(
+        "Compression",
+        choices=["gzip", "zstd", "none"],
+        default=DEFAULT_CODEC
+    ).ask()
+
+    split = questionary.text(
+        "Split into parts of (e.g. 1G, empty = single file)",
+        default=""
+    ).ask()
+
     full_image = f"{image_name}:{tag}"
-    tar_file = project_dir / f"{image_name}_{tag}.tar"
-
-    console.print("\n🚀 Exporting Docker image to tar file...")
-    console.print(f"Image: {full_image}")
-    console.print(f"Output: {tar_file.name}\n")
-
-    if not image_exists(full_image):
-        ensure_dockerfile(project_dir)
-        console.print(f"[yellow]⚠️ Image {full_image} not found locally. Building it now...[/yellow]\n")
-        if not run_command([
-            "docker", "build",
-            "-t", full_image,
-            "."
-        ]):
-            console.print(f"[red]❌ Build failed: {full_image}[/red]")
-            return
-    else:
-        console.print(f"[green]✅ Using existing image: {full_image}[/green]\n")
-
-    if run_command([
-        "docker", "save",
-        "-o", str(tar_file),
-        full_image
-    ]):
-        console.print(f"\n✅ Saving Docker image {full_image} completed successfully!\n")
+
+    console.print("\n🚀 Exporting Docker image...")
+    console.print(f"Image: {full_image}\n")
+
+    ensure_dockerfile(project_dir)
+    if not ensure_image(full_image, project_dir):
+        return
+
+    archive = export_image(full_image, project_dir, codec=codec, split=split or None)
+    if archive:
         console.print("✨ Docker image saved successfully!\n")
-        console.print("📁 File created:")
-        console.print(f"  • {tar_file.name}\n")
         console.print("💡 Next steps:")
-        console.print(f"  1. Transfer the tar file to another machine")
-        console.print(f"  2. Load it with: docker load -i {tar_file.name}")
+        load = f"cat {archive.name}.[0-9]* | docker load" if split else f"docker load -i {archive.name}"
+        console.print(f"  1. Transfer {archive.name}{'.*' if split else ''} and {archive.name}.sha256 to another machine")
+        console.print(f"  2. Load it with: zackry image import {archive.name}")
+        console.print(f"     (or without zackry: {load})")
         console.print(f"  3. Run it with: docker run {full_image}\n")
         console.print("Created by: Hour Zackry")
 
@@ -237,6 +423,7 @@ def docker_menu():
         choices=[
             "Build and Run Local Docker",
             "Build Docker Image as Tar",
+            "Analyze Build Context",
             "Exit"
         ]
     ).ask()
@@ -245,6 +432,13 @@ def docker_menu():
         build_and_run_local()
     elif choice == "Build Docker Image as Tar":
         build_docker_tar()
+    elif choice == "Analyze Build Context":
+        from dev_cli.commands.context import analyze_context
+        if not (Path.cwd() / IGNORE_NAME).exists() and questionary.confirm(
+                f"No {IGNORE_NAME} yet. Write one with the suggestions?", default=False).ask():
+            analyze_context(write=True)
+        else:
+            analyze_context()
     else:
         console.print("[green]✅ Exiting Docker menu[/green]")
         return
@@ -1,13 +1,32 @@
 # cnb_cli/commands/docker_generator.py
-import typer
 import questionary
+from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
-from cnb_cli.utils.helper import create_file, modify_file
+from dev_cli.templates import engine, docker  # noqa: F401 (registers templates)
+from dev_cli.utils.helper import create_file
+from dev_cli.utils.lock import tracked
+from dev_cli.utils.vfs import staged
 
 console = Console()
 
+def create_docker_compose(db_choice: list[str], services_choice: list[str], root: str | Path = ".") -> str:
+    """Write docker-compose.yml for the selected services under `root`"""
+    # Example: Generate docker-compose.yml (placeholder content)
+    docker_compose_content = engine.render("compose_app")
+
+    if "Postgres" in db_choice:
+        docker_compose_content += engine.render("compose_postgres")
+
+    if "Redis" in services_choice:
+        docker_compose_content += engine.render("compose_redis")
+
+    # Save docker-compose.yml
+    create_file(str(Path(root) / "docker-compose.yml"), docker_compose_content)
+    return "docker-compose.yml"
+
+
 def generate_docker():
     console.print(Panel.fit("🐳 [bold cyan]Docker Setup Generator[/bold cyan]", border_style="green"))
 
@@ -77,42 +96,6 @@ def generate_docker():
         border_style="blue"
     ))
 
-    # Example: Generate docker-compose.yml (placeholder content)
-    docker_compose_content = f"""
-version: '3.9'
-
-services:
-  app:
-    image: your-app-image
-    container_name: app
-    ports:
-      - "8000:8000"
-    environment:
-      - ENV=development
-"""
-
-    if "Postgres" in db_choice:
-        docker_compose_content += """
-  postgres:
-    image: postgres:15
-    container_name: postgres
-    environment:
-      POSTGRES_USER: user
-      POSTGRES_PASSWORD: password
-      POSTGRES_DB: app_db
-    ports:
-      - "5432:5432"
-"""
-
-    if "Redis" in services_choice:
-        docker_compose_content += """
-  redis:
-    image: redis:7
-    container_name: redis
-    ports:
-      - "6379:6379"
-"""
-
-    # Save docker-compose.yml
-    create_file("docker-compose.yml", docker_compose_content)
+    with staged(), tracked("."):
+        create_docker_compose(db_choice, services_choice)
     console.print("[green]✨ docker-compose.yml created successfully![/green]")
@@ -2,6 +2,11 @@
 
 import questionary
 from cryptography.fernet import Fernet
+from dev_cli.utils.encryption import (
+    CIPHER_VAR, DEFAULT_CIPHER, KEY_VARS, KEYRING_VAR, decrypt_many, decrypt_token, encrypt_data, encrypt_many,
+    keyring, split_tokens,
+)
+from dev_cli.utils.envfile import EnvFile
 from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
@@ -13,20 +18,30 @@ console = Console()
 # ----------------------------
 # Helpers
 # ----------------------------
-def load_key() -> str:
-    env_path = Path(".env")
-    if not env_path.exists():
-        console.print("[red]❌ .env file not found! Generate a key first.[/red]")
-        raise FileNotFoundError(".env not found")
+def load_key(env: EnvFile | None = None) -> str:
+    """KEY plus any KEY_PREVIOUS keys: encrypts with KEY, decrypts with any of them"""
+    if env is None:
+        env_path = Path(".env")
+        if not env_path.exists():
+            console.print("[red]❌ .env file not found! Generate a key first.[/red]")
+            raise FileNotFoundError(".env not found")
+        env = EnvFile.load(env_path)
 
-    for line in env_path.read_text().splitlines():
-        if line.startswith("KEY="):
-            return line.split("=", 1)[1]
+    key = env.get("KEY")
+    if key:
+        return keyring(key, env.get(KEYRING_VAR, ""))
 
     console.print("[red]❌ KEY not found in .env! Generate a key first.[/red]")
     raise ValueError("KEY not found in .env")
 
 
+def load_cipher(env: EnvFile | None = None) -> str:
+    """Cipher for new values: KEY_CIPHER in .env, Fernet by default"""
+    if env is None:
+        env = EnvFile.load(".env", missing_ok=True)
+    return env.get(CIPHER_VAR) or DEFAULT_CIPHER
+
+
 def spinner_task(message: str, func, *args, **kwargs):
     """Show spinner while task is running"""
     with console.status(f"[cyan]{message}...", spinner="dots") as status:
@@ -34,6 +49,19 @@ def spinner_task(message: str, func, *args, **kwargs):
         return result
 
 
+PREVIEW_LIMIT = 20
+
+
+def preview_vars(title: str, pairs: list[tuple[str, str]], limit: int = PREVIEW_LIMIT):
+    """Print a short preview: the first `limit` variables, values truncated"""
+    console.print(f"[cyan]{title}[/cyan] ({len(pairs)} variables)")
+    for k, v in pairs[:limit]:
+        shown = v if len(v) <= 40 else f"{v[:37]}..."
+        console.print(f"  {k} = {shown}", markup=False, highlight=False)
+    if len(pairs) > limit:
+        console.print(f"  [dim]... and {len(pairs) - limit} more[/dim]")
+
+
 # ----------------------------
 # Generate KEY
 # ----------------------------
@@ -42,12 +70,17 @@ def generate_key(auto_save: bool = True) -> str:
     console.print(f"[green]✅ Generated Key:[/green] {key}")
 
     if auto_save:
-        env_path = Path(".env")
-        lines = []
-        if env_path.exists():
-            lines = [l for l in env_path.read_text().splitlines() if not l.startswith("KEY=")]
-        env_path.write_text(f"KEY={key}\n" + "\n".join(lines) + "\n")
+        env = EnvFile.load(".env", missing_ok=True)
+        old = env.get("KEY")
+        env.remove("KEY")
+        env.set("KEY", key, first=True)
+        if old:
+            # Keep the old key so values encrypted with it stay readable
+            env.set(KEYRING_VAR, keyring(old, env.get(KEYRING_VAR, "")))
+        env.save()
         console.print(f"[green]✅ Key saved in .env[/green]")
+        if old:
+            console.print(f"[yellow]⚠️ Previous key kept in {KEYRING_VAR}; run Rotate Key to re-encrypt values[/yellow]")
 
     return key
 
@@ -66,8 +99,11 @@ def encrypt_value():
         console.print("[yellow]⚠️ No value entered[/yellow]")
         return
 
-    f = Fernet(key.encode())
-    encrypted = spinner_task("Encrypting value", f.encrypt, value.encode()).decode()
+    try:
+        encrypted = spinner_task("Encrypting value", encrypt_data, value, key, load_cipher())
+    except ValueError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        return
     console.print(f"[green]✅ Encrypted value:[/green] {encrypted}")
 
 
@@ -85,9 +121,8 @@ def decrypt_value():
         console.print("[yellow]⚠️ No value entered[/yellow]")
         return
 
-    f = Fernet(key.encode())
     try:
-        decrypted = spinner_task("Decrypting value", f.decrypt, value.encode()).decode()
+        decrypted = spinner_task("Decrypting value", decrypt_token, value, key)
         console.print(f"[green]✅ Decrypted value:[/green] {decrypted}")
     except Exception:
         console.print("[red]❌ Failed to decrypt. Is the value correct?[/red]")
@@ -102,42 +137,36 @@ def encrypt_entire_env():
         console.print("[red]❌ .env file not found![/red]")
         return
 
+    env = EnvFile.load(env_path)
     try:
-        key = load_key()
+        key = load_key(env)
     except Exception:
         return
 
-    fernet = Fernet(key.encode())
-    lines = env_path.read_text().splitlines()
-    vars_to_encrypt = [(l.split("=", 1)[0], l.split("=", 1)[1])
-                       for l in lines if l and not l.startswith("KEY=") and not l.startswith("#")]
+    cipher = load_cipher(env)
+    vars_to_encrypt = [(k, v) for k, v in env.items() if k not in KEY_VARS]
 
     if not vars_to_encrypt:
         console.print("[yellow]⚠️ No variables to encrypt[/yellow]")
         return
 
-    console.print("[cyan]Variables to encrypt:[/cyan]")
-    for k, v in vars_to_encrypt:
-        console.print(f"{k} = {v}")
+    preview_vars("Variables to encrypt:", vars_to_encrypt)
 
     if not questionary.confirm("Encrypt these variables?", default=True).ask():
         console.print("[yellow]Operation cancelled.[/yellow]")
         return
 
-    encrypted_lines = []
-    for line in lines:
-        if line.startswith("KEY=") or not line.strip() or line.startswith("#"):
-            encrypted_lines.append(line)
-        else:
-            k, v = line.split("=", 1)
-            encrypted_lines.append(f"{k}={fernet.encrypt(v.encode()).decode()}")
+    try:
+        env.update(encrypt_many(dict(vars_to_encrypt), key, cipher))
+    except ValueError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        return
 
-    console.print("\nPreview of encrypted .env:")
-    for line in encrypted_lines:
-        console.print(line)
+    console.print()
+    preview_vars("Preview of encrypted .env:", [(k, env[k]) for k, _ in vars_to_encrypt])
 
     if questionary.confirm("Save changes to .env?", default=True).ask():
-        spinner_task("Saving .env", lambda: env_path.write_text("\n".join(encrypted_lines) + "\n"))
+        spinner_task("Saving .env", env.save)
         console.print("[green]✅ .env encrypted in-place[/green]")
     else:
         console.print("[yellow]Operation cancelled, .env not modified[/yellow]")
@@ -152,38 +181,34 @@ def decrypt_entire_env():
         console.print("[red]❌ .env file not found![/red]")
         return
 
+    env = EnvFile.load(env_path)
     try:
-        key = load_key()
+        key = load_key(env)
     except Exception:
         return
 
-    fernet = Fernet(key.encode())
-    lines = env_path.read_text().splitlines()
-    decrypted_lines = []
-    to_decrypt = []
-
-    for line in lines:
-        if line.startswith("KEY=") or not line.strip() or line.startswith("#"):
-            decrypted_lines.append(line)
-        else:
-            k, v = line.split("=", 1)
-            try:
-                decrypted_val = fernet.decrypt(v.encode()).decode()
-            except Exception:
-                decrypted_val = v  # keep as-is if not encrypted
-            decrypted_lines.append(f"{k}={decrypted_val}")
-            to_decrypt.append((k, decrypted_val))
+    # Classify first: only structurally valid tokens reach the cipher
+    tokens, _ = split_tokens({k: v for k, v in env.items() if k not in KEY_VARS})
+    if not tokens:
+        console.print("[yellow]⚠️ No variables to decrypt[/yellow]")
+        return
 
+    decrypted = decrypt_many(tokens, key)
+    failed = [k for k, v in decrypted.items() if v == tokens[k]]
+    to_decrypt = [(k, v) for k, v in decrypted.items() if k not in failed]
+    for k, v in to_decrypt:
+        env.set(k, v)
+
+    if failed:
+        console.print(f"[red]❌ {len(failed)} value(s) could not be decrypted with KEY / {KEYRING_VAR}: "
+                      f"{', '.join(failed)}[/red]")
     if not to_decrypt:
-        console.print("[yellow]⚠️ No variables to decrypt[/yellow]")
         return
 
-    console.print("[cyan]Preview of decrypted .env:[/cyan]")
-    for line in decrypted_lines:
-        console.print(line)
+    preview_vars("Preview of decrypted .env:", to_decrypt)
 
     if questionary.confirm("Save decrypted values to .env?", default=True).ask():
-        spinner_task("Saving .env", lambda: env_path.write_text("\n".join(decrypted_lines) + "\n"))
+        spinner_task("Saving .env", env.save)
         console.print("[green]✅ .env decrypted in-place[/green]")
     else:
         console.print("[yellow]Operation cancelled, .env not modified[/yellow]")
@@ -201,7 +226,10 @@ def encrypt_menu():
             "Encrypt Value",
             "Decrypt Value",
             "Encrypt Entire .env File",
-            "Decrypt Entire .env File"
+            "Decrypt Entire .env File",
+            "Encrypt File",
+            "Decrypt File",
+            "Rotate Key"
         ]
     ).ask()
 
@@ -215,6 +243,15 @@ def encrypt_menu():
         encrypt_entire_env()
     elif choice == "Decrypt Entire .env File":
         decrypt_entire_env()
+    elif choice in ("Encrypt File", "Decrypt File"):
+        from dev_cli.commands.secure_file import crypt_file
+        path = questionary.path("File path").ask()
+        if path:
+            crypt_file(choice.split()[0].lower(), path)
+    elif choice == "Rotate Key":
+        from dev_cli.commands.bulk_env import rotate_env
+        if questionary.confirm("Generate a new KEY and re-encrypt .env?", default=True).ask():
+            rotate_env([".env"], workers=1)
 
 
 # ----------------------------
@@ -226,6 +263,10 @@ def show_encrypt_guide():
         "• Generate Key → stores KEY in .env\n"
         "• Encrypt/Decrypt Value → single value\n"
         "• Encrypt/Decrypt Entire .env → in-place with preview\n"
+        "• zackry crypt encrypt 'services/*/.env*' → many files at once\n"
+        "• zackry rotate 'services/*/.env*' → new KEY, old keys kept in KEY_PREVIOUS\n"
+        "• Encrypt/Decrypt File → large files streamed in chunks (.zkf)\n"
+        "• KEY_CIPHER=aesgcm|chacha20 in .env → smaller single-pass tokens\n"
         "\nCreated by: Hour Zackry",
         title="Guide",
         style="yellow"
@@ -3,11 +3,6 @@ import typer
 import questionary
 from rich.console import Console
 
-from cnb_cli.commands.utils_generator import generate_utils
-from cnb_cli.commands.consumer_generator import generate_consumer
-from cnb_cli.commands.api_generator import generate_api
-from cnb_cli.commands.docker_generator import generate_docker
-
 console = Console()
 app = typer.Typer(help="Component Generator 🚀")
 
@@ -27,14 +22,19 @@ def _generate_component():
 
     console.print(f"[green]✅ You selected: {choice}[/green]\n")
 
+    # Generators are imported on demand so only the selected one is loaded
     if choice == "API (Fast - CRUD or Simple)":
+        from dev_cli.commands.api_generator import generate_api
         generate_api()
     elif choice == "Consumer":
+        from dev_cli.commands.consumer_generator import generate_consumer
         generate_consumer()
     elif choice == "Utils":
         # Pass the selection to utils generator
+        from dev_cli.commands.utils_generator import generate_utils
         generate_utils()
     elif choice == "Docker":
+        from dev_cli.commands.docker_generator import generate_docker
         generate_docker()
     else:
         console.print("[yellow]⚠️ Component creation not implemented[/yellow]")
@@ -0,0 +1,104 @@
+# dev_cli/commands/history.py
+"""
+Query the request history written by `zackry r` / `zackry requests`.
+
+    zackry history list [JOB] [--env PROD] [--since 2026-01-01] [--until 2026-03-31]
+    zackry history last JOB --env PROD        # latest request + what changed since the previous one
+    zackry history compact [--keep 100]
+"""
+
+from rich.console import Console
+from rich.table import Table
+
+from dev_cli.utils.history import DEFAULT_ROOT, HistoryError, RequestHistory, changes
+
+console = Console()
+
+PREVIEW_ROWS = 50
+
+
+def list_requests(job: str | None = None, environment: str | None = None, since: str | None = None,
+                  until: str | None = None, limit: int = 20, root: str = DEFAULT_ROOT) -> bool:
+    history = RequestHistory(root)
+    entries = history.entries(job, environment, since, until)
+    if not entries:
+        console.print("[yellow]⚠️ No matching requests in the history[/yellow]")
+        return True
+
+    table = Table(title=f"Request history ({len(entries)} match{'es' if len(entries) != 1 else ''})")
+    for column in ("#", "Time (UTC)", "Env", "Job", "Type", "Output"):
+        table.add_column(column, style="cyan" if column == "Job" else None)
+    try:
+        for record in history.query(limit, job=job, environment=environment, since=since, until=until):
+            table.add_row(str(record["seq"]), record["ts"], record["environment"], record["job"],
+                          record.get("request_type", ""), record.get("output", ""))
+    except HistoryError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        return False
+    if limit and len(entries) > limit:
+        table.add_row("...", f"{len(entries) - limit} older", "", "", "", "")
+    console.print(table)
+    return True
+
+
+def show_last(job: str, environment: str | None = None, root: str = DEFAULT_ROOT) -> bool:
+    """The latest request for a job and what changed since the one before it"""
+    history = RequestHistory(root)
+    try:
+        record = history.last(job, environment)
+        previous = history.previous(record) if record else None
+    except HistoryError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        return False
+    if record is None:
+        console.print(f"[yellow]⚠️ No request for {job}{f' in {environment}' if environment else ''}[/yellow]")
+        return False
+
+    console.print(f"\n🎫 #{record['seq']} [bold cyan]{record['request_type']}[/bold cyan] "
+                  f"{record['environment']} / {record['job']} at {record['ts']}")
+    console.print(f"   path: {record.get('path', '')}   env file: {record.get('env_file', '')}   "
+                  f"output: {record.get('output', '')}")
+
+    if previous is None:
+        console.print("\n[dim]First request for this job and environment[/dim]\n")
+        return True
+
+    rows = changes(previous, record)
+    console.print(f"\n🔍 Since #{previous['seq']} ({previous['ts']}): "
+                  f"{len(rows)} change(s)")
+    if rows:
+        table = Table(show_lines=True)
+        for column in ("Name", "Change", "Old Value", "New Value"):
+            table.add_column(column, style="cyan" if column == "Name" else None)
+        for row in rows[:PREVIEW_ROWS]:
+            table.add_row(*row)
+        if len(rows) > PREVIEW_ROWS:
+            table.add_row("...", f"{len(rows) - PREVIEW_ROWS} more", "", "")
+        console.print(table)
+    return True
+
+
+def compact_history(keep: int | None = None, root: str = DEFAULT_ROOT) -> bool:
+    try:
+        stats = RequestHistory(root).compact(keep)
+    except (OSError, HistoryError) as e:
+        console.print(f"[red]❌ {e}[/red]")
+        return False
+    before, after = stats["before"], stats["after"]
+    console.print(f"[green]✅ History compacted: {before['records']} → {after['records']} record(s), "
+                  f"{before['segments']} → {after['segments']} segment(s)[/green]")
+    return True
+
+
+def history_command(action: str, job: str | None = None, env: str | None = None, since: str | None = None,
+                    until: str | None = None, limit: int = 20, keep: int | None = None) -> bool:
+    """`zackry history list|last|compact`"""
+    env = env.upper() if env else None
+    if action == "list":
+        return list_requests(job, env, since, until, limit)
+    if action == "last" and job:
+        return show_last(job, env)
+    if action == "compact":
+        return compact_history(keep)
+    console.print("[red]❌ Use: history list [JOB] | history last JOB | history compact[/red]")
+    return False
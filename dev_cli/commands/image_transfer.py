@@ -0,0 +1,157 @@
+# dev_cli/commands/image_transfer.py
+"""
+Stream Docker images to and from compressed, split archives.
+
+    zackry image export api:1.0 --codec zstd --split 1G -o dist/
+    zackry image import dist/api_1.0.tar.zst        # checks SHA-256, then `docker load`
+
+`docker save` output goes straight through the compressor into parts;
+import reads, verifies and decompresses the parts straight into
+`docker load`. No uncompressed tar is ever written to disk.
+"""
+
+import subprocess
+import time
+from pathlib import Path
+
+from rich.console import Console
+from rich.progress import BarColumn, DownloadColumn, Progress, TextColumn, TimeRemainingColumn, TransferSpeedColumn
+from rich.table import Table
+
+from dev_cli.commands.docker import docker_client, print_events
+from dev_cli.utils.archive import CODECS, ArchiveError, ArchiveWriter, parse_size, read_archive
+from dev_cli.utils.docker_api import DockerError
+
+console = Console()
+
+DEFAULT_CODEC = "gzip"
+READ_SIZE = 1024 * 1024
+
+
+def archive_name(image: str, codec: str) -> str:
+    """`repo/app:1.0` -> `app_1.0.tar.gz`"""
+    name, _, tag = image.rpartition(":") if ":" in image.rsplit("/", 1)[-1] else (image, "", "latest")
+    return f"{name.rsplit('/', 1)[-1]}_{tag}.tar{CODECS[codec]}"
+
+
+def _progress(unit: str) -> Progress:
+    return Progress(TextColumn("[cyan]{task.description}[/cyan]"), BarColumn(), DownloadColumn(),
+                    TransferSpeedColumn(), TimeRemainingColumn(), TextColumn(unit), console=console)
+
+
+# ----------------------------
+# docker save / load streams (API, CLI fallback)
+# ----------------------------
+def save_stream(image: str):
+    client = docker_client()
+    if client:
+        yield from client.save(image).chunks(READ_SIZE)
+        return
+    process = subprocess.Popen(["docker", "save", image], stdout=subprocess.PIPE)
+    try:
+        while chunk := process.stdout.read(READ_SIZE):
+            yield chunk
+    finally:
+        process.stdout.close()
+        if process.wait() != 0:
+            raise DockerError(f"docker save {image} failed")
+
+
+def load_stream(chunks) -> bool:
+    client = docker_client()
+    if client:
+        print_events(client.load(chunks))
+        return True
+    process = subprocess.Popen(["docker", "load"], stdin=subprocess.PIPE)
+    try:
+        for chunk in chunks:
+            process.stdin.write(chunk)
+    finally:
+        process.stdin.close()
+        code = process.wait()
+    return code == 0
+
+
+def image_size(image: str) -> int | None:
+    """Uncompressed image size, used as the progress estimate for `docker save`"""
+    client = docker_client()
+    if client:
+        info = client.inspect_image(image)
+        return info.get("Size") if info else None
+    result = subprocess.run(["docker", "image", "inspect", "--format", "{{.Size}}", image],
+                            capture_output=True, text=True)
+    return int(result.stdout) if result.returncode == 0 and result.stdout.strip().isdigit() else None
+
+
+# ----------------------------
+# Export
+# ----------------------------
+def export_image(image: str, output_dir: str | Path = ".", codec: str = DEFAULT_CODEC, level: int | None = None,
+                 split: str | None = None, threads: int = 0) -> Path | None:
+    """Stream `docker save` into a compressed (optionally split) archive; returns its path"""
+    try:
+        if codec not in CODECS:
+            raise ArchiveError(f"Unknown codec '{codec}' (use {', '.join(CODECS)})")
+        split_size = parse_size(split)
+        path = Path(output_dir) / archive_name(image, codec)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        total = image_size(image)
+        start = time.perf_counter()
+        with _progress("read") as progress, ArchiveWriter(path, codec, level, split_size, threads) as out:
+            task = progress.add_task(f"Exporting {image}", total=total)
+            for chunk in save_stream(image):
+                out.write(chunk)
+                progress.update(task, completed=out.raw_bytes, total=max(total or 0, out.raw_bytes) or None)
+            progress.update(task, total=out.raw_bytes, completed=out.raw_bytes)
+    except (ArchiveError, DockerError, OSError) as e:
+        console.print(f"[red]❌ Export failed: {e}[/red]")
+        return None
+
+    elapsed = time.perf_counter() - start
+    table = Table(title=f"{image} → {path.name}")
+    table.add_column("File", style="cyan")
+    table.add_column("Size", justify="right")
+    table.add_column("SHA-256")
+    for part, size, sha in out.parts:
+        table.add_row(part.name, f"{size / 1024 ** 2:,.1f} MB", sha)
+    console.print(table)
+    ratio = out.written / out.raw_bytes if out.raw_bytes else 1
+    console.print(f"✨ {out.raw_bytes / 1024 ** 2:,.1f} MB → {out.written / 1024 ** 2:,.1f} MB ({ratio:.0%}, {codec}) "
+                  f"in {elapsed:.1f}s ({out.raw_bytes / 1024 ** 2 / (elapsed or 1e-9):,.1f} MB/s)")
+    console.print(f"📄 Checksums: {path.name}.sha256 (verify with: sha256sum -c {path.name}.sha256)\n")
+    return path
+
+
+# ----------------------------
+# Import
+# ----------------------------
+def import_image(path: str | Path, verify: bool = True) -> bool:
+    """Verify, decompress and `docker load` an archive written by export_image (or any .tar/.tar.gz/.tar.zst)"""
+    path = Path(path)
+    start = time.perf_counter()
+    try:
+        with _progress("compressed") as progress:
+            task = progress.add_task(f"Importing {path.name}", total=None)
+            compressed, chunks = read_archive(path, verify=verify, chunk_size=READ_SIZE,
+                                              on_read=lambda n: progress.advance(task, n))
+            progress.update(task, total=compressed)
+            ok = load_stream(chunks)
+    except (ArchiveError, DockerError, OSError) as e:
+        console.print(f"[red]❌ Import failed: {e}[/red]")
+        return False
+    if ok:
+        console.print(f"[green]✅ Imported {path.name} in {time.perf_counter() - start:.1f}s[/green]")
+    else:
+        console.print("[red]❌ docker load failed[/red]")
+    return ok
+
+
+def image_command(action: str, target: str, out_dir: str = ".", codec: str = DEFAULT_CODEC, level: int | None = None,
+                  split: str | None = None, threads: int = 0, no_verify: bool = False) -> bool:
+    """`zackry image export|import`"""
+    if action == "export":
+        return export_image(target, out_dir, codec=codec, level=level, split=split, threads=threads) is not None
+    if action == "import":
+        return import_image(target, verify=not no_verify)
+    console.print("[red]❌ Use: image export IMAGE | image import FILE[/red]")
+    return False
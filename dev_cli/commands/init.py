@@ -1,15 +1,17 @@
 from pathlib import Path
 from rich.console import Console
 import questionary
-from cnb_cli.templates import files, project, docker
+from dev_cli.templates import engine, files, project, docker  # noqa: F401 (registers templates)
+from dev_cli.utils.fs import mkdir, touch, write_file
+from dev_cli.utils.lock import tracked, DRIFT, UPDATED
+from dev_cli.utils.vfs import staged
 
 console = Console()
 
-def init_project():
-    console.print("\n🎉 [bold green]Project Initialization[/bold green]\n")
 
-    # Ask user if DB is needed
-    need_db = questionary.confirm("Do you need DB connection?", default=True).ask()
+def create_project(root: str | Path = ".", need_db: bool = True) -> list[str]:
+    """Create the project skeleton under `root`; return the files written"""
+    root = Path(root)
 
     # Prepare folder list
     folders = project.BASE_DIRS.copy()
@@ -19,31 +21,52 @@ def init_project():
 
     # Create folders
     for f in folders:
-        Path(f).mkdir(parents=True, exist_ok=True)
-        Path(f"{f}/__init__.py").touch(exist_ok=True)
-
-    console.print("🚀 Project folders created successfully!")
+        mkdir(root / f)
+        touch(root / f / "__init__.py")
 
     # -------------------------
     # Write template files
     # -------------------------
     files_map = {
-        "app/main.py": files.MAIN_PY,
-        "app/core/config.py": files.CONFIG_PY,
-        "app/utils/encryption.py": files.ENCRYPTION_PY,
-        "app/routers/health.py": files.HEALTH_ROUTER,
-        ".env": files.ENV_FILE,
-        "requirements.txt": files.REQUIREMENTS,
-        "pip.conf": files.PIP_CONF,
-        "Dockerfile": docker.DOCKERFILE,  # <-- Dockerfile added here
+        "app/main.py": "main_py",
+        "app/core/config.py": "config_py",
+        "app/utils/encryption.py": "encryption_py",
+        "app/utils/vault.py": "vault_py",
+        "app/routers/health.py": "health_router",
+        "tests/bench_settings.py": "bench_settings_py",
+        ".env": "env_file",
+        "requirements.txt": "requirements",
+        "pip.conf": "pip_conf",
+        "Dockerfile": "dockerfile",  # <-- Dockerfile added here
+        ".dockerignore": "dockerignore",
     }
 
-    for path, content in files_map.items():
-        dest = Path(path)
-        if not dest.exists():
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            dest.write_text(content)
-            console.print(f"📄 [green]{path} created[/green]")
+    created = []
+    for path, template in files_map.items():
+        if write_file(root / path, engine.render(template)):
+            created.append(path)
+    return created
+
+
+def init_project():
+    console.print("\n🎉 [bold green]Project Initialization[/bold green]\n")
+
+    # Ask user if DB is needed
+    need_db = questionary.confirm("Do you need DB connection?", default=True).ask()
+
+    with staged(), tracked(".") as lockfile:
+        created = create_project(".", need_db)
+
+    console.print("🚀 Project folders created successfully!")
+    for path in created:
+        verb = "updated" if path in lockfile.report[UPDATED] else "created"
+        console.print(f"📄 [green]{path} {verb}[/green]")
+
+    if lockfile.report[DRIFT]:
+        console.print("\n[yellow]⚠️ Modified locally, not overwritten:[/yellow]")
+        for path in lockfile.report[DRIFT]:
+            console.print(f"  • {path}")
+    console.print(f"🔒 .zackry-lock: {lockfile.summary()}")
 
     console.print("\n💡 Next steps:")
     console.print("  1. pip install -r requirements.txt")
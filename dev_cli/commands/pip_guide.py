@@ -1,5 +1,9 @@
 # cnb_cli/templates/pip_guide.py
 
+from rich.console import Console
+
+console = Console()
+
 PIP_GUIDE = """\
 # ----------------------------
 # Zackry / FastAPI & Python Pip Guide
@@ -112,3 +116,7 @@ tail -f logs/app.log                 # Follow logs (if logging configured)
 # ----------------------------
 
 """
+
+
+def show_guide():
+    console.print(PIP_GUIDE)
@@ -1,5 +1,11 @@
 # cnb_cli/commands/request.py
 
+import hashlib
+import os
+import tempfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
 import questionary
 from pathlib import Path
 from openpyxl import Workbook
@@ -7,8 +13,10 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.spinner import Spinner
-from dotenv import dotenv_values
-import time
+from dev_cli.templates import engine, request as _letter_templates  # noqa: F401 (registers templates)
+from dev_cli.utils.encryption import KEY_VARS, KEYRING_VAR, decrypt_many, keyring, split_keyring, split_tokens
+from dev_cli.utils.envfile import EnvFile
+from dev_cli.utils.history import RequestHistory
 
 console = Console()
 
@@ -16,61 +24,212 @@ console = Console()
 # ----------------------------
 # Load .env variables
 # ----------------------------
-def load_env(path: str = ".env") -> dict:
+def load_env(path: str = ".env") -> EnvFile:
+    """Parse the env file once; empty when missing (the snapshot reuses it)"""
     env_path = Path(path)
     if not env_path.exists():
         console.print(f"[red]❌ .env file not found at {path}![/red]")
-        return {}
-    return dotenv_values(env_path)
+    return EnvFile.load(env_path, missing_ok=True)
 
 
 # ----------------------------
 # Generate Excel file path
 # ----------------------------
-def get_excel_path(environment: str, job_name: str) -> Path:
+def get_excel_path(environment: str, job_name: str, req_type: str | None = None) -> Path:
     safe_job = job_name.replace(" ", "_")
+    if req_type:  # batches may hold several request types for one job
+        safe_job += "_" + req_type.lower().replace(" ", "_")
     return Path(f"{environment}_{safe_job}_env.xlsx")
 
 
 # ----------------------------
-# Save env data to Excel
+# Export to Excel (streaming)
 # ----------------------------
+ENV_SHEET = "Environment Variables"
+LETTER_SHEET = "Request Letter"
+PREVIEW_ROWS = 50
+
+
+def write_workbook(file_path: Path, sheets) -> Path:
+    """
+    Write (title, header, rows) sheets in one pass. Write-only worksheets
+    stream rows to disk, so memory stays flat however large the config is.
+    The file is replaced atomically.
+    """
+    file_path = Path(file_path)
+    wb = Workbook(write_only=True)
+    for title, header, rows in sheets:
+        ws = wb.create_sheet(title)
+        ws.append(header)
+        for row in rows:
+            ws.append(row)
+
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        wb.save(tmp)
+        os.replace(tmp, file_path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return file_path
+
+
+def _letter_sheet(letter: str):
+    return LETTER_SHEET, [LETTER_SHEET], ([line] for line in letter.splitlines())
+
+
+def export_request(file_path: Path, env_data=None, letter: str | None = None) -> Path:
+    """
+    Env vars and/or the request letter as separate sheets of one workbook.
+    `env_data` may be a dict or any iterable of pairs.
+    """
+    sheets = []
+    if env_data is not None:
+        rows = env_data.items() if isinstance(env_data, dict) else env_data
+        sheets.append((ENV_SHEET, ["Name", "Value"], rows))
+    if letter is not None:
+        sheets.append(_letter_sheet(letter))
+    return write_workbook(file_path, sheets)
+
+
 def save_env_to_excel(file_path: Path, env_data: dict):
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Environment Variables"
+    export_request(file_path, env_data)
+
+
+# ----------------------------
+# Multi-environment export
+# ----------------------------
+ENV_FILES = {"DEV": ".env.dev", "UAT": ".env.uat", "PROD": ".env.prod"}
+ALL_ENVIRONMENTS = "ALL (DEV/UAT/PROD + diff)"
+DIFF_SHEET = "Diff"
+
+
+def env_file_for(environment: str) -> Path:
+    """`.env.<env>` when it exists, otherwise `.env`"""
+    path = Path(ENV_FILES.get(environment, ".env"))
+    return path if path.exists() else Path(".env")
+
+
+def digest_key(key: str) -> bytes:
+    """Secret for snapshot digests, derived from the primary KEY (empty without one)"""
+    primary = split_keyring(key or "")[:1]
+    return hashlib.blake2b(primary[0].encode(), digest_size=32, person=b"zackry-digest").digest() if primary else b""
+
+
+def _digests(plain: dict, hash_key: bytes) -> dict:
+    return {k: hashlib.blake2b(v.encode(), digest_size=16, key=hash_key).digest() for k, v in plain.items()}
+
 
-    # Header
-    ws.append(["Name", "Value"])
+def load_snapshot(path: Path, env: EnvFile | None = None, compare_key: bytes | None = None) -> dict:
+    """
+    Raw values of one env file plus a digest per key. Digests are taken
+    over decrypted values, so re-encrypting an unchanged value (Fernet
+    tokens differ every time) is not reported as a change. They are keyed
+    with a secret derived from KEY, so the history never holds plain hashes
+    of decrypted secrets. `compare_key` adds "compare" digests under a key
+    shared across snapshots (environments each have their own KEY).
+    """
+    env = env if env is not None else EnvFile.load(path, missing_ok=True)
+    values = {k: v for k, v in env.items() if k not in KEY_VARS}
+    key = keyring(env.get("KEY", ""), env.get(KEYRING_VAR, ""))
+    tokens, _ = split_tokens(values)
+    plain = {**values, **decrypt_many(tokens, key)} if key and tokens else values
+    snapshot = {"path": str(path), "exists": Path(path).exists(), "values": values,
+                "digests": _digests(plain, digest_key(key))}
+    if compare_key is not None:
+        snapshot["compare"] = _digests(plain, compare_key)
+    return snapshot
 
-    for k, v in env_data.items():
-        ws.append([k, v])
 
-    wb.save(file_path)
+def load_environments(files: dict | None = None) -> dict:
+    """Load every environment's file concurrently; {env: snapshot} in `files` order"""
+    files = files or ENV_FILES
+    compare_key = os.urandom(32)  # lives only as long as this comparison
+    with ThreadPoolExecutor(max_workers=len(files)) as pool:
+        futures = {env: pool.submit(load_snapshot, Path(path), compare_key=compare_key)
+                   for env, path in files.items()}
+    return {env: future.result() for env, future in futures.items()}
+
+
+def diff_environments(snapshots: dict) -> list[tuple]:
+    """
+    Added / removed / changed keys between consecutive environments
+    (DEV -> UAT -> PROD), in one pass over the union of keys.
+    Rows: (name, change, from env, to env, old value, new value).
+    """
+    envs = list(snapshots)
+    pairs = list(zip(envs, envs[1:]))
+    names = list(dict.fromkeys(k for snap in snapshots.values() for k in snap["values"]))
+
+    rows = []
+    for name in names:
+        for before, after in pairs:
+            old = snapshots[before]["compare"].get(name)
+            new = snapshots[after]["compare"].get(name)
+            if old == new:
+                continue
+            change = "added" if old is None else "removed" if new is None else "changed"
+            rows.append((name, change, before, after,
+                         snapshots[before]["values"].get(name, ""), snapshots[after]["values"].get(name, "")))
+    return rows
+
+
+def export_environments(file_path: Path, snapshots: dict, diff: list[tuple], letter: str | None = None) -> Path:
+    """One workbook: a sheet per environment, the diff, and optionally the letter"""
+    sheets = [(env, ["Name", "Value"], snap["values"].items()) for env, snap in snapshots.items()]
+    sheets.append((DIFF_SHEET, ["Name", "Change", "From", "To", "Old Value", "New Value"], diff))
+    if letter is not None:
+        sheets.append(_letter_sheet(letter))
+    return write_workbook(file_path, sheets)
+
+
+def show_diff(diff: list[tuple]):
+    counts = Counter(row[1] for row in diff)
+    console.print(f"\n🔍 Diff: [green]{counts['added']} added[/green], "
+                  f"[red]{counts['removed']} removed[/red], [yellow]{counts['changed']} changed[/yellow]")
+    if not diff:
+        return
+    table = Table(title="Changes between environments", show_lines=True)
+    for column in ("Name", "Change", "From → To"):
+        table.add_column(column, style="cyan" if column == "Name" else None)
+    for name, change, before, after, _, _ in diff[:PREVIEW_ROWS]:
+        table.add_row(name, change, f"{before} → {after}")
+    if len(diff) > PREVIEW_ROWS:
+        table.add_row("...", f"{len(diff) - PREVIEW_ROWS} more", "")
+    console.print(table)
 
 
 # ----------------------------
 # Generate Request Letter
 # ----------------------------
-def generate_request_letter(req_type, environment, job, path, docker_image="<replace-with-docker-image>"):
-    letter = f"""
-Dear IT Team,
+DEFAULT_DOCKER_IMAGE = "<replace-with-docker-image>"
+
 
-1. I would like to request {req_type} as below path:
-+ {environment}
-{path}
-Note: Please refer to the attachment file for configuration
+def generate_request_letter(req_type, environment, job, path, docker_image=DEFAULT_DOCKER_IMAGE):
+    return engine.render("request_letter", req_type=req_type, environment=environment, job=job,
+                         path=path, docker_image=docker_image).strip()
 
-2. Build xxx Version
-  - Group: xxxxx
-  - Pipeline: {job}
-  - Environment: {environment}
-  - Docker_Image: {docker_image}
 
-Best Regards,
-Your Name
-"""
-    return letter.strip()
+# ----------------------------
+# Request history
+# ----------------------------
+def record_request(req_type, environment, job, path, snapshot: dict, output, docker_image=DEFAULT_DOCKER_IMAGE,
+                   history: RequestHistory | None = None) -> dict:
+    """Append an exported request (with its env snapshot) to the request history"""
+    history = history or RequestHistory()
+    return history.append({
+        "request_type": req_type,
+        "environment": environment,
+        "job": job,
+        "path": path,
+        "docker_image": docker_image,
+        "env_file": snapshot["path"],
+        "output": str(output),
+        "values": snapshot["values"],
+        "digests": {k: v.hex() for k, v in snapshot["digests"].items()},
+    })
 
 
 # ----------------------------
@@ -99,7 +258,7 @@ def request_menu():
 
     environment = questionary.select(
         "Select target environment",
-        choices=["DEV", "UAT", "PROD"]
+        choices=["DEV", "UAT", "PROD", ALL_ENVIRONMENTS]
     ).ask()
 
     # Default job: short name of API or repo
@@ -111,34 +270,35 @@ def request_menu():
     path = questionary.text("Enter path (for CI/CD)", default=default_path).ask()
 
     # Default username & password (from .env or placeholders)
-    env_vars = load_env()
+    env_path = env_file_for(environment)
+    env_vars = load_env(env_path)
     default_username = env_vars.get("USERNAME", "your_AD_user")
     default_password = env_vars.get("PASSWORD", "your_password")
 
     username = questionary.text("Enter username", default=default_username).ask()
     password = questionary.password("Enter password", default=default_password).ask()
 
+    if environment == ALL_ENVIRONMENTS:
+        return multi_environment_request(req_type, job, path)
+
     # ----------------------------
     # Preview .env Variables
     # ----------------------------
+    save_vars = False
     if env_vars:
         table = Table(title=f"{environment} Environment Variables", show_lines=True)
         table.add_column("Name", style="cyan", no_wrap=True)
         table.add_column("Value", style="magenta")
 
-        for k, v in env_vars.items():
+        for k, v in list(env_vars.items())[:PREVIEW_ROWS]:
             table.add_row(k, v)
+        if len(env_vars) > PREVIEW_ROWS:
+            table.add_row("...", f"{len(env_vars) - PREVIEW_ROWS} more")
 
         console.print("\nPreview of environment variables:")
         console.print(table)
 
-        save_excel = questionary.confirm("Save these variables to Excel?", default=True).ask()
-        if save_excel:
-            excel_file = get_excel_path(environment, job)
-            with console.status("⠋ Saving Excel...", spinner="dots"):
-                time.sleep(1)  # simulate processing
-                save_env_to_excel(excel_file, env_vars)
-            console.print(f"✅ Excel saved: {excel_file}\n")
+        save_vars = questionary.confirm("Save these variables to Excel?", default=True).ask()
 
     # ----------------------------
     # Request Letter Preview
@@ -146,12 +306,40 @@ def request_menu():
     letter = generate_request_letter(req_type, environment, job, path)
     console.print(Panel.fit(letter, title="Request Preview", style="green"))
 
-    # Confirm to save request (Excel or letter if needed)
-    save_request = questionary.confirm("Do you want to save this request letter to Excel?", default=True).ask()
-    if save_request:
+    save_letter = questionary.confirm("Do you want to save this request letter to Excel?", default=True).ask()
+
+    # One workbook, one pass: variables and letter on their own sheets
+    if save_vars or save_letter:
         excel_file = get_excel_path(environment, job)
-        with console.status("⠋ Saving request...", spinner="dots"):
-            time.sleep(1)
-            save_env_to_excel(excel_file, {"Request Letter": letter})
+        with console.status("⠋ Saving Excel...", spinner="dots"):
+            export_request(excel_file, env_vars.to_dict() if save_vars else None, letter if save_letter else None)
+            record_request(req_type, environment, job, path, load_snapshot(env_path, env_vars), excel_file)
         console.print(f"✅ Request saved to {excel_file}")
 
+
+# ----------------------------
+# Request for every environment at once
+# ----------------------------
+def multi_environment_request(req_type: str, job: str, path: str):
+    with console.status("⠋ Loading environments...", spinner="dots"):
+        snapshots = load_environments()
+        diff = diff_environments(snapshots)
+
+    for env, snap in snapshots.items():
+        if snap["exists"]:
+            console.print(f"✅ {env}: {snap['path']} ({len(snap['values'])} variables)")
+        else:
+            console.print(f"[yellow]⚠️ {env}: {snap['path']} not found, treated as empty[/yellow]")
+    show_diff(diff)
+
+    letter = generate_request_letter(req_type, "/".join(snapshots), job, path)
+    console.print(Panel.fit(letter, title="Request Preview", style="green"))
+
+    if questionary.confirm("Save environments, diff and letter to Excel?", default=True).ask():
+        excel_file = get_excel_path("ALL", job)
+        with console.status("⠋ Saving Excel...", spinner="dots"):
+            export_environments(excel_file, snapshots, diff, letter)
+            history = RequestHistory()
+            for env, snap in snapshots.items():
+                record_request(req_type, env, job, path, snap, excel_file, history=history)
+        console.print(f"✅ Request saved to {excel_file}")
@@ -0,0 +1,290 @@
+# dev_cli/commands/request_batch.py
+"""
+Generate many request letters from a JSONL or CSV job list.
+
+    zackry requests jobs.jsonl                      # one workbook per job
+    zackry requests jobs.csv --consolidated release.xlsx
+    zackry requests jobs.jsonl --force --workers 8
+
+Each job has: request_type, environment, job, path and optionally
+docker_image and env_file (defaults to .env.<environment>, then .env).
+The list is streamed: letters are rendered from one shared compiled
+template and workbooks are written on a process pool with a bounded
+number of jobs in flight. A job whose inputs (fields, env file content,
+letter template) match the last run is skipped.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from dev_cli.commands.request import (
+    DEFAULT_DOCKER_IMAGE, LETTER_SHEET, env_file_for, export_request, get_excel_path, load_snapshot,
+    record_request, write_workbook,
+)
+from dev_cli.templates import engine
+from dev_cli.templates.request import LETTER_VERSION
+from dev_cli.utils.encryption import KEY_VARS
+from dev_cli.utils.envfile import EnvFile
+from dev_cli.utils.history import RequestHistory
+
+console = Console()
+
+STATE_NAME = ".zackry-requests.json"
+REQUEST_TYPES = ("Add Config Map", "Delete Config Map", "Update Config Map")
+FIELDS = ("request_type", "environment", "job", "path", "docker_image", "env_file")
+ALIASES = {"type": "request_type", "env": "environment", "image": "docker_image", "pipeline": "job"}
+
+
+class JobError(ValueError):
+    """Raised for job lists that cannot be read or contain invalid jobs"""
+
+
+# ----------------------------
+# Reading jobs
+# ----------------------------
+def _normalise(raw: dict, where: str) -> dict:
+    job = {}
+    for name, value in raw.items():
+        if name is None:  # csv.DictReader: more fields than the header
+            raise JobError(f"{where}: too many fields")
+        name = ALIASES.get(name.strip().lower(), name.strip().lower())
+        if name in FIELDS and value not in (None, ""):
+            job[name] = str(value).strip()
+
+    missing = [f for f in ("request_type", "environment", "job") if f not in job]
+    if missing:
+        raise JobError(f"{where}: missing {', '.join(missing)}")
+    if job["request_type"] not in REQUEST_TYPES:
+        raise JobError(f"{where}: unknown request_type '{job['request_type']}' (use {', '.join(REQUEST_TYPES)})")
+    job["environment"] = job["environment"].upper()
+    job.setdefault("path", "")
+    job.setdefault("docker_image", DEFAULT_DOCKER_IMAGE)
+    return job
+
+
+def read_jobs(path: str | Path):
+    """Stream jobs from a .jsonl or .csv file"""
+    path = Path(path)
+    if not path.is_file():
+        raise JobError(f"{path} not found")
+
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.suffix.lower() == ".csv":
+            for number, row in enumerate(csv.DictReader(f), start=2):
+                yield _normalise(row, f"{path.name}:{number}")
+            return
+        for number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                raw = json.loads(line)
+            except ValueError as e:
+                raise JobError(f"{path.name}:{number}: invalid JSON ({e})") from None
+            if not isinstance(raw, dict):
+                raise JobError(f"{path.name}:{number}: expected an object")
+            yield _normalise(raw, f"{path.name}:{number}")
+
+
+# ----------------------------
+# Change detection
+# ----------------------------
+def _file_digest(path: Path, cache: dict) -> str:
+    if path not in cache:
+        cache[path] = hashlib.sha256(path.read_bytes()).hexdigest() if path.is_file() else "missing"
+    return cache[path]
+
+
+def job_digest(job: dict, env_digest: str) -> str:
+    payload = json.dumps({"job": job, "env": env_digest, "letter": LETTER_VERSION}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def load_state(out_dir: Path) -> dict:
+    try:
+        return json.loads((out_dir / STATE_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(out_dir: Path, state: dict) -> None:
+    path = out_dir / STATE_NAME
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(state, indent=2, sort_keys=True))
+    os.replace(tmp, path)
+
+
+def _env_rows(env_file: str) -> list[tuple]:
+    return [(k, v) for k, v in EnvFile.load(env_file, missing_ok=True).items() if k not in KEY_VARS]
+
+
+def write_job(output: str, env_file: str, letter: str) -> dict:
+    """Write one job's workbook; runs in a worker process"""
+    start = time.perf_counter()
+    try:
+        export_request(Path(output), _env_rows(env_file), letter)
+        return {"output": output, "error": None, "seconds": time.perf_counter() - start}
+    except Exception as e:
+        return {"output": output, "error": str(e), "seconds": time.perf_counter() - start}
+
+
+# ----------------------------
+# Batch
+# ----------------------------
+def prepare_jobs(jobs_file: str):
+    """Stream (job, letter): env file resolved, letter rendered from the shared compiled template"""
+    template = engine.get("request_letter")
+    for job in read_jobs(jobs_file):
+        job["env_file"] = job.get("env_file") or str(env_file_for(job["environment"]))
+        yield job, template.render({"req_type": job["request_type"], **job}).strip()
+
+
+def job_output(out: Path, job: dict) -> str:
+    return str(out / get_excel_path(job["environment"], job["job"], job["request_type"]))
+
+
+def check_jobs(jobs_file: str, out: Path | None = None) -> int:
+    """
+    Validate the job list in one streaming pass and return its size. With
+    `out`, two jobs writing the same workbook are rejected before anything
+    is written.
+    """
+    targets, count = {}, 0
+    for count, job in enumerate(read_jobs(jobs_file), start=1):
+        if out is None:
+            continue
+        output = job_output(out, job)
+        if output in targets:
+            raise JobError(f"jobs {targets[output]} and {count} both write {output}")
+        targets[output] = count
+    return count
+
+
+def run_batch(jobs_file: str, out_dir: str = ".", consolidated: str | None = None,
+              workers: int | None = None, force: bool = False) -> bool:
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    try:
+        total = check_jobs(jobs_file, None if consolidated else out)
+    except JobError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        return False
+    if not total:
+        console.print("[yellow]⚠️ No jobs found[/yellow]")
+        return False
+
+    start = time.perf_counter()
+    state = {} if force else load_state(out)
+    if consolidated:
+        return run_consolidated(jobs_file, out, out / consolidated, state, start)
+
+    workers = workers or max(1, min(total, os.cpu_count() or 1))
+    console.print(f"\n🎫 [bold cyan]Batch requests[/bold cyan]: {total} job(s), {workers} worker(s)\n")
+
+    digests, new_state, skipped, results, pending = {}, {}, [], [], {}
+    record = job_recorder()
+
+    def collect(result: dict, job: dict) -> None:
+        results.append(result)
+        if not result["error"]:
+            record(job)
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for job, letter in prepare_jobs(jobs_file):
+            output = job_output(out, job)
+            digest = job_digest(job, _file_digest(Path(job["env_file"]), digests))
+            job["output"] = output
+            new_state[output] = digest
+            if state.get(output) == digest and Path(output).exists():
+                skipped.append(output)
+                continue
+            if pool is None:
+                collect(write_job(output, job["env_file"], letter), job)
+                continue
+            # Bounded in flight: the job list is never held in memory as a whole
+            while len(pending) >= workers * 2:
+                for future in wait(pending, return_when=FIRST_COMPLETED).done:
+                    collect(future.result(), pending.pop(future))
+            pending[pool.submit(write_job, output, job["env_file"], letter)] = job
+        for future in as_completed(list(pending)):
+            collect(future.result(), pending.pop(future))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    failed = {r["output"] for r in results if r["error"]}
+    save_state(out, {**state, **{k: v for k, v in new_state.items() if k not in failed}})
+
+    table = Table(title="Batch summary")
+    table.add_column("Workbook", style="cyan")
+    table.add_column("Status")
+    for r in sorted(results, key=lambda r: r["output"]):
+        table.add_row(r["output"], f"[red]{r['error']}[/red]" if r["error"] else "[green]written[/green]")
+    for output in skipped:
+        table.add_row(output, "[dim]unchanged[/dim]")
+    console.print(table)
+
+    elapsed = time.perf_counter() - start
+    console.print(f"\n✨ {len(results) - len(failed)} written, {len(skipped)} skipped, {len(failed)} failed "
+                  f"in {elapsed:.2f}s\n")
+    return not failed
+
+
+def run_consolidated(jobs_file: str, out: Path, target: Path, state: dict, start: float) -> bool:
+    """One workbook for the whole batch; the job list is streamed twice (digest, then write)"""
+    digests, env_files, count = {}, {}, 0
+    combined = hashlib.sha256()
+    for count, (job, _) in enumerate(prepare_jobs(jobs_file), start=1):
+        combined.update(job_digest(job, _file_digest(Path(job["env_file"]), digests)).encode())
+        env_files[job["env_file"]] = None
+    digest = combined.hexdigest()
+    if state.get(str(target)) == digest and target.exists():
+        console.print(f"[green]✔ {target} is up to date ({count} jobs)[/green]")
+        return True
+
+    write_consolidated(target, prepare_jobs(jobs_file), list(env_files))
+    record = job_recorder()
+    for job, _ in prepare_jobs(jobs_file):
+        record({**job, "output": str(target)})
+    save_state(out, {**state, str(target): digest})
+    console.print(f"[green]✅ {count} request(s) written to {target} "
+                  f"in {time.perf_counter() - start:.2f}s[/green]")
+    return True
+
+
+def job_recorder():
+    """Return record(job), appending written jobs to the request history (one snapshot per env file)"""
+    history, snapshots = None, {}
+
+    def record(job: dict) -> None:
+        nonlocal history
+        history = history or RequestHistory()
+        if job["env_file"] not in snapshots:
+            snapshots[job["env_file"]] = load_snapshot(Path(job["env_file"]))
+        record_request(job["request_type"], job["environment"], job["job"], job["path"],
+                       snapshots[job["env_file"]], job["output"], job["docker_image"], history=history)
+    return record
+
+
+def write_consolidated(path: Path, jobs, env_files: list[str]) -> Path:
+    """
+    One workbook for the whole batch: a summary sheet with every letter
+    (rows streamed from `jobs`, an iterable of (job, letter)), and one sheet
+    per distinct env file.
+    """
+    summary = ("Requests", ["Request Type", "Environment", "Job", "Path", "Docker Image", LETTER_SHEET],
+               ((j["request_type"], j["environment"], j["job"], j["path"], j["docker_image"], letter)
+                for j, letter in jobs))
+    sheets = [summary]
+    for env_file in env_files:
+        title = Path(env_file).name.lstrip(".")[:31] or "env"
+        sheets.append((title, ["Name", "Value"], _env_rows(env_file)))
+    return write_workbook(path, sheets)
@@ -0,0 +1,88 @@
+# dev_cli/commands/secure_file.py
+"""
+Encrypt / decrypt large files (TLS bundles, DB dumps, keytabs) in
+constant memory with the KEY from .env.
+
+    zackry crypt-file encrypt backup.sql            -> backup.sql.zkf
+    zackry crypt-file decrypt backup.sql.zkf        -> backup.sql
+    zackry crypt-file decrypt big.zkf --chunks 10:20 -o part.bin
+"""
+
+import sys
+from pathlib import Path
+
+from rich.console import Console
+from rich.progress import BarColumn, DownloadColumn, Progress, TransferSpeedColumn
+
+from dev_cli.utils.encryption import KEYRING_VAR, keyring
+from dev_cli.utils.envfile import EnvFile
+from dev_cli.utils.filecrypt import (
+    DEFAULT_CHUNK_SIZE, SUFFIX, FileCryptError, chunk_info, decrypt_file, encrypt_file, iter_decrypt,
+)
+
+console = Console(stderr=True)
+
+
+def _load_keyring(key_file: str) -> str | None:
+    if not Path(key_file).is_file():
+        console.print(f"[red]❌ {key_file} not found! Generate a key first.[/red]")
+        return None
+    env = EnvFile.load(key_file)
+    if not env.get("KEY"):
+        console.print(f"[red]❌ KEY not found in {key_file}! Generate a key first.[/red]")
+        return None
+    return keyring(env["KEY"], env.get(KEYRING_VAR, ""))
+
+
+def _parse_chunks(spec: str) -> tuple[int, int | None]:
+    """'3' -> (3, 3), '3:' -> (3, None), '3:9' -> (3, 9)"""
+    first, sep, last = spec.partition(":")
+    start = int(first or 0)
+    if not sep:
+        return start, start
+    return start, int(last) if last else None
+
+
+def crypt_file(action: str, path: str, output: str | None = None, key_file: str = ".env",
+               chunk_size: int = DEFAULT_CHUNK_SIZE, chunks: str | None = None) -> bool:
+    src = Path(path)
+    if not src.is_file():
+        console.print(f"[red]❌ {path} not found[/red]")
+        return False
+    key = _load_keyring(key_file)
+    if key is None:
+        return False
+
+    try:
+        if action == "encrypt":
+            dst = Path(output) if output else src.with_name(src.name + SUFFIX)
+            total, run = src.stat().st_size, lambda cb: encrypt_file(src, dst, key, chunk_size, on_progress=cb)
+        elif action == "decrypt" and chunks:
+            first, last = _parse_chunks(chunks)
+            out = open(output, "wb") if output else sys.stdout.buffer
+            try:
+                for block in iter_decrypt(src, key, first, last):
+                    out.write(block)
+            finally:
+                if output:
+                    out.close()
+            return True
+        elif action == "decrypt":
+            dst = Path(output) if output else (src.with_suffix("") if src.suffix == SUFFIX else src.with_name(src.name + ".out"))
+            info = chunk_info(src)
+            total, run = info["bytes"], lambda cb: decrypt_file(src, dst, key, on_progress=cb)
+        else:
+            console.print(f"[red]❌ Unknown action '{action}' (use encrypt or decrypt)[/red]")
+            return False
+
+        with Progress("[cyan]{task.description}", BarColumn(), DownloadColumn(), TransferSpeedColumn(),
+                      console=console, transient=True) as progress:
+            task = progress.add_task(f"{action.title()}ing {src.name}", total=total)
+            stats = run(lambda n: progress.advance(task, n))
+    except (FileCryptError, ValueError) as e:
+        console.print(f"[red]❌ {e}[/red]")
+        return False
+
+    console.print(f"[green]✅ {action.title()}ed[/green] {src} → {dst} "
+                  f"({stats['bytes'] / (1024 * 1024):.1f} MB in {stats['seconds']:.2f}s, {stats['mb_s']:.0f} MB/s)")
+    return True
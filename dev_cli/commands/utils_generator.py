@@ -3,7 +3,9 @@ from pathlib import Path
 from rich.console import Console
 import questionary
 
-from cnb_cli.utils.helper import create_file, modify_file
+from dev_cli.utils.helper import create_file, modify_file
+from dev_cli.utils.lock import tracked
+from dev_cli.utils.vfs import staged
 
 console = Console()
 
@@ -61,6 +63,22 @@ class RedisService:
 }
 
 
+def create_utils(util_type: str, root: str | Path = ".") -> dict:
+    """Create the config/utils files for `util_type` under `root`; return its template"""
+    root = Path(root)
+    template = UTILS_TEMPLATES[util_type]
+
+    # Create config and utils files
+    create_file(str(root / template["config_file"]), template["placeholder_content"])
+    create_file(str(root / template["utils_file"]), template["placeholder_content"])
+
+    # Update .env and requirements.txt
+    modify_file(str(root / ".env"), f"{util_type.upper()}_CONFIG_PLACEHOLDER=1\n")
+    for req in template["requirements"]:
+        modify_file(str(root / "requirements.txt"), f"{req}\n")
+    return template
+
+
 def generate_utils():
     console.print("🔧 [bold cyan]Utility Generation[/bold cyan]\n")
 
@@ -71,16 +89,8 @@ def generate_utils():
 
     console.print(f"🚀 Generating {util_type} utility...\n")
 
-    template = UTILS_TEMPLATES[util_type]
-
-    # Create config and utils files
-    create_file(template["config_file"], template["placeholder_content"])
-    create_file(template["utils_file"], template["placeholder_content"])
-
-    # Update .env and requirements.txt
-    modify_file(".env", f"{util_type.upper()}_CONFIG_PLACEHOLDER=1\n")
-    for req in template["requirements"]:
-        modify_file("requirements.txt", f"{req}\n")
+    with staged(), tracked("."):
+        template = create_utils(util_type)
 
     console.print(f"✨ Successfully generated {util_type} utility!")
     console.print(f"📁 File created:\n  • Utility: {template['utils_file']}")
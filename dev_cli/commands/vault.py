@@ -0,0 +1,107 @@
+# dev_cli/commands/vault.py
+"""
+Import / export .env files to an indexed, encrypted vault.
+
+    zackry vault import .env -o secrets.vault
+    zackry vault get secrets.vault DATABASE_URL
+    zackry vault export secrets.vault -o .env [--encrypt]
+"""
+
+from pathlib import Path
+
+from rich.console import Console
+
+from dev_cli.utils.encryption import (
+    CIPHER_VAR, DEFAULT_CIPHER, KEY_VARS, KEYRING_VAR, decrypt_many, encrypt_many, keyring, split_tokens,
+)
+from dev_cli.utils.envfile import EnvFile
+from dev_cli.utils.vault import Vault, VaultError, write_vault
+
+console = Console()
+
+DEFAULT_VAULT = "secrets.vault"
+
+
+def _load_keyring(key_file: str) -> str | None:
+    env = EnvFile.load(key_file, missing_ok=True)
+    if not env.get("KEY"):
+        console.print(f"[red]❌ KEY not found in {key_file}! Generate a key first.[/red]")
+        return None
+    return keyring(env["KEY"], env.get(KEYRING_VAR, ""))
+
+
+def import_env(source: str = ".env", output: str = DEFAULT_VAULT, key_file: str = ".env") -> bool:
+    """Store every variable of `source` (Fernet values decrypted first) in a new vault"""
+    key = _load_keyring(key_file)
+    if key is None:
+        return False
+    if not Path(source).is_file():
+        console.print(f"[red]❌ {source} not found[/red]")
+        return False
+
+    values = {k: v for k, v in EnvFile.load(source).items() if k not in KEY_VARS}
+    tokens, _ = split_tokens(values)
+    plain = decrypt_many(tokens, key)
+    failed = [k for k, v in plain.items() if v == tokens[k]]
+    if failed:
+        console.print(f"[red]❌ {len(failed)} value(s) could not be decrypted with KEY / {KEYRING_VAR}: "
+                      f"{', '.join(failed)}[/red]")
+        return False
+
+    count = write_vault(output, {**values, **plain}, key)
+    console.print(f"[green]✅ {count} secret(s) imported from {source} into {output}[/green]")
+    return True
+
+
+def export_env(vault_path: str = DEFAULT_VAULT, output: str = ".env", key_file: str = ".env",
+               encrypt: bool = False) -> bool:
+    """Write every vault entry into `output` (existing lines, KEY and comments are kept)"""
+    key = _load_keyring(key_file)
+    if key is None:
+        return False
+    try:
+        with Vault(vault_path, key) as vault:
+            values = vault.to_dict()
+    except (OSError, VaultError) as e:
+        console.print(f"[red]❌ {e}[/red]")
+        return False
+
+    if encrypt:
+        cipher = EnvFile.load(key_file, missing_ok=True).get(CIPHER_VAR) or DEFAULT_CIPHER
+        values = encrypt_many(values, key, cipher)
+    env = EnvFile.load(output, missing_ok=True)
+    env.update(values)
+    env.save()
+    console.print(f"[green]✅ {len(values)} secret(s) exported from {vault_path} to {output}"
+                  f"{' (encrypted)' if encrypt else ''}[/green]")
+    return True
+
+
+def get_secret(vault_path: str, name: str, key_file: str = ".env") -> bool:
+    key = _load_keyring(key_file)
+    if key is None:
+        return False
+    try:
+        with Vault(vault_path, key) as vault:
+            value = vault.get(name)
+    except (OSError, VaultError) as e:
+        console.print(f"[red]❌ {e}[/red]")
+        return False
+    if value is None:
+        console.print(f"[yellow]⚠️ {name} not found in {vault_path}[/yellow]")
+        return False
+    print(value)
+    return True
+
+
+def vault_command(action: str, path: str | None = None, name: str | None = None, output: str | None = None,
+                  key_file: str = ".env", encrypt: bool = False) -> bool:
+    """`zackry vault import|export|get`"""
+    if action == "import":
+        return import_env(path or ".env", output or DEFAULT_VAULT, key_file)
+    if action == "export":
+        return export_env(path or DEFAULT_VAULT, output or ".env", key_file, encrypt)
+    if action == "get" and name:
+        return get_secret(path, name, key_file)
+    console.print("[red]❌ Use: vault import [ENV] | vault export [VAULT] | vault get VAULT NAME[/red]")
+    return False
@@ -1,20 +1,92 @@
-import typer
-from xxx_cli.commands.init import init_project
-from xxx_cli.commands.encrypt import encrypt_menu
-from xxx_cli.commands.docker import docker_menu
-from xxx_cli.commands.deploy import deploy_tool
-from xxx_cli.commands.generate import generate_menu
-from xxx_cli.commands.request import request_menu
-
-from xxx_cli.commands.pip_guide import PIP_GUIDE
+import functools
+import importlib
+from pathlib import Path
 
+import typer
 from rich.console import Console
-from rich.markup import escape
 
 app = typer.Typer(help="xxx CLI 🚀")
 
 console = Console()
 
+# ----------------------------
+# Lazy command registry
+# ----------------------------
+# name -> (module path, attribute, help)
+# Command modules (and their heavy dependencies: cryptography, openpyxl,
+# questionary, ...) are imported only when the command actually runs.
+COMMANDS = {
+    "i": ("dev_cli.commands.init", "init_project",
+          "[bold green]xxx i[/bold green] – Initialize a new FastAPI project ⚡"),
+    "init": ("dev_cli.commands.init", "init_project",
+             "[bold green]xxx init[/bold green] – Initialize a new FastAPI project ⚡"),
+    "e": ("dev_cli.commands.encrypt", "encrypt_menu",
+          "[bold yellow]xxx e[/bold yellow] – Encryption Tools 🔐"),
+    "b": ("dev_cli.commands.build", "build_command",
+          "[bold blue]xxx b[/bold blue] – Docker Build Tools 🐳"),
+    "d": ("dev_cli.commands.deploy", "deploy_tool",
+          "[bold magenta]xxx d[/bold magenta] – Docker Deployment Tool 🚀"),
+    "g": ("dev_cli.commands.generate", "generate_menu",
+          "[bold cyan]xxx g[/bold cyan] – Component Generator 🛠️"),
+    "r": ("dev_cli.commands.request", "request_menu",
+          "[bold red]xxx r[/bold red] – Request Management System 🎫"),
+    "apply": ("dev_cli.commands.apply", "apply_manifest",
+              "[bold green]xxx apply[/bold green] – Scaffold many services from a manifest 📜"),
+    "crypt": ("dev_cli.commands.bulk_env", "bulk_env",
+              "[bold yellow]xxx crypt[/bold yellow] – Bulk encrypt/decrypt many .env files 🔐"),
+    "crypt-file": ("dev_cli.commands.secure_file", "crypt_file",
+                   "[bold yellow]xxx crypt-file[/bold yellow] – Stream-encrypt large files with KEY 📦"),
+    "vault": ("dev_cli.commands.vault", "vault_command",
+              "[bold yellow]xxx vault[/bold yellow] – Indexed encrypted secrets vault 🗄️"),
+    "rotate": ("dev_cli.commands.bulk_env", "rotate_env",
+               "[bold yellow]xxx rotate[/bold yellow] – Rotate KEY and re-encrypt many .env files 🔑"),
+    "requests": ("dev_cli.commands.request_batch", "run_batch",
+                 "[bold red]xxx requests[/bold red] – Generate request letters from a job list 🎫"),
+    "history": ("dev_cli.commands.history", "history_command",
+                "[bold red]xxx history[/bold red] – Query the request history 📜"),
+    "image": ("dev_cli.commands.image_transfer", "image_command",
+              "[bold blue]xxx image[/bold blue] – Export / import compressed, split image archives 📦"),
+    "context": ("dev_cli.commands.context", "analyze_context",
+                "[bold blue]xxx context[/bold blue] – Analyze the Docker build context / write .dockerignore 🔍"),
+    "zackry": ("dev_cli.commands.pip_guide", "show_guide",
+               "[bold blue]xxx zackry[/bold blue] - Show Pip & FastAPI Guide / About the Creator"),
+}
+
+# name -> function declaring the command's arguments/options (see `options`)
+SIGNATURES = {}
+
+
+def load_command(name: str):
+    """Import the module backing a registered command and return its callable"""
+    module_path, attr, _ = COMMANDS[name]
+    return getattr(importlib.import_module(module_path), attr)
+
+
+def options(name: str):
+    """
+    Declare the CLI arguments/options of a registered command. The decorated
+    function is only a signature: its parameters are passed by name to the
+    command's callable, which is imported when the command runs.
+    """
+    def declare(signature):
+        SIGNATURES[name] = signature
+        return signature
+    return declare
+
+
+def _no_options(): ...
+
+
+def _register(name: str):
+    @functools.wraps(SIGNATURES.get(name, _no_options))
+    def command(**kwargs):
+        if load_command(name)(**kwargs) is False:
+            raise typer.Exit(1)
+
+    command.__name__ = name.replace("-", "_")
+    app.command(name, help=COMMANDS[name][2])(command)
+
+
 # ----------------------------
 # Callback for --helper or no command
 # ----------------------------
@@ -28,52 +100,119 @@ def main(ctx: typer.Context, helper: bool = typer.Option(False, "--helper", help
         raise typer.Exit()
 
 # ----------------------------
-# CLI Commands
+# Command arguments / options
 # ----------------------------
-
-@app.command("i")
-def i():
-    """[bold green]xxx i[/bold green] – Initialize a new FastAPI project ⚡"""
-    init_project()
-
-@app.command("init")
-def init():
-    """[bold green]xxx init[/bold green] – Initialize a new FastAPI project ⚡"""
-    init_project()
-
-@app.command("e")
-def e():
-    """[bold yellow]xxx e[/bold yellow] – Encryption Tools 🔐"""
-    encrypt_menu()
-
-@app.command("b")
-def b():
-    """[bold blue]xxx b[/bold blue] – Docker Build Tools 🐳"""
-    docker_menu()
-
-@app.command("d")
-def d():
-    """[bold magenta]xxx d[/bold magenta] – Docker Deployment Tool 🚀"""
-    deploy_tool()
-
-@app.command("g")
-def g():
-    """[bold cyan]xxx g[/bold cyan] – Component Generator 🛠️"""
-    generate_menu()
-
-@app.command("r")
-def r():
-    """[bold red]xxx r[/bold red] – Request Management System 🎫"""
-    request_menu()
-
-@app.command("zackry")
-def zackry():
-    """[bold blue]xxx zackry[/bold blue] - Show Pip & FastAPI Guide / About the Creator"""
-    console.print(PIP_GUIDE)
+@options("b")
+def _build(
+    all_images: bool = typer.Option(False, "--all", help="Build every service image (directories with a Dockerfile)"),
+    manifest: Path = typer.Option(None, "--manifest", "-m", help="Build the services of an apply manifest"),
+    workers: int = typer.Option(None, "--workers", "-w", help="Concurrent builds (default: 4)"),
+    tag: str = typer.Option("latest", "--tag", "-t", help="Tag for discovered images"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show the build plan only"),
+): ...
+
+
+@options("apply")
+def _apply(
+    manifest_path: Path = typer.Argument(..., metavar="MANIFEST", help="YAML/JSON manifest describing the services"),
+    workers: int = typer.Option(None, "--workers", "-w", help="Parallel workers (services generated, files written)"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Show a diff instead of writing files"),
+): ...
+
+
+@options("crypt")
+def _crypt(
+    action: str = typer.Argument(..., help="encrypt or decrypt"),
+    patterns: list[str] = typer.Argument(..., help="Files or globs, e.g. 'services/*/.env*'"),
+    workers: int = typer.Option(None, "--workers", "-w", help="Worker processes (default: CPU count)"),
+    key_file: str = typer.Option(".env", "--key-file", "-k", help="KEY for files that have none"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Report counts without writing files"),
+    cipher: str = typer.Option(None, "--cipher", "-c", help="fernet, aesgcm or chacha20 (default: KEY_CIPHER or fernet)"),
+): ...
+
+
+@options("crypt-file")
+def _crypt_file(
+    action: str = typer.Argument(..., help="encrypt or decrypt"),
+    path: str = typer.Argument(..., help="File to encrypt / decrypt"),
+    output: str = typer.Option(None, "--output", "-o", help="Output path (default: add/strip .zkf)"),
+    key_file: str = typer.Option(".env", "--key-file", "-k", help="File holding KEY / KEY_PREVIOUS"),
+    chunk_size: int = typer.Option(1024 * 1024, "--chunk-size", min=1, help="Plaintext bytes per chunk (encrypt)"),
+    chunks: str = typer.Option(None, "--chunks", help="Decrypt only chunks FIRST:LAST (to stdout without -o)"),
+): ...
+
+
+@options("vault")
+def _vault(
+    action: str = typer.Argument(..., help="import, export or get"),
+    path: str = typer.Argument(None, help="import: .env to read; export/get: vault file"),
+    name: str = typer.Argument(None, help="get: secret name"),
+    output: str = typer.Option(None, "--output", "-o", help="import: vault file; export: .env file"),
+    key_file: str = typer.Option(".env", "--key-file", "-k", help="File holding KEY / KEY_PREVIOUS"),
+    encrypt: bool = typer.Option(False, "--encrypt", help="export: write values Fernet-encrypted"),
+): ...
+
+
+@options("rotate")
+def _rotate(
+    patterns: list[str] = typer.Argument(..., help="Files or globs to re-encrypt, e.g. 'services/*/.env*'"),
+    workers: int = typer.Option(None, "--workers", "-w", help="Worker processes (default: CPU count)"),
+    key_file: str = typer.Option(".env", "--key-file", "-k", help="File holding KEY / KEY_PREVIOUS"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Report counts without writing files"),
+): ...
+
+
+@options("requests")
+def _requests(
+    jobs_file: str = typer.Argument(..., metavar="JOBS", help="JSONL or CSV job list"),
+    out_dir: str = typer.Option(".", "--out-dir", "-o", help="Where workbooks are written"),
+    consolidated: str = typer.Option(None, "--consolidated", help="Write one workbook with every request"),
+    workers: int = typer.Option(None, "--workers", "-w", help="Worker processes (default: CPU count)"),
+    force: bool = typer.Option(False, "--force", help="Regenerate jobs whose inputs have not changed"),
+): ...
+
+
+@options("history")
+def _history(
+    action: str = typer.Argument(..., help="list, last or compact"),
+    job: str = typer.Argument(None, help="Job name (required for last)"),
+    env: str = typer.Option(None, "--env", "-e", help="DEV, UAT or PROD"),
+    since: str = typer.Option(None, "--since", help="From date, e.g. 2026-01-01"),
+    until: str = typer.Option(None, "--until", help="Until date (inclusive)"),
+    limit: int = typer.Option(20, "--limit", "-n", help="list: newest N requests"),
+    keep: int = typer.Option(None, "--keep", help="compact: newest N requests per job and environment"),
+): ...
+
+
+@options("image")
+def _image(
+    action: str = typer.Argument(..., help="export or import"),
+    target: str = typer.Argument(..., help="export: IMAGE[:TAG]; import: archive file or any of its parts"),
+    out_dir: str = typer.Option(".", "--out-dir", "-o", help="export: where the archive is written"),
+    codec: str = typer.Option("gzip", "--codec", "-c", help="export: gzip, zstd or none"),
+    level: int = typer.Option(None, "--level", help="export: compression level (gzip 1-9, zstd 1-22)"),
+    split: str = typer.Option(None, "--split", help="export: part size, e.g. 1G"),
+    threads: int = typer.Option(0, "--threads", help="export: compression threads (0 = all CPUs)"),
+    no_verify: bool = typer.Option(False, "--no-verify", help="import: skip the SHA-256 check"),
+): ...
+
+
+@options("context")
+def _context(
+    root: str = typer.Argument(".", metavar="PATH", help="Build context directory"),
+    dockerfile: str = typer.Option("Dockerfile", "--file", "-f", help="Dockerfile name inside the context"),
+    depth: int = typer.Option(1, "--depth", help="Directory levels in the size breakdown"),
+    top: int = typer.Option(10, "--top", "-n", help="Rows per table"),
+    write: bool = typer.Option(False, "--write", help="Create or extend .dockerignore with the suggestions"),
+): ...
+
+
+for _name in COMMANDS:
+    _register(_name)
 
 
 def main():
-    app() 
+    app()
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,8 @@
 # cnb_cli/templates/docker.py
 
+from dev_cli.templates.engine import register
+from dev_cli.templates.project import TEMPLATE_VERSION
+
 DOCKERFILE = """\
 FROM nexus-mirror.xxxx.com/docker-proxy/python:3.10.12-slim
 
@@ -21,3 +24,83 @@ EXPOSE 443
 
 CMD ["gunicorn", "app.main:app", "--workers", "4", "--worker-class", "uvicorn.workers.UvicornWorker", "--bind", "0.0.0.0:80"]
 """
+
+# ----------------------------
+# .dockerignore (keeps the build context small; see `zackry context`)
+# ----------------------------
+DOCKERIGNORE = """\
+# Version control
+.git
+.gitignore
+
+# Python
+.venv
+venv
+**/__pycache__
+**/*.py[cod]
+**/*.egg-info
+.mypy_cache
+.pytest_cache
+.ruff_cache
+.coverage
+htmlcov
+dist
+build
+
+# zackry state and outputs (image exports, request workbooks)
+.zackry-*
+*.tar
+*.tar.*
+*.xlsx
+
+# Editors / OS
+.idea
+.vscode
+**/.DS_Store
+**/node_modules
+"""
+
+# ----------------------------
+# docker-compose.yml fragments
+# ----------------------------
+COMPOSE_APP = """
+version: '3.9'
+
+services:
+  app:
+    image: your-app-image
+    container_name: app
+    ports:
+      - "8000:8000"
+    environment:
+      - ENV=development
+"""
+
+COMPOSE_POSTGRES = """
+  postgres:
+    image: postgres:15
+    container_name: postgres
+    environment:
+      POSTGRES_USER: user
+      POSTGRES_PASSWORD: password
+      POSTGRES_DB: app_db
+    ports:
+      - "5432:5432"
+"""
+
+COMPOSE_REDIS = """
+  redis:
+    image: redis:7
+    container_name: redis
+    ports:
+      - "6379:6379"
+"""
+
+for _name, _source in {
+    "dockerfile": DOCKERFILE,
+    "dockerignore": DOCKERIGNORE,
+    "compose_app": COMPOSE_APP,
+    "compose_postgres": COMPOSE_POSTGRES,
+    "compose_redis": COMPOSE_REDIS,
+}.items():
+    register(_name, _source, version=TEMPLATE_VERSION)
@@ -0,0 +1,128 @@
+# dev_cli/templates/engine.py
+"""
+Named, versioned templates compiled once and cached.
+
+Templates use `$name` / `${name}` placeholders (`$$` for a literal `$`).
+Compiling turns a template into a `str.format` string, so rendering is a
+single `format_map` call. Compiled forms are cached in memory and on disk
+(keyed by name, version and source hash) so later processes skip compiling.
+
+    register("consumer_py", CONSUMER_PY, version="1")
+    render("consumer_py", module="kafka", ...)
+    render_many("component_stub", [{"kind": "models", "api_name": "user"}, ...])
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+_PLACEHOLDER = re.compile(r"\$(?:(\$)|\{([_a-zA-Z][_a-zA-Z0-9]*)\}|([_a-zA-Z][_a-zA-Z0-9]*))")
+
+
+def cache_dir() -> Path:
+    base = os.environ.get("ZACKRY_CACHE_DIR") or Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "zackry"
+    return Path(base) / "templates"
+
+
+def compile_source(source: str) -> tuple[str, list[str]]:
+    """Translate `$var` syntax into a str.format string; return it with its variables"""
+    out, names, pos = [], [], 0
+    for match in _PLACEHOLDER.finditer(source):
+        out.append(source[pos:match.start()].replace("{", "{{").replace("}", "}}"))
+        escaped, braced, bare = match.groups()
+        if escaped:
+            out.append("$")
+        else:
+            name = braced or bare
+            out.append("{" + name + "}")
+            if name not in names:
+                names.append(name)
+        pos = match.end()
+    out.append(source[pos:].replace("{", "{{").replace("}", "}}"))
+    return "".join(out), names
+
+
+class Template:
+    __slots__ = ("name", "version", "source", "_compiled", "variables")
+
+    def __init__(self, name: str, source: str, version: str = "1"):
+        self.name = name
+        self.version = version
+        self.source = source
+        self._compiled = None
+        self.variables: list[str] = []
+
+    @property
+    def key(self) -> str:
+        digest = hashlib.sha256(self.source.encode("utf-8")).hexdigest()[:16]
+        return f"{self.name}-{self.version}-{digest}"
+
+    def compile(self) -> str:
+        if self._compiled is not None:
+            return self._compiled
+
+        cached = cache_dir() / f"{self.key}.json"
+        try:
+            data = json.loads(cached.read_text())
+            self._compiled, self.variables = data["format"], data["variables"]
+            return self._compiled
+        except (OSError, ValueError, KeyError):
+            pass
+
+        self._compiled, self.variables = compile_source(self.source)
+        try:
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cached.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"format": self._compiled, "variables": self.variables}))
+            os.replace(tmp, cached)
+        except OSError:
+            pass  # read-only home / CI sandbox: the in-memory cache still applies
+        return self._compiled
+
+    def render(self, context: dict | None = None, **values) -> str:
+        return self.compile().format_map({**(context or {}), **values})
+
+    def render_many(self, contexts) -> list[str]:
+        """Render the same compiled template for every context"""
+        fmt = self.compile().format_map
+        return [fmt(ctx) for ctx in contexts]
+
+
+_registry: dict[str, Template] = {}
+
+
+def register(name: str, source: str, version: str = "1") -> Template:
+    template = _registry.get(name)
+    if template is None or template.source != source or template.version != version:
+        template = _registry[name] = Template(name, source, version)
+    return template
+
+
+def get(name: str) -> Template:
+    try:
+        return _registry[name]
+    except KeyError:
+        raise KeyError(f"Unknown template '{name}'") from None
+
+
+def names() -> list[str]:
+    return list(_registry)
+
+
+def render(name: str, context: dict | None = None, **values) -> str:
+    return get(name).render(context, **values)
+
+
+def render_many(name: str, contexts) -> list[str]:
+    return get(name).render_many(contexts)
+
+
+def clear_cache(disk: bool = False) -> None:
+    """Drop compiled forms (and optionally the on-disk cache)"""
+    for template in _registry.values():
+        template._compiled = None
+    if disk:
+        for path in cache_dir().glob("*.json"):
+            path.unlink(missing_ok=True)
@@ -1,3 +1,6 @@
+from dev_cli.templates.engine import register
+from dev_cli.templates.project import TEMPLATE_VERSION
+
 # ----------------------------
 # Main FastAPI Application
 # ----------------------------
@@ -37,50 +40,362 @@ async def on_shutdown():
 # Application Configuration
 # ----------------------------
 CONFIG_PY = """\
+import os
+from functools import lru_cache
+
+from dotenv import dotenv_values
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
-# from app.utils.encryption import decrypt_data
+
+from app.utils.encryption import decrypt_data, decrypt_many, keyring
+
+ENV_FILE = ".env"
+
 
 class AppConfig(BaseSettings):
-    # key: str = ""  # Optional encryption key
+    key: str = ""  # Encryption key; any value below may be stored encrypted
+    key_previous: str = ""  # Older keys still accepted while a rotation rolls out
     enable_log_request_header: bool = True
     enable_log_request_body: bool = True
     debug_mode: bool = False
 
     class Config:
-        env_file = ".env"
+        env_file = ENV_FILE
         extra = "ignore"
 
-    # def __init__(self, **values):
-    #     super().__init__(**values)
-    #     self.enable_log_request_header = decrypt_data(self.enable_log_request_header, self.key)
-    #     self.enable_log_request_body = decrypt_data(self.enable_log_request_body, self.key)
+    @model_validator(mode="before")
+    @classmethod
+    def decrypt_fields(cls, values: dict) -> dict:
+        # Declared (hot) fields are decrypted in one batch before validation
+        key = keyring(values.get("key"), values.get("key_previous"))
+        if not key:
+            return values
+        declared = {n.lower() for name, field in cls.model_fields.items()
+                    if name not in ("key", "key_previous")
+                    for n in (name, field.alias) if n}
+        # Undeclared .env entries also reach this validator; they are left to Secrets
+        encrypted = {k: v for k, v in values.items()
+                     if k.lower() in declared and isinstance(v, str)}
+        return {**values, **decrypt_many(encrypted, key)}
+
+    @property
+    def keyring(self) -> str:
+        return keyring(self.key, self.key_previous)
+
+
+class Secrets:
+    \"\"\"
+    Every other setting, decrypted on first access and memoised.
+    Boot only pays for the fields declared on AppConfig.
+    \"\"\"
+
+    def __init__(self, key: str, env_file: str = ENV_FILE):
+        self._key = key
+        self._raw = {**dotenv_values(env_file), **os.environ}
+        self._plain = {}
+
+    def get(self, name: str, default=None):
+        if name not in self._plain:
+            if name not in self._raw:
+                return default
+            self._plain[name] = decrypt_data(self._raw[name], self._key)
+        return self._plain[name]
 
-settings = AppConfig()
+    def __getitem__(self, name: str):
+        value = self.get(name, self)
+        if value is self:
+            raise KeyError(name)
+        return value
+
+
+# Process-wide, decrypted once. Use as FastAPI dependencies:
+#     def handler(settings: AppConfig = Depends(get_settings)): ...
+@lru_cache
+def get_settings() -> AppConfig:
+    return AppConfig()
+
+
+@lru_cache
+def get_secrets() -> Secrets:
+    return Secrets(get_settings().keyring)
+
+
+settings = get_settings()
 """
 
 # ----------------------------
 # Encryption Utilities
 # ----------------------------
 ENCRYPTION_PY = """\
-from cryptography.fernet import Fernet, InvalidToken
+import base64
+import binascii
+import re
+import time
+from functools import lru_cache
+
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+_TOKEN_CHARS = re.compile(r"[A-Za-z0-9_-]+={0,2}")
 
 def is_encrypted(value: str) -> bool:
-    return value.startswith('gAAAAAB')
+    if value and _is_envelope(value):
+        return True
+    # Structural Fernet token check (no crypto): 0x80 | ts | IV | 16n bytes | HMAC
+    length = len(value or "")
+    if length < 100 or length % 4 or value[0] != "g":
+        return False
+    size = length // 4 * 3 - (length - len(value.rstrip("=")))
+    if (size - 57) % 16 or not _TOKEN_CHARS.fullmatch(value):
+        return False
+    header = base64.urlsafe_b64decode(value[:12])
+    timestamp = int.from_bytes(header[1:9], "big")
+    return header[0] == 0x80 and 1_356_998_400 <= timestamp <= time.time() + 86400
+
+def keyring(key: str, previous: str = "") -> str:
+    # "new,old1,old2": encrypt with the first key, decrypt with any of them
+    keys = []
+    for k in f"{key or ''},{previous or ''}".split(","):
+        if k.strip() and k.strip() not in keys:
+            keys.append(k.strip())
+    return ",".join(keys)
+
+@lru_cache(maxsize=32)
+def get_cipher(key: str) -> Fernet | MultiFernet:
+    keys = [k for k in key.split(",") if k]
+    if len(keys) == 1:
+        return Fernet(keys[0].encode())
+    return MultiFernet([Fernet(k.encode()) for k in keys])
+
+# Values may also use the compact AEAD envelope written with KEY_CIPHER=aesgcm|chacha20:
+#     zk1<g|c>:<base64url(nonce | ciphertext | tag)>
+_AEAD = {"g": ("aesgcm", AESGCM), "c": ("chacha20", ChaCha20Poly1305)}
+
+@lru_cache(maxsize=32)
+def _aead(key: str, tag: str):
+    name, factory = _AEAD[tag]
+    derived = HKDF(algorithm=hashes.SHA256(), length=32, salt=None,
+                   info=f"zackry-{name}-v1".encode()).derive(base64.urlsafe_b64decode(key.encode()))
+    return factory(derived)
+
+def _is_envelope(value: str) -> bool:
+    return len(value) >= 43 and value.startswith("zk1") and value[3] in _AEAD and value[4] == ":"
+
+def _decrypt_envelope(value: str, key: str) -> str:
+    try:
+        raw = base64.urlsafe_b64decode(value[5:] + "=" * (-len(value[5:]) % 4))
+    except (binascii.Error, ValueError):
+        raise InvalidToken from None
+    if len(raw) < 12 + 16:  # nonce + tag: a plain value that only looks like an envelope
+        raise InvalidToken
+    for k in key.split(","):
+        try:
+            return _aead(k, value[3]).decrypt(raw[:12], raw[12:], value[:4].encode()).decode()
+        except InvalidTag:
+            continue
+    raise InvalidToken
+
+def _decrypt(value: str, key: str) -> str:
+    if _is_envelope(value):
+        return _decrypt_envelope(value, key)
+    return get_cipher(key).decrypt(value.encode()).decode()
 
 def decrypt_data(value: str, key: str):
     if not value or not key or not is_encrypted(value):
         return value
     try:
-        cipher = Fernet(key.encode())
-        return cipher.decrypt(value.encode()).decode()
+        return _decrypt(value, key)
     except InvalidToken:
         return value
 
 def encrypt_data(value: str, key: str):
     if not value or not key:
         return value
-    cipher = Fernet(key.encode())
-    return cipher.encrypt(value.encode()).decode()
+    return get_cipher(key).encrypt(value.encode()).decode()
+
+def decrypt_many(values: dict, key: str) -> dict:
+    if not key:
+        return dict(values)
+    result = {}
+    for name, value in values.items():
+        if value and is_encrypted(value):
+            try:
+                value = _decrypt(value, key)
+            except InvalidToken:
+                pass
+        result[name] = value
+    return result
+
+def encrypt_many(values: dict, key: str) -> dict:
+    if not key:
+        return dict(values)
+    cipher = get_cipher(key)
+    return {name: cipher.encrypt(value.encode()).decode() if value else value
+            for name, value in values.items()}
+"""
+
+# ----------------------------
+# Secrets vault loader (read-only)
+# ----------------------------
+VAULT_PY = """\
+# Reads single secrets from a vault written by `zackry vault import`:
+# a binary search over the memory-mapped index, one seek, one decrypt.
+import base64
+import hashlib
+import mmap
+import os
+import struct
+from functools import lru_cache
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+HEADER = struct.Struct(">3sBI16s8s")
+ENTRY = struct.Struct(">8sQI")
+VAULT_FILE = os.environ.get("VAULT_FILE", "secrets.vault")
+
+
+class Vault:
+    def __init__(self, path: str, key: str):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self._count, salt, check = HEADER.unpack_from(self._map, 0)
+        if magic != b"ZKV" or version != 1:
+            raise ValueError(f"{path} is not a vault")
+        prefix = self._map[:HEADER.size - 8]
+        for k in key.split(","):
+            master = base64.urlsafe_b64decode(k.encode())
+            material = HKDF(algorithm=hashes.SHA256(), length=64, salt=salt,
+                            info=b"zackry-vault-v1").derive(master)
+            hash_key = material[32:]
+            if hashlib.blake2b(prefix, digest_size=8, key=hash_key, person=b"zackry-check").digest() == check:
+                self._aead, self._hash_key = AESGCM(material[:32]), hash_key
+                return
+        raise ValueError(f"Wrong KEY for {path}")
+
+    def _entry(self, i: int):
+        return ENTRY.unpack_from(self._map, HEADER.size + i * ENTRY.size)
+
+    def get(self, name: str, default=None):
+        digest = hashlib.blake2b(name.encode(), digest_size=8, key=self._hash_key).digest()
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._entry(mid)[0] < digest:
+                lo = mid + 1
+            else:
+                hi = mid
+        while lo < self._count:
+            found, offset, length = self._entry(lo)
+            if found != digest:
+                break
+            record = self._map[offset:offset + length]
+            try:
+                plain = self._aead.decrypt(record[:12], record[12:], digest)
+            except InvalidTag:
+                raise ValueError(f"Vault record for {name} failed authentication") from None
+            size = struct.unpack_from(">H", plain)[0]
+            if plain[2:2 + size].decode() == name:
+                return plain[2 + size:].decode()
+            lo += 1
+        return default
+
+    def __getitem__(self, name: str) -> str:
+        value = self.get(name, self)
+        if value is self:
+            raise KeyError(name)
+        return value
+
+
+# Opened once per process; only the secrets a service asks for are decrypted:
+#     get_vault()["DATABASE_URL"]
+@lru_cache
+def get_vault() -> Vault:
+    from app.core.config import get_settings
+    return Vault(VAULT_FILE, get_settings().keyring)
+"""
+
+# ----------------------------
+# Consumer
+# ----------------------------
+CONSUMER_PY = """\
+from app.utils.${module} import ${connection}
+from app.core.core_consumer import CoreConsumer
+from loguru import logger
+
+class ${class_name}Consumer(CoreConsumer):
+    def __init__(self):
+        self.connection = ${connection}()
+        self.topic = "${topic}"
+
+    async def process(self, message, request_id):
+        logger.info(f"{request_id} - Processing message: {message}")
+"""
+
+# ----------------------------
+# Generated component stub
+# ----------------------------
+COMPONENT_STUB = "# Auto-generated ${kind} for ${api_name}"
+
+# ----------------------------
+# Settings boot benchmark
+# ----------------------------
+BENCH_SETTINGS_PY = """\
+\"\"\"
+Boot cost of app.core.config with many encrypted settings.
+
+    python -m tests.bench_settings [count]
+\"\"\"
+import os
+import sys
+import tempfile
+import time
+
+from cryptography.fernet import Fernet
+
+from app.core.config import AppConfig, Secrets
+from app.utils.encryption import encrypt_many, get_cipher
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main(count: int = 500):
+    key = Fernet.generate_key().decode()
+    hot = {"ENABLE_LOG_REQUEST_HEADER": "true", "ENABLE_LOG_REQUEST_BODY": "true", "DEBUG_MODE": "false"}
+    values = encrypt_many({**hot, **{f"SETTING_{i}": f"value-{i}" for i in range(count)}}, key)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env_file = os.path.join(tmp, ".env")
+        with open(env_file, "w") as f:
+            f.write(f"KEY={key}\\n" + "".join(f"{k}={v}\\n" for k, v in values.items()))
+
+        get_cipher.cache_clear()
+        settings, boot_ms = timed(lambda: AppConfig(_env_file=env_file))
+        secrets, load_ms = timed(lambda: Secrets(settings.key, env_file))
+        names = [f"SETTING_{i}" for i in range(count)]
+        _, first_ms = timed(lambda: [secrets[n] for n in names])
+        _, again_ms = timed(lambda: [secrets[n] for n in names])
+        _, naive_ms = timed(lambda: [Fernet(key.encode()).decrypt(values[n].encode()) for n in names])
+
+    print(f"Settings: {len(hot)} hot + {count} lazy (encrypted)")
+    print(f"  boot (hot fields, batch decrypt) : {boot_ms:8.2f} ms")
+    print(f"  load raw .env for lazy secrets   : {load_ms:8.2f} ms")
+    print(f"  first access of all {count:<5}       : {first_ms:8.2f} ms")
+    print(f"  memoised access of all {count:<5}    : {again_ms:8.2f} ms")
+    print(f"  reference: new Fernet per field  : {naive_ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
 """
 
 # ----------------------------
@@ -170,3 +485,23 @@ index-url = https://nexus-mirror.xxx.com/repository/pypi-proxy/simple
 extra-index-url = https://nexus-mirror.xxx.com/repository/pypi-public-repo/simple
 trusted-host = nexus-mirror.xxx.com
 """
+
+
+# ----------------------------
+# Template registry
+# ----------------------------
+for _name, _source in {
+    "main_py": MAIN_PY,
+    "config_py": CONFIG_PY,
+    "encryption_py": ENCRYPTION_PY,
+    "vault_py": VAULT_PY,
+    "consumer_py": CONSUMER_PY,
+    "bench_settings_py": BENCH_SETTINGS_PY,
+    "component_stub": COMPONENT_STUB,
+    "health_router": HEALTH_ROUTER,
+    "env_file": ENV_FILE,
+    "requirements": REQUIREMENTS,
+    "readme_md": README_MD,
+    "pip_conf": PIP_CONF,
+}.items():
+    register(_name, _source, version=TEMPLATE_VERSION)
@@ -10,3 +10,6 @@ BASE_DIRS = [
     "app/utils",
     "tests",
 ]
+
+# Bump whenever any template output changes; recorded in .zackry-lock
+TEMPLATE_VERSION = "10"
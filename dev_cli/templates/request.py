@@ -0,0 +1,27 @@
+# dev_cli/templates/request.py
+
+from dev_cli.templates.engine import register
+
+LETTER_VERSION = "1"
+
+# ----------------------------
+# Request letter
+# ----------------------------
+REQUEST_LETTER = """\
+Dear IT Team,
+
+1. I would like to request ${req_type} as below path:
++ ${environment}
+${path}
+Note: Please refer to the attachment file for configuration
+
+2. Build xxx Version
+  - Group: xxxxx
+  - Pipeline: ${job}
+  - Environment: ${environment}
+  - Docker_Image: ${docker_image}
+
+Best Regards,
+Your Name"""
+
+register("request_letter", REQUEST_LETTER, version=LETTER_VERSION)
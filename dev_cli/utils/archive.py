@@ -0,0 +1,367 @@
+# dev_cli/utils/archive.py
+"""
+Streaming compressed archives, optionally split into fixed-size parts.
+
+    with ArchiveWriter(Path("api_1.0.tar.gz"), codec="gzip", split_size=1 << 30, threads=4) as out:
+        for chunk in source:
+            out.write(chunk)
+    out.parts            # [(path, size, sha256), ...]
+
+    size, chunks = read_archive(Path("api_1.0.tar.gz"))  # compressed size; verified, decompressed
+    for chunk in chunks:
+        ...
+
+Parts are `<name>.000`, `<name>.001`, ... and concatenate (`cat`) back to
+the single compressed file. `<name>.sha256` lists every part in
+`sha256sum -c` format. Nothing is staged uncompressed: data is hashed and
+compressed as it streams through.
+
+Multi-threaded gzip compresses fixed-size blocks as independent gzip
+members (valid gzip, as with pigz); zstd uses the `zstandard` package's
+own worker threads (`pip install zackry-cli[zstd]`).
+"""
+
+import gzip
+import hashlib
+import os
+import re
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+CODECS = {"gzip": ".gz", "zstd": ".zst", "none": ""}
+DEFAULT_LEVELS = {"gzip": 6, "zstd": 3, "none": 0}
+BLOCK_SIZE = 4 * 1024 * 1024
+READ_SIZE = 1024 * 1024
+CHECKSUM_SUFFIX = ".sha256"
+_MAGIC = {b"\x1f\x8b": "gzip", b"\x28\xb5\x2f\xfd": "zstd"}
+_SIZE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)i?B?\s*$", re.IGNORECASE)
+
+
+class ArchiveError(ValueError):
+    """Raised for archives that are incomplete, corrupt or cannot be handled"""
+
+
+def parse_size(text: str | int | None) -> int | None:
+    """'512M', '1.5G', '1GiB', '1048576' -> bytes"""
+    if text in (None, "", 0):
+        return None
+    if isinstance(text, int):
+        return text
+    match = _SIZE.match(text)
+    if not match:
+        raise ArchiveError(f"Invalid size '{text}' (use e.g. 500M or 2G)")
+    number, unit = match.groups()
+    return int(float(number) * 1024 ** ("", "K", "M", "G", "T").index(unit.upper()))
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        raise ArchiveError("zstd needs the 'zstandard' package: pip install zstandard") from None
+    return zstandard
+
+
+# ----------------------------
+# Compressors
+# ----------------------------
+class _Plain:
+    def compress(self, data: bytes) -> list[bytes]:
+        return [data]
+
+    def flush(self) -> list[bytes]:
+        return []
+
+    def close(self):
+        pass
+
+
+class _Gzip:
+    def __init__(self, level: int):
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> list[bytes]:
+        return [self._obj.compress(data)]
+
+    def flush(self) -> list[bytes]:
+        return [self._obj.flush()]
+
+    def close(self):
+        pass
+
+
+class _ParallelGzip:
+    """Blocks compressed as gzip members on a thread pool (zlib releases the GIL), output in order"""
+
+    def __init__(self, level: int, threads: int):
+        self.level = level
+        self._pool = ThreadPoolExecutor(max_workers=threads)
+        self._pending: deque = deque()
+        self._max_pending = threads * 2
+        self._buffer = bytearray()
+
+    def _submit(self, block: bytes):
+        self._pending.append(self._pool.submit(gzip.compress, block, self.level, mtime=0))
+
+    def compress(self, data: bytes) -> list[bytes]:
+        self._buffer += data
+        while len(self._buffer) >= BLOCK_SIZE:
+            self._submit(bytes(self._buffer[:BLOCK_SIZE]))
+            del self._buffer[:BLOCK_SIZE]
+        out = []
+        while self._pending and (self._pending[0].done() or len(self._pending) > self._max_pending):
+            out.append(self._pending.popleft().result())
+        return out
+
+    def flush(self) -> list[bytes]:
+        if self._buffer:
+            self._submit(bytes(self._buffer))
+            self._buffer.clear()
+        out = [future.result() for future in self._pending]
+        self._pending.clear()
+        self._pool.shutdown()
+        return out
+
+    def close(self):
+        """Drop pending blocks (after an error): queued ones never start"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pending.clear()
+        self._buffer.clear()
+
+
+class _Zstd:
+    def __init__(self, level: int, threads: int):
+        self._obj = _zstd().ZstdCompressor(level=level, threads=threads).compressobj()
+
+    def compress(self, data: bytes) -> list[bytes]:
+        return [self._obj.compress(data)]
+
+    def flush(self) -> list[bytes]:
+        return [self._obj.flush()]
+
+    def close(self):
+        pass
+
+
+def compressor(codec: str, level: int | None = None, threads: int = 0):
+    """`threads`: 0 = all CPUs, 1 = single-threaded"""
+    if codec not in CODECS:
+        raise ArchiveError(f"Unknown codec '{codec}' (use {', '.join(CODECS)})")
+    level = DEFAULT_LEVELS[codec] if level is None else level
+    threads = threads or os.cpu_count() or 1
+    if codec == "gzip":
+        return _ParallelGzip(level, threads) if threads > 1 else _Gzip(level)
+    if codec == "zstd":
+        return _Zstd(level, threads if threads > 1 else 0)
+    return _Plain()
+
+
+# ----------------------------
+# Writing
+# ----------------------------
+class ArchiveWriter:
+    """
+    Compress, split and hash a stream. Output goes to temporary files that
+    are renamed into place on a clean close and removed on error.
+    """
+
+    def __init__(self, path: Path, codec: str = "gzip", level: int | None = None,
+                 split_size: int | None = None, threads: int = 0):
+        self.path = Path(path)
+        self.split_size = split_size
+        self._compressor = compressor(codec, level, threads)
+        self.raw_bytes = 0
+        self.written = 0
+        self.parts: list[tuple[Path, int, str]] = []
+        self._tmp: list[tuple[Path, Path]] = []
+        self._file = None
+        self._hash = None
+        self._size = 0
+
+    def _part_path(self) -> Path:
+        return self.path.with_name(f"{self.path.name}.{len(self._tmp):03d}") if self.split_size else self.path
+
+    def _open_part(self):
+        final = self._part_path()
+        tmp = final.with_name(f".{final.name}.tmp")
+        self._tmp.append((tmp, final))
+        self._file, self._hash, self._size = open(tmp, "wb"), hashlib.sha256(), 0
+
+    def _close_part(self):
+        if self._file:
+            self._file.close()
+            self.parts.append((self._tmp[-1][1], self._size, self._hash.hexdigest()))
+            self._file = None
+
+    def _emit(self, data: bytes):
+        view = memoryview(data)
+        while view:
+            if self._file is None:
+                self._open_part()
+            room = self.split_size - self._size if self.split_size else len(view)
+            piece = view[:room]
+            self._file.write(piece)
+            self._hash.update(piece)
+            self._size += len(piece)
+            self.written += len(piece)
+            view = view[len(piece):]
+            if self.split_size and self._size >= self.split_size:
+                self._close_part()
+
+    def write(self, data: bytes):
+        self.raw_bytes += len(data)
+        for out in self._compressor.compress(data):
+            self._emit(out)
+
+    def close(self):
+        for out in self._compressor.flush():
+            self._emit(out)
+        if self._file is None and not self._tmp:
+            self._open_part()  # empty input still produces one file
+        self._close_part()
+        for tmp, final in self._tmp:
+            os.replace(tmp, final)
+        # Leftovers of an earlier export under the same name (split or not)
+        if self.split_size:
+            self.path.unlink(missing_ok=True)
+        index = len(self._tmp) if self.split_size else 0
+        while (stale := self.path.with_name(f"{self.path.name}.{index:03d}")).is_file():
+            stale.unlink()
+            index += 1
+        checksum_file = self.path.with_name(self.path.name + CHECKSUM_SUFFIX)
+        checksum_file.write_text("".join(f"{sha}  {path.name}\n" for path, _, sha in self.parts))
+
+    def abort(self):
+        self._compressor.close()
+        if self._file:
+            self._file.close()
+        for tmp, _ in self._tmp:
+            tmp.unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+# ----------------------------
+# Reading
+# ----------------------------
+def archive_parts(path: Path) -> tuple[Path, list[Path]]:
+    """(base path, parts) for `x.tar.gz`, a split `x.tar.gz.000...` set, or any one of its parts"""
+    path = Path(path)
+    if re.fullmatch(r".*\.\d{3}", path.name):
+        path = path.with_name(path.name[:-4])
+    if path.is_file():
+        return path, [path]
+    parts = []
+    while (part := path.with_name(f"{path.name}.{len(parts):03d}")).is_file():
+        parts.append(part)
+    if not parts:
+        raise ArchiveError(f"{path} not found")
+    return path, parts
+
+
+def read_checksums(base: Path) -> dict:
+    path = base.with_name(base.name + CHECKSUM_SUFFIX)
+    if not path.is_file():
+        return {}
+    sums = {}
+    for line in path.read_text().splitlines():
+        sha, _, name = line.strip().partition("  ")
+        if name:
+            sums[name.lstrip("*")] = sha
+    return sums
+
+
+def iter_parts(parts: list[Path], checksums: dict | None = None, chunk_size: int = READ_SIZE) -> Iterator[bytes]:
+    """
+    The concatenated parts. With `checksums`, the last chunk of each part is
+    held back until the part's SHA-256 matches, so a consumer never receives
+    a complete stream from a corrupt archive.
+    """
+    for part in parts:
+        expected = (checksums or {}).get(part.name)
+        if checksums and expected is None:
+            raise ArchiveError(f"{part.name}: no checksum in {CHECKSUM_SUFFIX} file")
+        digest, held = hashlib.sha256(), None
+        with open(part, "rb") as f:
+            while chunk := f.read(chunk_size):
+                digest.update(chunk)
+                if held is not None:
+                    yield held
+                held = chunk
+        if expected and digest.hexdigest() != expected:
+            raise ArchiveError(f"{part.name}: SHA-256 mismatch (corrupt or incomplete transfer)")
+        if held is not None:
+            yield held
+
+
+def detect_codec(first: bytes) -> str:
+    for magic, codec in _MAGIC.items():
+        if first.startswith(magic):
+            return codec
+    return "none"
+
+
+def decompress(chunks: Iterable[bytes], codec: str) -> Iterator[bytes]:
+    """Decompress a stream of (possibly multi-member / multi-frame) data"""
+    if codec == "none":
+        yield from chunks
+        return
+    if codec == "gzip":
+        new, errors = (lambda: zlib.decompressobj(31)), zlib.error
+    else:
+        zstandard = _zstd()
+        new, errors = (lambda: zstandard.ZstdDecompressor().decompressobj()), zstandard.ZstdError
+    obj, pending = new(), False
+    for chunk in chunks:
+        while chunk:
+            pending = True
+            try:
+                out = obj.decompress(chunk)
+            except errors as e:
+                raise ArchiveError(f"Archive data is corrupt ({e})") from None
+            if out:
+                yield out
+            if obj.eof:
+                chunk, obj, pending = obj.unused_data, new(), False
+            else:
+                chunk = b""
+    if pending:
+        raise ArchiveError("Archive is truncated")
+
+
+def _counted(chunks: Iterable[bytes], on_read: Callable[[int], None]) -> Iterator[bytes]:
+    for chunk in chunks:
+        on_read(len(chunk))
+        yield chunk
+
+
+def read_archive(path: Path, verify: bool = True, chunk_size: int = READ_SIZE,
+                 on_read: Callable[[int], None] | None = None) -> tuple[int, Iterator[bytes]]:
+    """
+    (compressed size, decompressed chunks) of an archive written by
+    ArchiveWriter (or any gz/zst/tar); `on_read` gets each compressed chunk's size.
+    """
+    base, parts = archive_parts(path)
+    checksums = read_checksums(base) if verify else None
+    if verify and not checksums:
+        raise ArchiveError(f"{base.name}{CHECKSUM_SUFFIX} not found (use --no-verify to skip the check)")
+    if verify and (unread := set(checksums) - {p.name for p in parts}):
+        # archive_parts stops at the first gap: every part listed in .sha256 must be read
+        missing = sorted(n for n in unread if not base.with_name(n).is_file()) or sorted(unread)
+        raise ArchiveError(f"{base.name}: missing part(s) {', '.join(missing)} (incomplete transfer)")
+    with open(parts[0], "rb") as f:
+        codec = detect_codec(f.read(4))
+    chunks = iter_parts(parts, checksums, chunk_size)
+    if on_read:
+        chunks = _counted(chunks, on_read)
+    return sum(p.stat().st_size for p in parts), decompress(chunks, codec)
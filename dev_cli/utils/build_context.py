@@ -0,0 +1,275 @@
+# dev_cli/utils/build_context.py
+"""
+Docker build context: .dockerignore matching and a streamed context tar.
+
+The matcher follows the docker CLI (moby/patternmatcher) rules:
+
+* `#` comments, blank lines skipped; patterns are path-cleaned, a leading
+  `/` is dropped; `!pattern` re-includes; `\\` escapes (a separator on Windows)
+* `*` and `?` never cross `/`, `**` matches any number of directories
+* a pattern matching a parent directory excludes everything below it
+* the last matching pattern wins
+* the Dockerfile and .dockerignore are always sent
+
+`context_hash` digests exactly what would be sent, so an image labelled
+with it can be reused whenever the hash matches, whatever its tag.
+"""
+
+import hashlib
+import json
+import os
+import posixpath
+import re
+import stat
+import tarfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
+IGNORE_NAME = ".dockerignore"
+CHUNK_SIZE = 256 * 1024
+HASH_LABEL = "io.zackry.context-hash"
+HASH_VERSION = "1"
+RACY_SECONDS = 2  # files modified this recently are re-hashed next time too
+
+
+# ----------------------------
+# Patterns
+# ----------------------------
+def _translate(pattern: str) -> re.Pattern:
+    regex, i = "^", 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "*":
+            if pattern[i + 1:i + 2] == "*":
+                i += 1
+                if pattern[i + 1:i + 2] == "/":
+                    i += 1
+                regex += ".*" if i + 1 >= len(pattern) else "(.*/)?"
+            else:
+                regex += "[^/]*"
+        elif ch == "?":
+            regex += "[^/]"
+        elif ch == "\\" and i + 1 < len(pattern):
+            i += 1
+            regex += re.escape(pattern[i])
+        elif ch == "[" and "]" in pattern[i + 2:]:
+            end = pattern.index("]", i + 2)
+            regex += pattern[i:end + 1]  # character class, passed through
+            i = end
+        elif ch == "/":
+            regex += "/"
+        else:
+            regex += re.escape(ch)
+        i += 1
+    return re.compile(regex + "$")
+
+
+def parse_patterns(text: str) -> list[str]:
+    """The patterns of a .dockerignore file, cleaned the way the docker CLI does"""
+    patterns = []
+    for number, line in enumerate(text.splitlines()):
+        if number == 0:
+            line = line.lstrip("﻿")
+        if line.startswith("#"):
+            continue
+        line = line.strip()
+        if not line:
+            continue
+        invert = line.startswith("!")
+        if invert:
+            line = line[1:].strip()
+        if line:
+            if os.sep == "\\":
+                line = line.replace("\\", "/")  # elsewhere `\` escapes, as in the docker CLI
+            line = posixpath.normpath(line)
+            if len(line) > 1 and line.startswith("/"):
+                line = line.lstrip("/")
+        patterns.append(f"!{line}" if invert else line)
+    return patterns
+
+
+class IgnoreMatcher:
+    def __init__(self, patterns: list[str]):
+        self.patterns = []
+        for pattern in patterns:
+            exclusion = pattern.startswith("!")
+            text = pattern[1:] if exclusion else pattern
+            if text:
+                self.patterns.append((text, exclusion, _translate(text)))
+        self.has_exclusions = any(exclusion for _, exclusion, _ in self.patterns)
+
+    @classmethod
+    def load(cls, root: str | Path) -> "IgnoreMatcher":
+        path = Path(root) / IGNORE_NAME
+        return cls(parse_patterns(path.read_text(encoding="utf-8")) if path.is_file() else [])
+
+    def matches(self, rel: str) -> bool:
+        """True if `rel` (a /-separated path relative to the context) is ignored"""
+        parent = posixpath.dirname(rel)
+        parents = parent.split("/") if parent else []
+        matched = False
+        for _, exclusion, regex in self.patterns:
+            if exclusion != matched:
+                continue
+            match = bool(regex.match(rel))
+            if not match and parents:
+                match = any(regex.match("/".join(parents[:i + 1])) for i in range(len(parents)))
+            if match:
+                matched = not exclusion
+        return matched
+
+    def can_prune(self, rel_dir: str) -> bool:
+        """An ignored directory can be skipped unless a `!pattern` may re-include something below it"""
+        if not self.has_exclusions:
+            return True
+        prefix = rel_dir + "/"
+        return not any(exclusion and (text + "/").startswith(prefix) for text, exclusion, _ in self.patterns)
+
+
+# ----------------------------
+# Walking the context
+# ----------------------------
+def iter_context(root: str | Path, matcher: IgnoreMatcher | None = None,
+                 dockerfile: str = "Dockerfile") -> Iterator[tuple[str, os.DirEntry]]:
+    """
+    (relative path, DirEntry) of everything sent to the daemon, sorted and
+    depth-first; symlinks are not followed.
+    """
+    root = Path(root)
+    matcher = matcher or IgnoreMatcher.load(root)
+    always = {dockerfile, IGNORE_NAME}
+
+    def walk(directory: Path, prefix: str):
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            rel = f"{prefix}{entry.name}"
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if rel not in always and matcher.matches(rel):
+                if is_dir and (not matcher.can_prune(rel) or any(a.startswith(f"{rel}/") for a in always)):
+                    yield from walk(Path(entry.path), f"{rel}/")
+                continue
+            yield rel, entry
+            if is_dir:
+                yield from walk(Path(entry.path), f"{rel}/")
+
+    yield from walk(root, "")
+
+
+def _as_root(info: tarfile.TarInfo) -> tarfile.TarInfo:
+    info.uid = info.gid = 0
+    info.uname = info.gname = ""
+    return info
+
+
+def stream_tar(root: str | Path, paths, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Tar `paths` (relative to `root`) as a stream of chunks. The archive is
+    written by a thread into a pipe, so memory stays at one chunk however
+    large the files are.
+    """
+    root = Path(root)
+    read_fd, write_fd = os.pipe()
+    errors = []
+
+    def produce():
+        try:
+            with os.fdopen(write_fd, "wb") as out, \
+                    tarfile.open(fileobj=out, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+                for rel in paths:
+                    tar.add(root / rel, arcname=rel, recursive=False, filter=_as_root)
+        except BrokenPipeError:
+            pass  # the consumer stopped reading
+        except BaseException as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    with os.fdopen(read_fd, "rb") as src:
+        while chunk := src.read(chunk_size):
+            yield chunk
+    thread.join()
+    if errors:
+        raise errors[0]
+
+
+def context_tar(root: str | Path, dockerfile: str = "Dockerfile") -> Iterator[bytes]:
+    """The build context of `root` as tar chunks, .dockerignore applied"""
+    return stream_tar(root, (rel for rel, _ in iter_context(root, dockerfile=dockerfile)))
+
+
+# ----------------------------
+# Content hash
+# ----------------------------
+def cache_dir() -> Path:
+    base = os.environ.get("ZACKRY_CACHE_DIR") or Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "zackry"
+    return Path(base) / "contexts"
+
+
+def _cache_path(root: Path) -> Path:
+    return cache_dir() / f"{hashlib.sha256(str(root.resolve()).encode()).hexdigest()[:32]}.json"
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def context_hash(root: str | Path, dockerfile: str = "Dockerfile", use_cache: bool = True) -> str:
+    """
+    SHA-256 over the effective build context: every path sent to the
+    daemon with its type, executable bit and content (or link target).
+
+    File digests are cached per context keyed by (size, mtime, inode); a
+    repeat run only stats the tree and reads the files that changed.
+    """
+    root = Path(root)
+    cache_file = _cache_path(root)
+    cached = {}
+    if use_cache:
+        try:
+            cached = json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            pass
+
+    entries, misses = [], []
+    for rel, entry in iter_context(root, dockerfile=dockerfile):
+        st = entry.stat(follow_symlinks=False)
+        if stat.S_ISLNK(st.st_mode):
+            entries.append((rel, "l", 0, os.readlink(entry.path)))
+        elif stat.S_ISDIR(st.st_mode):
+            entries.append((rel, "d", 0, ""))
+        else:
+            key = [st.st_size, st.st_mtime_ns, st.st_ino]
+            hit = cached.get(rel)
+            item = [rel, "f", st.st_mode & 0o111 and 1, hit[1] if hit and hit[0] == key else None, key]
+            if item[3] is None:
+                misses.append(item)
+            entries.append(item)
+
+    if misses:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+            for item, digest in zip(misses, pool.map(_file_digest, (str(root / m[0]) for m in misses))):
+                item[3] = digest
+
+    total = hashlib.sha256(f"zackry-context-v{HASH_VERSION}\0".encode())
+    for rel, kind, executable, digest, *_ in entries:
+        total.update(f"{rel}\0{kind}\0{executable}\0{digest}\n".encode())
+
+    if use_cache and (misses or len(cached) != sum(1 for e in entries if e[1] == "f")):
+        racy = (time.time() - RACY_SECONDS) * 1e9
+        fresh = {e[0]: [e[4], e[3]] for e in entries if e[1] == "f" and e[4][1] < racy}
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(fresh, separators=(",", ":")))
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass  # the cache is an optimisation only
+    return total.hexdigest()
@@ -0,0 +1,90 @@
+# dev_cli/utils/ciphers.py
+"""
+AEAD cipher backends and their compact text envelope.
+
+Fernet (AES-CBC + HMAC, base64 token) stays the default. The AEAD
+backends encrypt and authenticate in one pass and carry less overhead:
+
+    zk1<id>:<base64url(nonce (12) | ciphertext | tag (16))>    (no padding)
+
+`zk1` is the envelope version, <id> names the backend ("g" AES-256-GCM,
+"c" ChaCha20-Poly1305) and the "zk1<id>" header is authenticated as
+associated data. Backend keys are derived from the Fernet KEY with HKDF,
+so the same KEY in .env works for every backend.
+"""
+
+import base64
+import os
+from functools import lru_cache
+
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+ENVELOPE_VERSION = "zk1"
+NONCE_SIZE = 12
+TAG_SIZE = 16
+
+
+class AeadBackend:
+    __slots__ = ("name", "tag", "factory", "header")
+
+    def __init__(self, name: str, tag: str, factory):
+        self.name = name
+        self.tag = tag
+        self.factory = factory
+        self.header = f"{ENVELOPE_VERSION}{tag}"
+
+    def encrypt(self, value: str, key: str) -> str:
+        nonce = os.urandom(NONCE_SIZE)
+        sealed = aead(key, self.name).encrypt(nonce, value.encode(), self.header.encode())
+        return f"{self.header}:{base64.urlsafe_b64encode(nonce + sealed).rstrip(b'=').decode()}"
+
+    def decrypt(self, token: str, keys: list[str]) -> str:
+        """Decrypt with the first key in `keys` that authenticates; InvalidToken otherwise"""
+        body = token[len(self.header) + 1:]
+        try:
+            raw = base64.urlsafe_b64decode(body + "=" * (-len(body) % 4))
+        except ValueError:
+            raise InvalidToken from None
+        if len(raw) < NONCE_SIZE + 16:  # the lenient decoder drops non-base64 characters
+            raise InvalidToken
+        nonce, sealed = raw[:NONCE_SIZE], raw[NONCE_SIZE:]
+        for key in keys:
+            try:
+                return aead(key, self.name).decrypt(nonce, sealed, self.header.encode()).decode()
+            except InvalidTag:
+                continue
+        raise InvalidToken
+
+
+BACKENDS = {
+    "aesgcm": AeadBackend("aesgcm", "g", AESGCM),
+    "chacha20": AeadBackend("chacha20", "c", ChaCha20Poly1305),
+}
+_BY_TAG = {b.tag: b for b in BACKENDS.values()}
+
+# Every selectable cipher; "fernet" is handled by utils.encryption
+CIPHERS = ("fernet", *BACKENDS)
+
+
+@lru_cache(maxsize=32)
+def aead(key: str, name: str):
+    """AEAD instance for `key`, derived once per (key, backend)"""
+    master = base64.urlsafe_b64decode(key.encode())
+    derived = HKDF(algorithm=hashes.SHA256(), length=32, salt=None,
+                   info=f"zackry-{name}-v1".encode()).derive(master)
+    return BACKENDS[name].factory(derived)
+
+
+def backend_for(value: str) -> AeadBackend | None:
+    """Backend of an envelope, None for anything else (plain text, Fernet tokens)"""
+    if len(value) < 5 + 38 or not value.startswith(ENVELOPE_VERSION) or value[4] != ":":
+        return None
+    return _BY_TAG.get(value[3])
+
+
+def is_envelope(value: str) -> bool:
+    return backend_for(value) is not None
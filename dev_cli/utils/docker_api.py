@@ -0,0 +1,321 @@
+# dev_cli/utils/docker_api.py
+"""
+Minimal Docker Engine API client over the daemon's unix socket.
+
+Requests reuse keep-alive connections from a small pool instead of
+forking the docker CLI for every call. Build, pull and load progress is
+streamed as decoded JSON events; save and logs stream raw bytes.
+
+    client = DockerClient()                  # $DOCKER_HOST or /var/run/docker.sock
+    client.image_exists("api:latest")
+    for event in client.build(context_tar(Path.cwd()), "api:latest"):
+        print(event.get("stream", ""), end="")
+
+Any unix socket works, so tests can point it at a fake server.
+"""
+
+import codecs
+import http.client
+import json
+import os
+import queue
+import socket
+import struct
+from pathlib import Path
+from typing import Iterable, Iterator
+from urllib.parse import quote, urlencode
+
+DEFAULT_SOCKET = "/var/run/docker.sock"
+DESKTOP_SOCKET = Path.home() / ".docker" / "run" / "docker.sock"
+POOL_SIZE = 4
+READ_SIZE = 64 * 1024
+
+
+class DockerError(RuntimeError):
+    """Raised when the daemon cannot be reached or answers with an error"""
+
+    def __init__(self, message: str, status: int | None = None):
+        super().__init__(message)
+        self.status = status
+
+
+def default_socket() -> str:
+    """$DOCKER_HOST (unix:// only), the standard socket, or Docker Desktop's"""
+    host = os.environ.get("DOCKER_HOST", "")
+    if host.startswith("unix://"):
+        return host[len("unix://"):]
+    if not os.path.exists(DEFAULT_SOCKET) and DESKTOP_SOCKET.exists():
+        return str(DESKTOP_SOCKET)
+    return DEFAULT_SOCKET
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: float | None = None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class Stream:
+    """A streamed response; the connection returns to the pool once fully read"""
+
+    def __init__(self, client: "DockerClient", conn, response):
+        self._client, self._conn, self.response = client, conn, response
+
+    def chunks(self, size: int = READ_SIZE) -> Iterator[bytes]:
+        try:
+            while chunk := self.response.read1(size):
+                yield chunk
+        finally:
+            self.close()
+
+    def __iter__(self):
+        return self.chunks()
+
+    def close(self):
+        if self._conn is not None:
+            self._client._release(self._conn, self.response)
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def json_events(chunks: Iterable[bytes]) -> Iterator[dict]:
+    """Decode a stream of concatenated / newline-separated JSON objects"""
+    decoder, text = json.JSONDecoder(), codecs.getincrementaldecoder("utf-8")("replace")
+    buffer = ""
+    for chunk in chunks:
+        buffer += text.decode(chunk)
+        while True:
+            buffer = buffer.lstrip()
+            if not buffer:
+                break
+            try:
+                event, end = decoder.raw_decode(buffer)
+            except ValueError:
+                break  # incomplete object, wait for more data
+            buffer = buffer[end:]
+            yield event
+
+
+def demux(chunks: Iterable[bytes]) -> Iterator[tuple[int, bytes]]:
+    """Split a multiplexed (non-TTY) log/attach stream into (stream, data) frames"""
+    buffer = b""
+    for chunk in chunks:
+        buffer += chunk
+        while len(buffer) >= 8:
+            stream, size = struct.unpack(">BxxxI", buffer[:8])
+            if len(buffer) < 8 + size:
+                break
+            yield stream, buffer[8:8 + size]
+            buffer = buffer[8 + size:]
+
+
+def _raise_on_error(events: Iterator[dict]) -> Iterator[dict]:
+    for event in events:
+        if "error" in event:
+            raise DockerError(event.get("errorDetail", {}).get("message") or event["error"])
+        yield event
+
+
+class DockerClient:
+    def __init__(self, socket_path: str | None = None, timeout: float | None = None,
+                 pool_size: int = POOL_SIZE, api_version: str | None = None):
+        self.socket_path = socket_path or default_socket()
+        self.timeout = timeout
+        self.prefix = f"/v{api_version}" if api_version else ""
+        self._pool: queue.LifoQueue = queue.LifoQueue(maxsize=pool_size)
+
+    # ----------------------------
+    # Connections
+    # ----------------------------
+    def _acquire(self) -> tuple[UnixHTTPConnection, bool]:
+        try:
+            return self._pool.get_nowait(), True
+        except queue.Empty:
+            return UnixHTTPConnection(self.socket_path, self.timeout), False
+
+    def _release(self, conn, response):
+        if response.isclosed() and not response.will_close:
+            try:
+                self._pool.put_nowait(conn)
+                return
+            except queue.Full:
+                pass
+        conn.close()
+
+    def close(self):
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def request(self, method: str, path: str, params: dict | None = None, body=None,
+                headers: dict | None = None, stream: bool = False):
+        """
+        Send one request; returns the body (bytes) or, with `stream`, a
+        `Stream`. Bytes bodies are retried once on a stale pooled connection.
+        """
+        url = self.prefix + path + (f"?{urlencode(params, doseq=True)}" if params else "")
+        headers = {"Host": "docker", **(headers or {})}
+        if isinstance(body, (dict, list)):
+            body, headers["Content-Type"] = json.dumps(body).encode(), "application/json"
+
+        while True:
+            conn, reused = self._acquire()
+            try:
+                conn.request(method, url, body=body, headers=headers)
+                response = conn.getresponse()
+                break
+            except (ConnectionError, http.client.RemoteDisconnected) as e:
+                conn.close()
+                if reused and (body is None or isinstance(body, bytes)):
+                    continue
+                raise DockerError(f"Docker daemon connection failed ({self.socket_path}): {e}") from None
+            except OSError as e:
+                conn.close()
+                raise DockerError(f"Cannot connect to the Docker daemon at {self.socket_path}: {e}") from None
+
+        if response.status >= 400:
+            data = response.read()
+            self._release(conn, response)
+            try:
+                message = json.loads(data).get("message") or data.decode()
+            except ValueError:
+                message = data.decode(errors="replace")
+            raise DockerError(message.strip() or f"HTTP {response.status}", response.status)
+        if stream:
+            return Stream(self, conn, response)
+        data = response.read()
+        self._release(conn, response)
+        return data
+
+    def _json(self, method: str, path: str, **kwargs):
+        data = self.request(method, path, **kwargs)
+        return json.loads(data) if data else None
+
+    # ----------------------------
+    # System
+    # ----------------------------
+    def ping(self) -> bool:
+        try:
+            return self.request("GET", "/_ping") == b"OK"
+        except DockerError:
+            return False
+
+    def version(self) -> dict:
+        return self._json("GET", "/version")
+
+    # ----------------------------
+    # Images
+    # ----------------------------
+    def inspect_image(self, image: str) -> dict | None:
+        try:
+            return self._json("GET", f"/images/{quote(image, safe='/:@')}/json")
+        except DockerError as e:
+            if e.status == 404:
+                return None
+            raise
+
+    def image_exists(self, image: str) -> bool:
+        return self.inspect_image(image) is not None
+
+    def images(self, label: str | None = None) -> list[dict]:
+        """Local images, optionally only those with `label` ("name" or "name=value")"""
+        params = {"filters": json.dumps({"label": [label]})} if label else None
+        return self._json("GET", "/images/json", params=params)
+
+    def tag(self, image: str, target: str):
+        repo, _, tag = target.rpartition(":") if ":" in target.rsplit("/", 1)[-1] else (target, "", "latest")
+        self.request("POST", f"/images/{quote(image, safe='/:@')}/tag", {"repo": repo, "tag": tag})
+
+    def build(self, context: Iterable[bytes], tag: str, dockerfile: str = "Dockerfile",
+              labels: dict | None = None, buildargs: dict | None = None,
+              pull: bool = False, nocache: bool = False) -> Iterator[dict]:
+        """Build from a context tar stream (see build_context.context_tar); yields progress events"""
+        params = {"t": tag, "dockerfile": dockerfile, "rm": 1}
+        if labels:
+            params["labels"] = json.dumps(labels)
+        if buildargs:
+            params["buildargs"] = json.dumps(buildargs)
+        if pull:
+            params["pull"] = 1
+        if nocache:
+            params["nocache"] = 1
+        stream = self.request("POST", "/build", params, body=iter(context),
+                              headers={"Content-Type": "application/x-tar"}, stream=True)
+        return _raise_on_error(json_events(stream))
+
+    def pull(self, image: str) -> Iterator[dict]:
+        params = {"fromImage": image}
+        if "@" not in image:
+            name, _, tag = image.rpartition(":") if ":" in image.rsplit("/", 1)[-1] else (image, "", "latest")
+            params = {"fromImage": name, "tag": tag}
+        stream = self.request("POST", "/images/create", params, stream=True)
+        return _raise_on_error(json_events(stream))
+
+    def save(self, *images: str) -> Stream:
+        """The `docker save` tar of `images`, as a stream"""
+        return self.request("GET", "/images/get", {"names": list(images)}, stream=True)
+
+    def load(self, data: Iterable[bytes]) -> Iterator[dict]:
+        """`docker load` from a stream of tar chunks"""
+        stream = self.request("POST", "/images/load", {"quiet": 0}, body=iter(data),
+                              headers={"Content-Type": "application/x-tar"}, stream=True)
+        return _raise_on_error(json_events(stream))
+
+    # ----------------------------
+    # Containers
+    # ----------------------------
+    def create_container(self, image: str, ports: dict | None = None, env: dict | None = None,
+                         name: str | None = None) -> str:
+        """`ports` maps container port (e.g. 80) to host port (e.g. 8000)"""
+        ports = {f"{c}/tcp" if "/" not in str(c) else str(c): str(h) for c, h in (ports or {}).items()}
+        config = {
+            "Image": image,
+            "ExposedPorts": {port: {} for port in ports},
+            "Env": [f"{k}={v}" for k, v in (env or {}).items()],
+            "HostConfig": {"PortBindings": {port: [{"HostPort": host}] for port, host in ports.items()}},
+        }
+        return self._json("POST", "/containers/create", params={"name": name} if name else None, body=config)["Id"]
+
+    def start(self, container: str):
+        self.request("POST", f"/containers/{container}/start")
+
+    def stop(self, container: str, timeout: int = 10):
+        self.request("POST", f"/containers/{container}/stop", {"t": timeout})
+
+    def wait(self, container: str) -> int:
+        return self._json("POST", f"/containers/{container}/wait")["StatusCode"]
+
+    def logs(self, container: str, follow: bool = True) -> Iterator[tuple[int, bytes]]:
+        """(1 = stdout / 2 = stderr, data) frames"""
+        stream = self.request("GET", f"/containers/{container}/logs",
+                              {"follow": int(follow), "stdout": 1, "stderr": 1}, stream=True)
+        return demux(stream)
+
+    def run(self, image: str, ports: dict | None = None, env: dict | None = None, name: str | None = None) -> str:
+        """Create and start a container; returns its id"""
+        container = self.create_container(image, ports, env, name)
+        self.start(container)
+        return container
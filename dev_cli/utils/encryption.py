@@ -1,26 +1,163 @@
 # cnb_cli/commands/encryption.py
 
-from cryptography.fernet import Fernet, InvalidToken
+import base64
+import re
+import time
+from functools import lru_cache
+
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
+
+from dev_cli.utils.ciphers import BACKENDS, CIPHERS, backend_for, is_envelope
+
+CIPHER_CACHE_SIZE = 32
+
+# A keyring is "primary,previous1,previous2": Fernet keys are base64url and
+# never contain a comma, so the ring stays a plain (cacheable) string.
+KEYRING_VAR = "KEY_PREVIOUS"
+# Cipher used for new values: "fernet" (default), "aesgcm" or "chacha20".
+# Decryption detects the cipher from each value, so mixing is fine.
+CIPHER_VAR = "KEY_CIPHER"
+DEFAULT_CIPHER = "fernet"
+KEY_VARS = ("KEY", KEYRING_VAR, CIPHER_VAR)
+
+# ----------------------------
+# Token classification
+# ----------------------------
+# A Fernet token is base64url(version 0x80 | timestamp (8) | IV (16) |
+# ciphertext (16 * n, n >= 1) | HMAC (32)): 57 + 16n bytes.
+_TOKEN_CHARS = re.compile(r"[A-Za-z0-9_-]+={0,2}")
+_TOKEN_OVERHEAD = 57
+_MIN_TOKEN_BYTES = _TOKEN_OVERHEAD + 16
+TOKEN_MIN_TIMESTAMP = 1_356_998_400  # 2013-01-01, before Fernet existed
+TOKEN_MAX_SKEW = 24 * 3600           # tolerate clocks up to a day ahead
+
+def is_fernet_token(value: str, now: float | None = None) -> bool:
+    """
+    Structural check, no crypto: alphabet, length, version byte and
+    timestamp range. A True result is only a candidate for decryption.
+    """
+    length = len(value)
+    if length < 100 or length % 4 or value[0] != "g":
+        return False
+    size = length // 4 * 3 - (length - len(value.rstrip("=")))
+    if size < _MIN_TOKEN_BYTES or (size - _TOKEN_OVERHEAD) % 16:
+        return False
+    if not _TOKEN_CHARS.fullmatch(value):
+        return False
+    header = base64.urlsafe_b64decode(value[:12])  # version + timestamp
+    if header[0] != 0x80:
+        return False
+    timestamp = int.from_bytes(header[1:9], "big")
+    return TOKEN_MIN_TIMESTAMP <= timestamp <= (now or time.time()) + TOKEN_MAX_SKEW
 
 def is_encrypted(value: str) -> bool:
-    return value.startswith('gAAAAAB')
+    return bool(value) and (is_fernet_token(value) or is_envelope(value))
+
+def split_tokens(values: dict) -> tuple[dict, dict]:
+    """Split a mapping into (token candidates, plain values)"""
+    tokens, plain = {}, {}
+    for name, value in values.items():
+        (tokens if is_encrypted(value) else plain)[name] = value
+    return tokens, plain
+
+# ----------------------------
+# Ciphers
+# ----------------------------
+
+def split_keyring(key: str) -> list[str]:
+    return [k.strip() for k in key.split(",") if k.strip()]
+
+def keyring(key: str, previous: str = "") -> str:
+    """Join a primary key and older keys into one keyring string (no duplicates)"""
+    keys = []
+    for k in split_keyring(key or "") + split_keyring(previous or ""):
+        if k not in keys:
+            keys.append(k)
+    return ",".join(keys)
+
+@lru_cache(maxsize=CIPHER_CACHE_SIZE)
+def get_cipher(key: str) -> Fernet | MultiFernet:
+    """
+    Fernet for `key`, built once: decoding the key and deriving its sub-keys is not free.
+    A keyring gives a MultiFernet that encrypts with the first key and decrypts with any.
+    """
+    keys = split_keyring(key)
+    if len(keys) == 1:
+        return Fernet(keys[0].encode())
+    return MultiFernet([Fernet(k.encode()) for k in keys])
+
+def decrypt_token(value: str, key: str) -> str:
+    """Decrypt a Fernet token or cipher envelope (auto-detected); InvalidToken on failure"""
+    backend = backend_for(value)
+    if backend is not None:
+        return backend.decrypt(value, split_keyring(key))
+    return get_cipher(key).decrypt(value.encode()).decode()
+
+def _encryptor(key: str, cipher: str):
+    if cipher == DEFAULT_CIPHER:
+        fernet = get_cipher(key)
+        return lambda value: fernet.encrypt(value.encode()).decode()
+    if cipher not in BACKENDS:
+        raise ValueError(f"Unknown cipher '{cipher}' (use one of: {', '.join(CIPHERS)})")
+    backend, primary = BACKENDS[cipher], split_keyring(key)[0]
+    return lambda value: backend.encrypt(value, primary)
 
 def decrypt_data(value: str, key: str):
     if not value or not key or not is_encrypted(value):
         return value
 
     try:
-        cipher = Fernet(key.encode())
-        decrypted_value = cipher.decrypt(value.encode())
-        return decrypted_value.decode()
+        return decrypt_token(value, key)
     except InvalidToken:
         # If decryption fails, return the original value
         return value
 
-def encrypt_data(value: str, key: str):
+def encrypt_data(value: str, key: str, cipher: str = DEFAULT_CIPHER):
     if not value or not key:
         return value
 
-    cipher = Fernet(key.encode())
-    encrypted_value = cipher.encrypt(value.encode())
-    return encrypted_value.decode()
+    return _encryptor(key, cipher)(value)
+
+def decrypt_many(values: dict, key: str) -> dict:
+    """Decrypt every value of a mapping; non-encrypted values pass through"""
+    if not key:
+        return dict(values)
+
+    result = {}
+    for name, value in values.items():
+        if value and is_encrypted(value):
+            try:
+                value = decrypt_token(value, key)
+            except InvalidToken:
+                pass
+        result[name] = value
+    return result
+
+def encrypt_many(values: dict, key: str, cipher: str = DEFAULT_CIPHER) -> dict:
+    """Encrypt every non-empty value of a mapping with one cipher"""
+    if not key:
+        return dict(values)
+
+    encrypt = _encryptor(key, cipher)
+    return {name: encrypt(value) if value else value for name, value in values.items()}
+
+def rotate_many(values: dict, key: str) -> tuple[dict, list[str]]:
+    """
+    Re-encrypt every encrypted value under the keyring's primary key, keeping
+    each value's cipher. Returns (values, names no key in the ring could decrypt).
+    """
+    keys = split_keyring(key)
+    fernet = MultiFernet([get_cipher(k) for k in keys])
+    result, failed = {}, []
+    for name, value in values.items():
+        if value and is_encrypted(value):
+            backend = backend_for(value)
+            try:
+                if backend is None:
+                    value = fernet.rotate(value.encode()).decode()
+                else:
+                    value = backend.encrypt(backend.decrypt(value, keys), keys[0])
+            except InvalidToken:
+                failed.append(name)
+        result[name] = value
+    return result, failed
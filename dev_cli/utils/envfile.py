@@ -0,0 +1,225 @@
+# dev_cli/utils/envfile.py
+"""
+Ordered, indexed .env document.
+
+Parsed once in a single pass. Comments, blank lines, `export` prefixes,
+quoting, inline comments and line endings (LF or CRLF) are kept, so saving
+only re-renders the lines whose values changed. Lookups go through a key -> line index (last
+definition wins, as with python-dotenv).
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+_ESCAPES = {"n": "\n", "r": "\r", "t": "\t", '"': '"', "\\": "\\"}
+
+
+class EnvLine:
+    __slots__ = ("raw", "key", "value", "export", "quote", "suffix", "dirty")
+
+    def __init__(self, raw: str, key: str | None = None, value: str | None = None,
+                 export: bool = False, quote: str = "", suffix: str = ""):
+        self.raw = raw
+        self.key = key
+        self.value = value
+        self.export = export
+        self.quote = quote    # '', "'" or '"'
+        self.suffix = suffix  # trailing text after the value, e.g. "  # comment"
+        self.dirty = False
+
+    def render(self) -> str:
+        if not self.dirty:
+            return self.raw
+        value, quote = self.value, self.quote
+        if not quote and (value != value.strip() or "#" in value or "\n" in value):
+            quote = '"'
+        if quote == '"':
+            value = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        prefix = "export " if self.export else ""
+        return f"{prefix}{self.key}={quote}{value}{quote}{self.suffix}"
+
+
+def parse_line(raw: str) -> EnvLine:
+    stripped = raw.strip()
+    if not stripped or stripped.startswith("#") or "=" not in stripped:
+        return EnvLine(raw)
+
+    export = False
+    body = raw.lstrip()
+    if body.startswith("export "):
+        export = True
+        body = body[len("export "):].lstrip()
+
+    key, rest = body.split("=", 1)
+    key = key.strip()
+    value_part = rest.lstrip()
+
+    if value_part[:1] in ("'", '"'):
+        quote = value_part[0]
+        i, chars = 1, []
+        while i < len(value_part) and value_part[i] != quote:
+            ch = value_part[i]
+            if quote == '"' and ch == "\\" and i + 1 < len(value_part):
+                i += 1
+                ch = _ESCAPES.get(value_part[i], "\\" + value_part[i])
+            chars.append(ch)
+            i += 1
+        if i < len(value_part):
+            return EnvLine(raw, key, "".join(chars), export, quote, value_part[i + 1:])
+        # Unterminated quote: treat the rest of the line literally
+
+    value, suffix = rest, ""
+    hash_at = rest.find(" #")
+    if hash_at != -1:
+        value, suffix = rest[:hash_at], rest[hash_at:]
+    trimmed = value.rstrip()
+    suffix = value[len(trimmed):] + suffix
+    return EnvLine(raw, key, trimmed.lstrip(), export, "", suffix)
+
+
+class EnvFile:
+    def __init__(self, lines: list[EnvLine] | None = None, path: str | Path | None = None,
+                 trailing_newline: bool = True, newline: str = "\n"):
+        self.path = Path(path) if path else None
+        self.lines = lines or []
+        self.trailing_newline = trailing_newline
+        self.newline = newline
+        self._index: dict[str, int] = {}
+        self._loaded = len(self.lines)
+        self._rewrite = False
+        self._reindex()
+
+    # ----------------------------
+    # Loading
+    # ----------------------------
+    @classmethod
+    def parse(cls, text: str, path: str | Path | None = None) -> "EnvFile":
+        newline = "\r\n" if "\r\n" in text else "\n"
+        lines = text.split("\n")
+        if lines[-1] == "":
+            lines.pop()
+        return cls([parse_line(l.removesuffix("\r")) for l in lines], path,
+                   trailing_newline=not text or text.endswith("\n"), newline=newline)
+
+    @classmethod
+    def load(cls, path: str | Path = ".env", missing_ok: bool = False) -> "EnvFile":
+        path = Path(path)
+        if not path.exists():
+            if missing_ok:
+                return cls(path=path)
+            raise FileNotFoundError(f"{path} not found")
+        with open(path, encoding="utf-8", newline="") as f:  # keep CRLF as written
+            return cls.parse(f.read(), path)
+
+    def _reindex(self) -> None:
+        self._index = {l.key: i for i, l in enumerate(self.lines) if l.key is not None}
+
+    # ----------------------------
+    # Lookup
+    # ----------------------------
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __getitem__(self, key: str) -> str:
+        return self.lines[self._index[key]].value
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get(self, key: str, default=None):
+        i = self._index.get(key)
+        return default if i is None else self.lines[i].value
+
+    def keys(self) -> list[str]:
+        return list(self._index)
+
+    def items(self) -> list[tuple[str, str]]:
+        """(key, value) pairs in file order; a redefined key appears once"""
+        return [(l.key, l.value) for i, l in enumerate(self.lines) if l.key is not None and self._index[l.key] == i]
+
+    def to_dict(self) -> dict:
+        return dict(self.items())
+
+    # ----------------------------
+    # Editing
+    # ----------------------------
+    def set(self, key: str, value: str, first: bool = False) -> None:
+        """Update `key` in place, or add it (at the end, or at the top with first=True)"""
+        i = self._index.get(key)
+        if i is not None:
+            line = self.lines[i]
+            if line.value == value:
+                return
+            line.value, line.dirty = value, True
+            if i < self._loaded:
+                self._rewrite = True
+            return
+
+        line = EnvLine("", key, value)
+        line.dirty = True
+        if first:
+            self.lines.insert(0, line)
+            self._loaded += 1
+            self._rewrite = True
+            self._reindex()
+        else:
+            self.lines.append(line)
+            self._index[key] = len(self.lines) - 1
+
+    def update(self, values: dict) -> None:
+        for key, value in values.items():
+            self.set(key, value)
+
+    def remove(self, key: str) -> None:
+        """Drop every definition of `key`"""
+        kept = [l for l in self.lines if l.key != key]
+        if len(kept) != len(self.lines):
+            self._loaded -= sum(1 for l in self.lines[:self._loaded] if l.key == key)
+            self.lines = kept
+            self._rewrite = True
+            self._reindex()
+
+    # ----------------------------
+    # Saving
+    # ----------------------------
+    def to_text(self) -> str:
+        text = self.newline.join(l.render() for l in self.lines)
+        return text + self.newline if text and (self.trailing_newline or self._rewrite) else text
+
+    @property
+    def changed(self) -> bool:
+        return self._rewrite or len(self.lines) > self._loaded
+
+    def save(self, path: str | Path | None = None) -> bool:
+        """
+        Write changes back with the smallest possible rewrite: nothing if
+        unchanged, an append if lines were only added, otherwise an atomic
+        temp-file + rename. Returns True if the file was written.
+        """
+        target = Path(path) if path else self.path
+        if target is None:
+            raise ValueError("No path to save .env to")
+        same_file = self.path is not None and target == self.path and target.exists()
+
+        if same_file and not self.changed:
+            return False
+
+        if same_file and not self._rewrite:
+            added = self.newline.join(l.render() for l in self.lines[self._loaded:]) + self.newline
+            with open(target, "a", encoding="utf-8", newline="") as f:
+                f.write(added if self.trailing_newline else self.newline + added)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+                f.write(self.to_text())
+            if target.exists():
+                os.chmod(tmp, target.stat().st_mode & 0o777)
+            os.replace(tmp, target)
+
+        for line in self.lines:
+            if line.dirty:
+                line.raw, line.dirty = line.render(), False
+        self.path, self._loaded, self._rewrite, self.trailing_newline = target, len(self.lines), False, True
+        return True
@@ -0,0 +1,253 @@
+# dev_cli/utils/filecrypt.py
+"""
+Chunked, authenticated streaming encryption for large files.
+
+Fernet needs the whole message in memory, so files (TLS bundles, DB dumps,
+keytabs, ...) use their own format, keyed from the same KEY in .env:
+
+    header   "ZKF" | version (1) | chunk size (u32) | salt (16)
+    chunk i  AES-256-GCM(plaintext[i]), 16-byte tag appended
+
+The file key is HKDF(KEY, salt), so every file gets a fresh key. Chunk i's
+nonce is its index plus a "last chunk" flag and the header is authenticated
+with every chunk, so reordering, truncation and header edits are detected.
+Each ciphertext chunk has a fixed size, so any chunk range can be decrypted
+by seeking straight to it.
+"""
+
+import base64
+import os
+import queue
+import struct
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from dev_cli.utils.encryption import split_keyring
+
+MAGIC = b"ZKF"
+VERSION = 1
+HEADER = struct.Struct(">3sBI16s")
+TAG_SIZE = 16
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+MAX_CHUNK_SIZE = 2 ** 32 - 1  # u32 in the header
+DEFAULT_READ_AHEAD = 4
+SUFFIX = ".zkf"
+
+
+class FileCryptError(ValueError):
+    """Raised for files that are not in the chunked format or fail authentication"""
+
+
+# ----------------------------
+# Keys and framing
+# ----------------------------
+def derive_key(key: str, salt: bytes) -> AESGCM:
+    master = base64.urlsafe_b64decode(key.encode())
+    file_key = HKDF(algorithm=hashes.SHA256(), length=32, salt=salt, info=b"zackry-file-v1").derive(master)
+    return AESGCM(file_key)
+
+
+def _nonce(index: int, last: bool) -> bytes:
+    return index.to_bytes(11, "big") + (b"\x01" if last else b"\x00")
+
+
+def _chunk_count(size: int, chunk_size: int) -> int:
+    body = size - HEADER.size
+    count = -(-body // (chunk_size + TAG_SIZE))
+    if body < TAG_SIZE or body - (count - 1) * (chunk_size + TAG_SIZE) < TAG_SIZE:
+        raise FileCryptError("Truncated file")
+    return count
+
+
+def read_header(f) -> tuple[bytes, int, bytes]:
+    header = f.read(HEADER.size)
+    if len(header) != HEADER.size:
+        raise FileCryptError("Not an encrypted file (too short)")
+    magic, version, chunk_size, salt = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise FileCryptError("Not an encrypted file (bad magic)")
+    if version != VERSION:
+        raise FileCryptError(f"Unsupported format version {version}")
+    if not chunk_size:
+        raise FileCryptError("Invalid chunk size")
+    return header, chunk_size, salt
+
+
+def _read_ahead(f, size: int, depth: int):
+    """
+    Yield `size`-byte blocks of `f`, read by a background thread at most
+    `depth` blocks ahead: I/O overlaps with the cipher, memory stays bounded.
+    """
+    blocks = queue.Queue(maxsize=max(1, depth))
+    stop = threading.Event()
+
+    def reader():
+        try:
+            while not stop.is_set():
+                block = f.read(size)
+                blocks.put(block)
+                if not block:
+                    return
+        except BaseException as e:
+            blocks.put(e)
+
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    try:
+        while True:
+            block = blocks.get()
+            if isinstance(block, BaseException):
+                raise block
+            if not block:
+                return
+            yield block
+    finally:
+        stop.set()
+        while thread.is_alive():
+            try:
+                blocks.get_nowait()
+            except queue.Empty:
+                thread.join(0.01)
+
+
+def _atomic_output(dst: Path):
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=dst.parent, prefix=f".{dst.name}.", suffix=".tmp")
+    return os.fdopen(fd, "wb"), tmp
+
+
+def _stats(size: int, start: float) -> dict:
+    seconds = max(time.perf_counter() - start, 1e-9)
+    return {"bytes": size, "seconds": round(seconds, 3), "mb_s": round(size / (1024 * 1024) / seconds, 2)}
+
+
+# ----------------------------
+# Encrypt / decrypt
+# ----------------------------
+def encrypt_file(src: str | Path, dst: str | Path, key: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 read_ahead: int = DEFAULT_READ_AHEAD, on_progress=None) -> dict:
+    """Encrypt `src` into `dst` (atomic) with the keyring's primary key"""
+    if not 0 < chunk_size <= MAX_CHUNK_SIZE:
+        raise FileCryptError(f"Chunk size must be between 1 and {MAX_CHUNK_SIZE} bytes, got {chunk_size}")
+    src, dst = Path(src), Path(dst)
+    salt = os.urandom(16)
+    header = HEADER.pack(MAGIC, VERSION, chunk_size, salt)
+    aead = derive_key(split_keyring(key)[0], salt)
+    start = time.perf_counter()
+
+    out, tmp = _atomic_output(dst)
+    try:
+        with open(src, "rb") as f, out:
+            out.write(header)
+            blocks = _read_ahead(f, chunk_size, read_ahead)
+            try:
+                # Hold one block back: it is the last only once the next read hits EOF
+                pending, index, size = b"", 0, 0
+                for block in blocks:
+                    if index or pending:
+                        out.write(aead.encrypt(_nonce(index, False), pending, header))
+                        index += 1
+                    pending = block
+                    size += len(block)
+                    if on_progress:
+                        on_progress(len(block))
+                out.write(aead.encrypt(_nonce(index, True), pending, header))
+            finally:
+                blocks.close()
+        os.replace(tmp, dst)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return _stats(size, start)
+
+
+def _open_encrypted(path: Path, key: str):
+    """Open `path`, check its header and find the key in the ring that authenticates it"""
+    f = open(path, "rb")
+    try:
+        header, chunk_size, salt = read_header(f)
+        count = _chunk_count(path.stat().st_size, chunk_size)
+        first = f.read(min(chunk_size + TAG_SIZE, path.stat().st_size - HEADER.size))
+        for candidate in split_keyring(key):
+            aead = derive_key(candidate, salt)
+            try:
+                aead.decrypt(_nonce(0, count == 1), first, header)
+            except InvalidTag:
+                continue
+            return f, aead, header, chunk_size, count
+        raise FileCryptError("Authentication failed: wrong KEY or corrupted file")
+    except BaseException:
+        f.close()
+        raise
+
+
+def iter_decrypt(path: str | Path, key: str, first: int = 0, last: int | None = None,
+                 read_ahead: int = DEFAULT_READ_AHEAD):
+    """Yield plaintext chunks `first`..`last` (inclusive), seeking straight to `first`"""
+    path = Path(path)
+    f, aead, header, chunk_size, count = _open_encrypted(path, key)
+    with f:
+        last = count - 1 if last is None else min(last, count - 1)
+        if first < 0 or first > last:
+            return
+        f.seek(HEADER.size + first * (chunk_size + TAG_SIZE))
+        blocks = _read_ahead(f, chunk_size + TAG_SIZE, read_ahead)
+        try:
+            for index, block in enumerate(blocks, first):
+                try:
+                    yield aead.decrypt(_nonce(index, index == count - 1), block, header)
+                except InvalidTag:
+                    raise FileCryptError(f"Chunk {index} failed authentication") from None
+                if index == last:
+                    return
+        finally:
+            blocks.close()
+
+
+def decrypt_file(src: str | Path, dst: str | Path, key: str, read_ahead: int = DEFAULT_READ_AHEAD,
+                 on_progress=None) -> dict:
+    """Decrypt `src` into `dst` (atomic); nothing is written unless every chunk verifies"""
+    dst = Path(dst)
+    start = time.perf_counter()
+    size = 0
+    out, tmp = _atomic_output(dst)
+    try:
+        with out:
+            for block in iter_decrypt(src, key, read_ahead=read_ahead):
+                out.write(block)
+                size += len(block)
+                if on_progress:
+                    on_progress(len(block) + TAG_SIZE)
+        os.replace(tmp, dst)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return _stats(size, start)
+
+
+def read_range(path: str | Path, key: str, offset: int, length: int) -> bytes:
+    """Plaintext bytes [offset, offset + length), decrypting only the chunks that hold them"""
+    with open(path, "rb") as f:
+        _, chunk_size, _ = read_header(f)
+    if length <= 0:
+        return b""
+    first, last = offset // chunk_size, (offset + length - 1) // chunk_size
+    data = b"".join(iter_decrypt(path, key, first, last))
+    skip = offset - first * chunk_size
+    return data[skip:skip + length]
+
+
+def chunk_info(path: str | Path) -> dict:
+    """Header details and chunk count, without any key"""
+    path = Path(path)
+    with open(path, "rb") as f:
+        _, chunk_size, _ = read_header(f)
+    size = path.stat().st_size
+    return {"chunk_size": chunk_size, "chunks": _chunk_count(size, chunk_size), "bytes": size}
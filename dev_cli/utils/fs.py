@@ -2,14 +2,37 @@
 
 from pathlib import Path
 
+from dev_cli.utils import vfs, lock
+
 def mkdir(path: str):
+    fs = vfs.current()
+    if fs is not None:
+        fs.mkdir(path)
+        return
     Path(path).mkdir(parents=True, exist_ok=True)
 
 def touch(path: str):
+    fs = vfs.current()
+    if fs is not None:
+        fs.create(path, "")
+        return
     Path(path).touch(exist_ok=True)
 
-def write_file(path: str, content: str):
+def write_file(path: str, content: str) -> bool:
+    lockfile = lock.current()
+    if lockfile is not None:
+        status = lockfile.check(path, content, vfs.read_text(path))
+        if status in (lock.CREATED, lock.UPDATED):
+            vfs.write_text(path, content)
+            return True
+        return False
+
+    fs = vfs.current()
+    if fs is not None:
+        return fs.create(path, content)
     file = Path(path)
     file.parent.mkdir(parents=True, exist_ok=True)
     if not file.exists():
         file.write_text(content)
+        return True
+    return False
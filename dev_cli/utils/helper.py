@@ -2,7 +2,32 @@
 from pathlib import Path
 from loguru import logger
 
+from dev_cli.utils import vfs, lock
+
+def _create_tracked(lockfile, file_path: str, content: str):
+    status = lockfile.check(file_path, content, vfs.read_text(file_path))
+    if status == lock.DRIFT:
+        logger.warning(f"File '{file_path}' was modified locally. Not overwritten.")
+    elif status in (lock.UNCHANGED, lock.UNTRACKED):
+        logger.info(f"File '{file_path}' already exists. No changes were made.")
+    else:
+        vfs.write_text(file_path, content)
+        logger.info(f"File '{file_path}' has been {status} successfully.")
+
 def create_file(file_path: str, content: str):
+    lockfile = lock.current()
+    if lockfile is not None:
+        _create_tracked(lockfile, file_path, content)
+        return
+
+    fs = vfs.current()
+    if fs is not None:
+        if not fs.create(file_path, content):
+            logger.info(f"File '{file_path}' already exists. No changes were made.")
+            return
+        logger.info(f"File '{file_path}' has been created successfully.")
+        return
+
     path = Path(file_path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -15,9 +40,23 @@ def create_file(file_path: str, content: str):
     logger.info(f"File '{file_path}' has been created successfully.")
 
 def modify_file(file_path: str, content: str):
+    lockfile = lock.current()
+    fs = vfs.current()
+    if fs is not None:
+        if lockfile:
+            lockfile.appending(file_path)
+        if not fs.append(file_path, content):
+            logger.info(f"Content already exists in file '{file_path}'. No changes were made.")
+            return
+        logger.info(f"File '{file_path}' has been modified successfully.")
+        return
+
     path = Path(file_path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
+    if lockfile:
+        lockfile.appending(file_path)
+
     if path.exists():
         with open(file_path, "r", encoding="utf-8") as f:
             existing = f.read()
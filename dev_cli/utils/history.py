@@ -0,0 +1,368 @@
+# dev_cli/utils/history.py
+"""
+Append-only request history.
+
+Records are JSON lines appended to size-capped segments; a sidecar index
+holds one compact line per record, so queries filter the in-memory index
+and read only the records they return (one seek each), however many
+requests have been logged.
+
+    .zackry-history/
+        00000001.jsonl   {"seq": 1, "ts": ..., "job": ..., "environment": ..., ...}
+        00000002.jsonl
+        index.jsonl      [seq, ts, environment, job, segment, offset, length]
+
+Segments are the source of truth: records appended after the last index
+line (e.g. after a crash between the two writes) are re-indexed on open,
+and `compact()` rebuilds everything from the segments. A compacted tree
+lives in a generation directory named by the CURRENT pointer file
+(`gen-00000001/...`), so compaction swaps one file and the root never
+goes missing. Appends and compaction hold an exclusive lock on
+`.zackry-history/.lock`, so several processes (e.g. `zackry requests
+--workers` next to an interactive run) can share one history.
+"""
+
+import bisect
+import json
+import os
+import shutil
+from collections import namedtuple
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+DEFAULT_ROOT = ".zackry-history"
+INDEX_NAME = "index.jsonl"
+POINTER_NAME = "CURRENT"
+GENERATION_PREFIX = "gen-"
+LOCK_NAME = ".lock"
+SEGMENT_BYTES = 8 * 1024 * 1024
+
+Entry = namedtuple("Entry", "seq ts environment job segment offset length")
+
+
+class HistoryError(ValueError):
+    """Raised for history records that cannot be read back"""
+
+
+def _segment_name(number: int) -> str:
+    return f"{number:08d}.jsonl"
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _dump(value) -> bytes:
+    return (json.dumps(value, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _lock_file(f) -> None:
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        import msvcrt
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        return
+    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+
+class RequestHistory:
+    """Request log under `root`; the index is loaded once, on open"""
+
+    def __init__(self, root: str | Path = DEFAULT_ROOT, segment_bytes: int = SEGMENT_BYTES):
+        self.root = Path(root)
+        self.segment_bytes = segment_bytes
+        self._lock_depth = 0
+        self._load()
+
+    @contextmanager
+    def _locked(self):
+        """Exclusive inter-process lock for writers (re-entrant within this object)"""
+        if self._lock_depth:
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / LOCK_NAME, "a+b") as f:  # closing the file releases the lock
+            _lock_file(f)
+            self._lock_depth = 1
+            try:
+                yield
+            finally:
+                self._lock_depth = 0
+
+    def _stale(self) -> bool:
+        """True if another process appended or compacted since this history was loaded"""
+        if self._data_dir() != self.data:
+            return True
+        last = self._entries[-1] if self._entries else None
+        if last is None:
+            return bool(self._segments())
+        path = self.data / last.segment
+        size = path.stat().st_size if path.exists() else -1
+        return size != last.offset + last.length or (self.data / _segment_name(int(last.segment[:8]) + 1)).exists()
+
+    def _data_dir(self) -> Path:
+        """Directory holding segments and index: the CURRENT generation, or the root itself"""
+        try:
+            name = (self.root / POINTER_NAME).read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            return self.root
+        return self.root / name
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ----------------------------
+    # Index
+    # ----------------------------
+    def _reset(self):
+        self._entries: list[Entry] = []
+        self._by_key: dict[tuple, list[int]] = {}
+        self._by_job: dict[str, list[int]] = {}
+
+    def _add(self, entry: Entry):
+        position = len(self._entries)
+        self._entries.append(entry)
+        self._by_key.setdefault((entry.job, entry.environment), []).append(position)
+        self._by_job.setdefault(entry.job, []).append(position)
+
+    def _segments(self) -> list[Path]:
+        return sorted(self.data.glob("[0-9]" * 8 + ".jsonl"))
+
+    def _load(self):
+        while True:
+            self.data = self._data_dir()
+            try:
+                self._load_index()
+            except FileNotFoundError:
+                if self._data_dir() == self.data:
+                    raise
+                continue  # that generation was compacted away meanwhile
+            if self._data_dir() == self.data:
+                return
+
+    def _load_index(self):
+        self._reset()
+        torn = False
+        index = self.data / INDEX_NAME
+        if index.is_file():
+            with open(index, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        self._add(Entry(*json.loads(line)))
+                    except (ValueError, TypeError):
+                        torn = True  # the records are recovered from the segments below
+                        break
+        if torn or self._stale():
+            # Recovery truncates partial writes: never while a writer is mid-append
+            with self._locked():
+                if self._recover() or torn:
+                    self._write_index(self.data, self._entries)
+
+    def _recover(self) -> int:
+        """Index records appended after the last index line; returns how many"""
+        last = self._entries[-1] if self._entries else None
+        recovered = 0
+        for path in self._segments():
+            if last and path.name < last.segment:
+                continue
+            start = last.offset + last.length if last and path.name == last.segment else 0
+            if path.stat().st_size == start:
+                continue
+            with open(path, "rb+") as f:
+                f.seek(start)
+                offset = start
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        f.truncate(offset)  # partial write
+                        break
+                    self._add(self._entry(json.loads(line), path.name, offset, len(line)))
+                    offset += len(line)
+                    recovered += 1
+        return recovered
+
+    @staticmethod
+    def _entry(record: dict, segment: str, offset: int, length: int) -> Entry:
+        return Entry(record["seq"], record["ts"], record.get("environment", ""), record.get("job", ""),
+                     segment, offset, length)
+
+    @staticmethod
+    def _write_index(root: Path, entries):
+        root.mkdir(parents=True, exist_ok=True)
+        tmp = root / f".{INDEX_NAME}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.writelines(_dump(list(e)) for e in entries)
+        os.replace(tmp, root / INDEX_NAME)
+
+    # ----------------------------
+    # Writing
+    # ----------------------------
+    def append(self, record: dict) -> dict:
+        """Append one request; `seq` and `ts` are assigned here"""
+        with self._locked():
+            if self._stale():
+                self._load()  # catch up with other processes first
+            return self._append(record)
+
+    def _append(self, record: dict) -> dict:
+        last = self._entries[-1] if self._entries else None
+        record = {"seq": last.seq + 1 if last else 1, "ts": record.get("ts") or _now(),
+                  **{k: v for k, v in record.items() if k not in ("seq", "ts")}}
+        data = _dump(record)
+
+        segment = last.segment if last else _segment_name(1)
+        path = self.data / segment
+        offset = path.stat().st_size if path.exists() else 0
+        if offset and offset + len(data) > self.segment_bytes:
+            segment, offset = _segment_name(int(segment[:8]) + 1), 0
+            path = self.data / segment
+
+        self.data.mkdir(parents=True, exist_ok=True)
+        with open(path, "ab") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        entry = self._entry(record, segment, offset, len(data))
+        with open(self.data / INDEX_NAME, "ab") as f:
+            f.write(_dump(list(entry)))
+        self._add(entry)
+        return record
+
+    # ----------------------------
+    # Reading
+    # ----------------------------
+    def read(self, entry: Entry) -> dict:
+        try:
+            with open(self.data / entry.segment, "rb") as f:
+                f.seek(entry.offset)
+                data = f.read(entry.length)
+        except FileNotFoundError:
+            if self._data_dir() == self.data:
+                raise
+            raise HistoryError("history was compacted since it was opened; open it again") from None
+        try:
+            return json.loads(data)
+        except ValueError:
+            raise HistoryError(f"{entry.segment}@{entry.offset}: unreadable record") from None
+
+    def entries(self, job: str | None = None, environment: str | None = None,
+                since: str | None = None, until: str | None = None) -> list[Entry]:
+        """
+        Index entries, oldest first. `since` / `until` are ISO dates or
+        timestamps (inclusive); entries are in time order, so they bisect.
+        """
+        if job is not None and environment is not None:
+            selected = [self._entries[i] for i in self._by_key.get((job, environment), [])]
+        elif job is not None:
+            selected = [self._entries[i] for i in self._by_job.get(job, [])]
+        else:
+            selected = [e for e in self._entries if environment is None or e.environment == environment]
+
+        if since:
+            selected = selected[bisect.bisect_left(selected, since, key=lambda e: e.ts):]
+        if until:
+            selected = selected[:bisect.bisect_right(selected, until, key=lambda e: e.ts[:len(until)])]
+        return selected
+
+    def query(self, limit: int | None = None, **filters) -> list[dict]:
+        """Matching records, newest first"""
+        selected = self.entries(**filters)[::-1]
+        return [self.read(e) for e in selected[:limit]]
+
+    def last(self, job: str, environment: str | None = None, before: int | None = None) -> dict | None:
+        """Newest record for a job (and environment) with seq < `before`"""
+        for entry in reversed(self.entries(job, environment)):
+            if before is None or entry.seq < before:
+                return self.read(entry)
+        return None
+
+    def previous(self, record: dict) -> dict | None:
+        return self.last(record["job"], record["environment"], before=record["seq"])
+
+    # ----------------------------
+    # Compaction
+    # ----------------------------
+    def compact(self, keep: int | None = None) -> dict:
+        """
+        Rewrite every record into full-size segments and rebuild the index
+        from them. With `keep`, only the newest `keep` records per job and
+        environment survive. The new tree is written as the next generation
+        and made current by replacing the CURRENT pointer atomically.
+        """
+        with self._locked():
+            if self._stale():
+                self._load()
+            return self._compact(keep)
+
+    def _compact(self, keep: int | None) -> dict:
+        before = {"records": len(self._entries), "segments": len(self._segments())}
+        kept = set()
+        for positions in self._by_key.values():
+            kept.update(positions[-keep:] if keep else positions)
+
+        current = int(self.data.name[len(GENERATION_PREFIX):]) if self.data != self.root else 0
+        generation = f"{GENERATION_PREFIX}{current + 1:08d}"
+        tmp = self.root / f".{generation}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        tmp.mkdir(parents=True)
+
+        entries, number, size, out = [], 1, 0, None
+        try:
+            for position, entry in enumerate(self._entries):
+                if position not in kept:
+                    continue
+                data = _dump(self.read(entry))
+                if out is None or (size and size + len(data) > self.segment_bytes):
+                    if out:
+                        out.close()
+                        number += 1
+                    out, size = open(tmp / _segment_name(number), "wb"), 0
+                out.write(data)
+                entries.append(entry._replace(segment=_segment_name(number), offset=size, length=len(data)))
+                size += len(data)
+        finally:
+            if out:
+                out.close()
+        self._write_index(tmp, entries)
+
+        os.replace(tmp, self.root / generation)
+        pointer = self.root / f".{POINTER_NAME}.{os.getpid()}.tmp"
+        pointer.write_text(generation + "\n", encoding="utf-8")
+        os.replace(pointer, self.root / POINTER_NAME)
+
+        # The generation just replaced stays until the next compaction, for
+        # readers that opened it; anything older is removed now
+        for path in self.root.iterdir():
+            if path.name.startswith(GENERATION_PREFIX) and path.name not in (generation, self.data.name):
+                shutil.rmtree(path, ignore_errors=True)
+        if self.data != self.root:
+            for path in [*self.root.glob("[0-9]" * 8 + ".jsonl"), self.root / INDEX_NAME]:
+                path.unlink(missing_ok=True)
+
+        self._load()
+        return {"before": before, "after": {"records": len(self._entries), "segments": len(self._segments())}}
+
+
+# ----------------------------
+# Changes between two requests
+# ----------------------------
+def changes(previous: dict | None, current: dict) -> list[tuple]:
+    """
+    (name, change, old value, new value) between two records, compared by
+    digest so a re-encrypted but unchanged value is not reported.
+    """
+    old = (previous or {}).get("digests", {})
+    new = current.get("digests", {})
+    rows = []
+    for name in dict.fromkeys([*old, *new]):
+        if old.get(name) == new.get(name):
+            continue
+        change = "added" if name not in old else "removed" if name not in new else "changed"
+        rows.append((name, change, (previous or {}).get("values", {}).get(name, ""),
+                     current.get("values", {}).get(name, "")))
+    return rows
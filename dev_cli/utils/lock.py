@@ -0,0 +1,143 @@
+# dev_cli/utils/lock.py
+"""
+.zackry-lock: template version and content hash of every generated file.
+
+Inside `with tracked(root):` helper.create_file and fs.write_file consult
+the lockfile before writing:
+
+    missing file                         → create
+    on disk == lock, template unchanged  → skip (up to date)
+    on disk == lock, template changed    → rewrite (stale)
+    on disk != lock                      → skip and report drift (user edit)
+    not in lock                          → skip (user-owned), adopted if identical
+
+.env files are only seeded: created when missing, never hashed, since
+keys and secrets are written into them after generation.
+"""
+
+import contextvars
+import hashlib
+import json
+import os
+import posixpath
+from contextlib import contextmanager
+from pathlib import Path
+
+from dev_cli.templates.project import TEMPLATE_VERSION
+from dev_cli.utils import vfs
+
+LOCK_NAME = ".zackry-lock"
+UNLOCKED_NAMES = {".env"}
+
+CREATED = "created"
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+DRIFT = "drift"
+UNTRACKED = "untracked"
+
+_current = contextvars.ContextVar("lockfile", default=None)
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class Lockfile:
+    def __init__(self, root: str | Path = "."):
+        self.root = Path(os.path.abspath(root))
+        self.path = self.root / LOCK_NAME
+        self.files: dict[str, dict] = {}
+        self.report: dict[str, list[str]] = {s: [] for s in (CREATED, UPDATED, UNCHANGED, DRIFT, UNTRACKED)}
+        self._appended: set[str] = set()
+
+        text = vfs.read_text(self.path)
+        if text:
+            self.files = json.loads(text).get("files", {})
+
+    def _rel(self, path) -> str | None:
+        rel = os.path.relpath(os.path.abspath(path), self.root)
+        return None if rel.startswith("..") else rel.replace(os.sep, "/")
+
+    def _record(self, rel: str, content: str) -> None:
+        digest = content_hash(content)
+        self.files[rel] = {"hash": digest, "template_hash": digest, "template_version": TEMPLATE_VERSION}
+
+    def check(self, path, content: str, current: str | None) -> str:
+        """Decide what to do with a generated file; records the outcome"""
+        rel = self._rel(path)
+        if rel is None:
+            return CREATED if current is None else UNTRACKED
+
+        if posixpath.basename(rel) in UNLOCKED_NAMES:
+            self.files.pop(rel, None)  # recorded by older versions
+            status = CREATED if current is None else UNTRACKED
+            self.report[status].append(rel)
+            return status
+
+        record = self.files.get(rel)
+        if current is None:
+            status = CREATED
+            self._record(rel, content)
+        elif record is None:
+            status = UNCHANGED if current == content else UNTRACKED
+            if status == UNCHANGED:
+                self._record(rel, content)
+        elif content_hash(current) != record["hash"]:
+            status = DRIFT
+        elif record.get("template_hash", record["hash"]) == content_hash(content):
+            status = UNCHANGED
+            record["template_version"] = TEMPLATE_VERSION
+        elif record.get("appends"):
+            # Generators appended to this file since it was written; a
+            # template rewrite would drop those lines, so leave it alone.
+            status = DRIFT
+        else:
+            status = UPDATED
+            self._record(rel, content)
+
+        self.report[status].append(rel)
+        return status
+
+    def appending(self, path) -> None:
+        """
+        Call before a generator appends to `path`. If the file is tracked and
+        unmodified, its hash is refreshed on save so the append is not
+        reported as drift.
+        """
+        rel = self._rel(path)
+        record = self.files.get(rel) if rel else None
+        if record is None or rel in self._appended:
+            return
+        current = vfs.read_text(path)
+        if current is not None and content_hash(current) == record["hash"]:
+            self._appended.add(rel)
+
+    def save(self) -> None:
+        for rel in self._appended:
+            self.files[rel]["hash"] = content_hash(vfs.read_text(self.root / rel) or "")
+            self.files[rel]["appends"] = True
+        payload = {"template_version": TEMPLATE_VERSION, "files": dict(sorted(self.files.items()))}
+        text = json.dumps(payload, indent=2) + "\n"
+        if text != vfs.read_text(self.path):
+            vfs.write_text(self.path, text)
+
+    def summary(self) -> str:
+        counts = ", ".join(f"{len(v)} {k}" for k, v in self.report.items() if v)
+        return counts or "no generated files"
+
+
+def current() -> Lockfile | None:
+    """The active lockfile, if any"""
+    return _current.get()
+
+
+@contextmanager
+def tracked(root: str | Path = "."):
+    """Track generated files under `root` in its .zackry-lock"""
+    lockfile = Lockfile(root)
+    token = _current.set(lockfile)
+    try:
+        yield lockfile
+    finally:
+        _current.reset(token)
+    lockfile.save()
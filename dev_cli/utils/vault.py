@@ -0,0 +1,203 @@
+# dev_cli/utils/vault.py
+"""
+Indexed, encrypted secrets vault.
+
+One record per secret, each encrypted on its own, behind a sorted index,
+so reading a secret is a binary search over the memory-mapped index, one
+seek and one decrypt, however many entries the vault holds.
+
+    header   "ZKV" | version (1) | count (u32) | salt (16) | key check (8)
+    index    count x (name hash (8) | offset (u64) | length (u32)), sorted by hash
+    records  nonce (12) | AES-256-GCM(u16 name length | name | value)
+
+Both the AES key and the (keyed BLAKE2b) name-hash key are derived from
+KEY with HKDF, so names are not readable without the key either. A record
+is authenticated against its index hash, so records cannot be swapped.
+"""
+
+import base64
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+from dev_cli.utils.encryption import split_keyring
+
+MAGIC = b"ZKV"
+VERSION = 1
+HEADER = struct.Struct(">3sBI16s8s")
+ENTRY = struct.Struct(">8sQI")
+NONCE_SIZE = 12
+
+
+class VaultError(ValueError):
+    """Raised for files that are not vaults or cannot be opened with the given key"""
+
+
+def _derive(key: str, salt: bytes) -> tuple[AESGCM, bytes]:
+    master = base64.urlsafe_b64decode(key.encode())
+    material = HKDF(algorithm=hashes.SHA256(), length=64, salt=salt, info=b"zackry-vault-v1").derive(master)
+    return AESGCM(material[:32]), material[32:]
+
+
+def _name_hash(name: str, hash_key: bytes) -> bytes:
+    return hashlib.blake2b(name.encode("utf-8"), digest_size=8, key=hash_key).digest()
+
+
+def _key_check(prefix: bytes, hash_key: bytes) -> bytes:
+    return hashlib.blake2b(prefix, digest_size=8, key=hash_key, person=b"zackry-check").digest()
+
+
+# ----------------------------
+# Writing
+# ----------------------------
+def write_vault(path: str | Path, values: dict, key: str) -> int:
+    """Write `values` to a new vault (atomic) with the keyring's primary key; returns the entry count"""
+    path = Path(path)
+    salt = os.urandom(16)
+    aead, hash_key = _derive(split_keyring(key)[0], salt)
+
+    prefix = HEADER.pack(MAGIC, VERSION, len(values), salt, b"")[:HEADER.size - 8]
+    header = prefix + _key_check(prefix, hash_key)
+
+    records = []
+    for name, value in values.items():
+        digest = _name_hash(name, hash_key)
+        encoded = name.encode("utf-8")
+        plain = struct.pack(">H", len(encoded)) + encoded + str(value).encode("utf-8")
+        nonce = os.urandom(NONCE_SIZE)
+        records.append((digest, nonce + aead.encrypt(nonce, plain, digest)))
+    records.sort(key=lambda r: r[0])
+
+    offset = HEADER.size + ENTRY.size * len(records)
+    index = bytearray()
+    for digest, record in records:
+        index += ENTRY.pack(digest, offset, len(record))
+        offset += len(record)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(index)
+            for _, record in records:
+                f.write(record)
+        os.chmod(tmp, 0o600)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return len(records)
+
+
+# ----------------------------
+# Reading
+# ----------------------------
+class Vault:
+    """Read-only, memory-mapped vault. Use as a context manager or call close()."""
+
+    def __init__(self, path: str | Path, key: str):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            self._file.close()
+            raise VaultError(f"{self.path} is not a vault (empty)") from None
+        try:
+            self._open(key)
+        except BaseException:
+            self.close()
+            raise
+
+    def _open(self, key: str):
+        if len(self._map) < HEADER.size:
+            raise VaultError(f"{self.path} is not a vault (too short)")
+        magic, version, count, salt, check = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise VaultError(f"{self.path} is not a vault (bad magic)")
+        if version != VERSION:
+            raise VaultError(f"Unsupported vault version {version}")
+        if HEADER.size + count * ENTRY.size > len(self._map):
+            raise VaultError(f"{self.path} is truncated")
+
+        prefix = self._map[:HEADER.size - 8]
+        for candidate in split_keyring(key):
+            aead, hash_key = _derive(candidate, salt)
+            if _key_check(prefix, hash_key) == check:
+                self._aead, self._hash_key, self._count = aead, hash_key, count
+                return
+        raise VaultError("Wrong KEY for this vault")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def _entry(self, i: int) -> tuple[bytes, int, int]:
+        return ENTRY.unpack_from(self._map, HEADER.size + i * ENTRY.size)
+
+    def _record(self, digest: bytes, offset: int, length: int) -> tuple[str, str]:
+        if length < NONCE_SIZE + 16 or offset + length > len(self._map):
+            raise VaultError(f"Record at offset {offset} is truncated")
+        record = self._map[offset:offset + length]
+        try:
+            plain = self._aead.decrypt(record[:NONCE_SIZE], record[NONCE_SIZE:], digest)
+        except InvalidTag:
+            raise VaultError(f"Record at offset {offset} failed authentication") from None
+        size = struct.unpack_from(">H", plain)[0]
+        return plain[2:2 + size].decode("utf-8"), plain[2 + size:].decode("utf-8")
+
+    def get(self, name: str, default=None):
+        digest = _name_hash(name, self._hash_key)
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._entry(mid)[0] < digest:
+                lo = mid + 1
+            else:
+                hi = mid
+        # Equal hashes sit next to each other; the stored name settles a collision
+        while lo < self._count:
+            entry = self._entry(lo)
+            if entry[0] != digest:
+                break
+            stored, value = self._record(*entry)
+            if stored == name:
+                return value
+            lo += 1
+        return default
+
+    def __getitem__(self, name: str) -> str:
+        value = self.get(name, self)
+        if value is self:
+            raise KeyError(name)
+        return value
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name, self) is not self
+
+    def items(self):
+        """Every (name, value), in index order; decrypts every record"""
+        for i in range(self._count):
+            yield self._record(*self._entry(i))
+
+    def to_dict(self) -> dict:
+        return dict(self.items())
@@ -0,0 +1,235 @@
+# dev_cli/utils/vfs.py
+"""
+Staged in-memory filesystem for generator writes.
+
+Inside `with staged():` the helpers in utils/helper.py and utils/fs.py
+record creates and appends in memory instead of touching disk. Each file is
+read at most once, appends are de-duplicated against an in-memory line
+index, and everything is flushed in one pass on exit: files are written to
+temp files in parallel, then renamed into place, with a rollback if any
+step fails.
+"""
+
+import contextvars
+import difflib
+import os
+import stat
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from pathlib import Path
+
+_current = contextvars.ContextVar("staged_fs", default=None)
+
+
+class _Entry:
+    __slots__ = ("path", "on_disk", "original", "parts", "lines", "dirty")
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.on_disk = path.exists()
+        self.original = None  # disk content, loaded on first append
+        self.parts = None     # staged content chunks (None = unchanged)
+        self.lines = None     # stripped-line index for append de-duplication
+        self.dirty = False
+
+    def load(self) -> None:
+        if self.parts is None:
+            if self.on_disk:
+                self.original = self.path.read_text(encoding="utf-8")
+                self.parts = [self.original]
+            else:
+                self.parts = []
+        if self.lines is None:
+            self.lines = {l.strip() for l in "".join(self.parts).splitlines()}
+
+    @property
+    def exists(self) -> bool:
+        return self.on_disk or self.dirty
+
+    def text(self) -> str:
+        if len(self.parts) > 1:
+            self.parts = ["".join(self.parts)]
+        return self.parts[0] if self.parts else ""
+
+
+class StagedFS:
+    def __init__(self):
+        self._files: dict[Path, _Entry] = {}
+        self._dirs: set[Path] = set()
+        self._lock = threading.Lock()  # generators may stage from several threads
+
+    def _entry(self, path) -> _Entry:
+        key = Path(os.path.abspath(path))
+        entry = self._files.get(key)
+        if entry is None:
+            with self._lock:
+                entry = self._files.setdefault(key, _Entry(key))
+        return entry
+
+    # ----------------------------
+    # Staging
+    # ----------------------------
+    def mkdir(self, path) -> None:
+        with self._lock:
+            self._dirs.add(Path(os.path.abspath(path)))
+
+    def exists(self, path) -> bool:
+        return self._entry(path).exists
+
+    def create(self, path, content: str) -> bool:
+        """Stage a new file; return False if it already exists"""
+        entry = self._entry(path)
+        if entry.exists:
+            return False
+        entry.parts = [content]
+        entry.lines = None
+        entry.dirty = True
+        return True
+
+    def read(self, path) -> str | None:
+        """Current (staged or on-disk) content, or None if the file does not exist"""
+        entry = self._entry(path)
+        if not entry.exists:
+            return None
+        entry.load()
+        return entry.text()
+
+    def write(self, path, content: str) -> None:
+        """Stage a full overwrite of `path`"""
+        entry = self._entry(path)
+        entry.load()
+        entry.parts = [content]
+        entry.lines = None
+        entry.dirty = True
+
+    def append(self, path, content: str) -> bool:
+        """Stage an append unless every line of `content` is already present"""
+        entry = self._entry(path)
+        entry.load()
+        new_lines = [l.strip() for l in content.strip().splitlines()]
+        if entry.exists and all(l in entry.lines for l in new_lines):
+            return False
+        entry.parts.append(content)
+        entry.lines.update(new_lines)
+        entry.dirty = True
+        return True
+
+    @property
+    def changes(self) -> list[_Entry]:
+        return [e for e in self._files.values() if e.dirty]
+
+    # ----------------------------
+    # Dry run
+    # ----------------------------
+    def diff(self) -> str:
+        """Unified diff of every staged change against disk"""
+        chunks = []
+        for entry in sorted(self.changes, key=lambda e: e.path):
+            name = os.path.relpath(entry.path)
+            before = (entry.original or "").splitlines(keepends=True)
+            after = entry.text().splitlines(keepends=True)
+            source = f"a/{name}" if entry.on_disk else "/dev/null"
+            chunks.extend(difflib.unified_diff(before, after, source, f"b/{name}"))
+        return "".join(l if l.endswith("\n") else l + "\n" for l in chunks)
+
+    # ----------------------------
+    # Flush
+    # ----------------------------
+    def flush(self, workers: int | None = None) -> list[Path]:
+        """Write all staged changes atomically; return the paths written"""
+        changes = self.changes
+        umask = os.umask(0)
+        os.umask(umask)
+
+        def write_temp(entry: _Entry) -> str:
+            fd, tmp = tempfile.mkstemp(dir=entry.path.parent, prefix=f".{entry.path.name}.", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(entry.text())
+            try:
+                mode = stat.S_IMODE(os.stat(entry.path).st_mode)  # keep e.g. the executable bit
+            except FileNotFoundError:
+                mode = 0o666 & ~umask
+            os.chmod(tmp, mode)
+            return tmp
+
+        created_dirs: list[Path] = []
+        temps: dict[_Entry, str] = {}
+        replaced: list[_Entry] = []
+        try:
+            for d in sorted(self._dirs | {e.path.parent for e in changes}):
+                created_dirs.extend(p for p in (d, *d.parents) if not p.exists())
+                d.mkdir(parents=True, exist_ok=True)
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(write_temp, e): e for e in changes}
+                wait(futures)
+            errors = [f.exception() for f in futures if f.exception()]
+            temps.update((e, f.result()) for f, e in futures.items() if not f.exception())
+            if errors:
+                raise errors[0]
+
+            for entry in changes:
+                os.replace(temps.pop(entry), entry.path)
+                replaced.append(entry)
+        except BaseException:
+            self._rollback(replaced, temps, created_dirs)
+            raise
+
+        for entry in changes:
+            entry.on_disk, entry.original, entry.dirty = True, entry.text(), False
+        return [e.path for e in changes]
+
+    @staticmethod
+    def _rollback(replaced, temps, created_dirs) -> None:
+        for tmp in temps.values():
+            Path(tmp).unlink(missing_ok=True)
+        for entry in replaced:
+            if entry.on_disk:
+                entry.path.write_text(entry.original or "", encoding="utf-8")
+            else:
+                entry.path.unlink(missing_ok=True)
+        for d in sorted(set(created_dirs), key=lambda p: len(p.parts), reverse=True):
+            try:
+                d.rmdir()
+            except OSError:
+                pass
+
+
+def current() -> StagedFS | None:
+    """The active staged filesystem, if any"""
+    return _current.get()
+
+
+def read_text(path) -> str | None:
+    """Read through the active staged FS (or disk); None if missing"""
+    fs = current()
+    if fs is not None:
+        return fs.read(path)
+    path = Path(path)
+    return path.read_text(encoding="utf-8") if path.exists() else None
+
+
+def write_text(path, content: str) -> None:
+    """Write through the active staged FS (or straight to disk)"""
+    fs = current()
+    if fs is not None:
+        fs.write(path, content)
+        return
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+@contextmanager
+def staged(dry_run: bool = False, workers: int | None = None):
+    """Stage generator writes in memory; flush on exit unless `dry_run`"""
+    fs = StagedFS()
+    token = _current.set(fs)
+    try:
+        yield fs
+    finally:
+        _current.reset(token)
+    if not dry_run:
+        fs.flush(workers)
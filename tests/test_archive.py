@@ -0,0 +1,144 @@
+"""Compressed, split archives: round trips, missing parts and checksum failures."""
+
+import importlib.util
+import random
+
+import pytest
+
+from dev_cli.utils import archive
+from dev_cli.utils.archive import CHECKSUM_SUFFIX, ArchiveError, ArchiveWriter, parse_size, read_archive
+
+DATA = b"".join(random.Random(i).randbytes(2000) + b"layer %d\n" % i * 100 for i in range(100))
+SPLIT = 20_000
+HAS_ZSTD = importlib.util.find_spec("zstandard") is not None
+CODECS = ["gzip", pytest.param("zstd", marks=pytest.mark.skipif(not HAS_ZSTD, reason="needs zstandard")), "none"]
+
+
+def export(path, data: bytes = DATA, **options) -> ArchiveWriter:
+    with ArchiveWriter(path, **options) as out:
+        for i in range(0, len(data), 7777):
+            out.write(data[i:i + 7777])
+    return out
+
+
+def read(path, **options) -> bytes:
+    _, chunks = read_archive(path, **options)
+    return b"".join(chunks)
+
+
+@pytest.mark.parametrize("codec", CODECS)
+@pytest.mark.parametrize("split", [None, SPLIT])
+@pytest.mark.parametrize("threads", [1, 4])
+def test_round_trip(tmp_path, monkeypatch, codec, split, threads):
+    monkeypatch.setattr(archive, "BLOCK_SIZE", 64 * 1024)  # several gzip members
+    path = tmp_path / f"api.tar{archive.CODECS[codec]}"
+    out = export(path, codec=codec, split_size=split, threads=threads)
+    assert out.raw_bytes == len(DATA)
+    assert out.written == sum(size for _, size, _ in out.parts)
+
+    if split:
+        assert len(out.parts) > 1 and not path.exists()
+        assert [p.name for p, _, _ in out.parts] == [f"{path.name}.{i:03d}" for i in range(len(out.parts))]
+        assert all(size == split for _, size, _ in out.parts[:-1])
+        assert read(out.parts[1][0]) == DATA  # any part opens the set
+    else:
+        assert [p for p, _, _ in out.parts] == [path]
+    checksums = path.with_name(path.name + CHECKSUM_SUFFIX).read_text().splitlines()
+    assert checksums == [f"{sha}  {p.name}" for p, _, sha in out.parts]
+
+    size, chunks = read_archive(path)
+    assert size == out.written
+    assert b"".join(chunks) == DATA
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_empty_input(tmp_path, codec):
+    path = tmp_path / "empty"
+    export(path, b"", codec=codec, threads=1)
+    assert path.is_file()
+    assert read(path) == b""
+
+
+def test_split_parts_concatenate_to_the_single_file(tmp_path):
+    whole = export(tmp_path / "a.tar.gz", threads=1)
+    split = export(tmp_path / "b.tar.gz", split_size=SPLIT, threads=1)
+    assert b"".join(p.read_bytes() for p, _, _ in split.parts) == whole.path.read_bytes()
+
+
+def test_stale_parts_of_an_earlier_export_are_removed(tmp_path):
+    path = tmp_path / "api.tar.gz"
+    export(path, split_size=SPLIT // 4, threads=1)
+    export(path, split_size=SPLIT, threads=1)
+    count = len(list(tmp_path.glob("api.tar.gz.0*")))
+    export(path, threads=1)
+    assert count > 1 and not list(tmp_path.glob("api.tar.gz.0*"))
+    assert read(path) == DATA
+
+
+@pytest.mark.parametrize("which", [1, -1])
+def test_missing_part(tmp_path, which):
+    path = tmp_path / "api.tar.gz"
+    out = export(path, split_size=SPLIT, threads=1)
+    missing = out.parts[which][0]
+    missing.unlink()
+    with pytest.raises(ArchiveError, match=f"missing part\\(s\\) {missing.name}"):
+        read_archive(path)
+
+
+def test_corrupt_part_fails_checksum_before_the_end(tmp_path):
+    path = tmp_path / "api.tar.gz"
+    out = export(path, split_size=SPLIT, threads=1)
+    part = out.parts[-1][0]
+    data = bytearray(part.read_bytes())
+    data[0] ^= 0xFF
+    part.write_bytes(bytes(data))
+
+    received = bytearray()
+    with pytest.raises(ArchiveError, match=f"{part.name}: SHA-256 mismatch"):
+        for chunk in read_archive(path, chunk_size=4096)[1]:
+            received += chunk
+    assert len(received) < len(DATA)
+
+
+def test_corrupt_checksum_file(tmp_path):
+    path = tmp_path / "api.tar.gz"
+    export(path, threads=1)
+    checksum_file = path.with_name(path.name + CHECKSUM_SUFFIX)
+    checksum_file.write_text("0" * 64 + f"  {path.name}\n")
+    with pytest.raises(ArchiveError, match="SHA-256 mismatch"):
+        read(path)
+    assert read(path, verify=False) == DATA
+
+    checksum_file.unlink()
+    with pytest.raises(ArchiveError, match=f"{CHECKSUM_SUFFIX} not found"):
+        read_archive(path)
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_truncated_archive_without_checksums(tmp_path, codec):
+    if codec == "none":
+        pytest.skip("uncompressed data has no end marker")
+    path = tmp_path / "api"
+    export(path, codec=codec, threads=1)
+    path.write_bytes(path.read_bytes()[:-10])
+    with pytest.raises(ArchiveError, match="truncated|corrupt"):
+        read(path, verify=False)
+
+
+def test_unknown_codec(tmp_path):
+    with pytest.raises(ArchiveError, match="Unknown codec 'lzma'"):
+        ArchiveWriter(tmp_path / "x", codec="lzma")
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1048576", 1048576), ("512M", 512 * 1024 ** 2), ("1.5G", int(1.5 * 1024 ** 3)), ("1GiB", 1024 ** 3),
+    ("2 kb", 2048), (4096, 4096), ("", None), (None, None),
+])
+def test_parse_size(text, expected):
+    assert parse_size(text) == expected
+
+
+@pytest.mark.parametrize("text", ["big", "1X", "-1M"])
+def test_parse_size_rejects(text):
+    with pytest.raises(ArchiveError, match="Invalid size"):
+        parse_size(text)
@@ -0,0 +1,127 @@
+""".dockerignore matching against the docker CLI's rules, and the context walk."""
+
+import os
+
+import pytest
+
+from dev_cli.utils.build_context import IgnoreMatcher, iter_context, parse_patterns
+
+
+def matcher(text: str) -> IgnoreMatcher:
+    return IgnoreMatcher(parse_patterns(text))
+
+
+def sent(root, text: str) -> list[str]:
+    (root / ".dockerignore").write_text(text)
+    return [rel for rel, _ in iter_context(root)]
+
+
+def make_tree(root, *paths: str) -> None:
+    for rel in paths:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel)
+
+
+def test_parse_patterns():
+    text = "﻿# comment\n\n  *.log  \n #not-a-comment\n! keep.log \n/abs\n./a/../b/\nsrc//x/.\n!\n"
+    assert parse_patterns(text) == ["*.log", "#not-a-comment", "!keep.log", "abs", "b", "src/x", "!"]
+
+
+# Examples from the .dockerignore reference
+@pytest.mark.parametrize("pattern, path, ignored", [
+    ("*/temp*", "somedir/temporary.txt", True),
+    ("*/temp*", "somedir/temp", True),
+    ("*/temp*", "temp", False),
+    ("*/temp*", "a/b/temporary.txt", False),
+    ("*/*/temp*", "somedir/subdir/temporary.txt", True),
+    ("*/*/temp*", "somedir/temporary.txt", False),
+    ("temp?", "tempa", True),
+    ("temp?", "temp", False),
+    ("temp?", "tempab", False),
+    ("temp?", "temp/", False),
+    ("file[0-9].txt", "file7.txt", True),
+    ("file[0-9].txt", "filex.txt", False),
+])
+def test_wildcards(pattern, path, ignored):
+    assert matcher(pattern).matches(path) is ignored
+
+
+@pytest.mark.parametrize("pattern, path, ignored", [
+    ("**/*.go", "main.go", True),
+    ("**/*.go", "cmd/app/main.go", True),
+    ("**/*.go", "main.go.txt", False),
+    ("**/node_modules", "node_modules", True),
+    ("**/node_modules", "web/node_modules/pkg/index.js", True),
+    ("docs/**/*.md", "docs/a.md", True),
+    ("docs/**/*.md", "docs/x/y/a.md", True),
+    ("docs/**/*.md", "other/docs/a.md", False),
+    ("docs/**", "docs/a/b", True),
+    ("**", "anything/at/all", True),
+])
+def test_double_star(pattern, path, ignored):
+    assert matcher(pattern).matches(path) is ignored
+
+
+@pytest.mark.parametrize("pattern, path, ignored", [
+    ("/build", "build", True),
+    ("/build", "src/build", False),  # patterns are anchored at the context root either way
+    ("build", "src/build", False),
+    ("build/", "build", True),
+    ("build/", "build/obj/main.o", True),  # a matching parent excludes everything below it
+    ("build/", "builder", False),
+    ("src/*.pyc", "src/a.pyc", True),
+    ("src/*.pyc", "src/pkg/a.pyc", False),
+])
+def test_anchoring_and_directories(pattern, path, ignored):
+    assert matcher(pattern).matches(path) is ignored
+
+
+def test_negation_and_last_match_wins():
+    m = matcher("*.md\n!README*.md\nREADME-secret.md\n")
+    assert m.matches("CHANGES.md")
+    assert not m.matches("README.md")
+    assert m.matches("README-secret.md")
+
+    m = matcher("*.md\nREADME-secret.md\n!README*.md\n")
+    assert not m.matches("README-secret.md")
+
+    assert matcher("!a.txt\n*.txt\n").matches("a.txt")  # a negation has nothing to undo before a match
+
+
+def test_negation_re_includes_file_under_excluded_directory():
+    m = matcher("vendor\n!vendor/keep.txt\n")
+    assert m.matches("vendor")
+    assert m.matches("vendor/other.txt")
+    assert not m.matches("vendor/keep.txt")
+    assert not m.can_prune("vendor")
+    assert matcher("vendor\n").can_prune("vendor")
+
+
+def test_escaped_wildcard_is_literal():
+    if os.sep == "\\":
+        pytest.skip("`\\` is a path separator on Windows")
+    m = matcher("foo\\*\n")
+    assert m.matches("foo*")
+    assert not m.matches("foobar")
+    assert not m.matches("foo/x")
+
+
+def test_context_walk(tmp_path):
+    make_tree(tmp_path, "Dockerfile", "app.py", "app.pyc", "vendor/keep.txt", "vendor/lib/x.py",
+              "build/out.o", "docs/guide.md", "docs/README.md")
+    text = "*\n!app.py\n!docs\ndocs/*.md\n!docs/README.md\nvendor\n!vendor/keep.txt\n"
+    assert sent(tmp_path, text) == [".dockerignore", "Dockerfile", "app.py", "docs", "docs/README.md",
+                                    "vendor/keep.txt"]
+
+
+def test_everything_sent_without_dockerignore(tmp_path):
+    make_tree(tmp_path, "Dockerfile", "a/b.txt")
+    assert [rel for rel, _ in iter_context(tmp_path)] == ["Dockerfile", "a", "a/b.txt"]
+
+
+def test_custom_dockerfile_is_always_sent(tmp_path):
+    make_tree(tmp_path, "docker/api.Dockerfile", "src/main.py")
+    (tmp_path / ".dockerignore").write_text("docker\nsrc\n")
+    assert [rel for rel, _ in iter_context(tmp_path, dockerfile="docker/api.Dockerfile")] == [
+        ".dockerignore", "docker/api.Dockerfile"]
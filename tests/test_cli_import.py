@@ -0,0 +1,45 @@
+"""`zackry --help` must not import any command module (see COMMANDS in dev_cli.main)."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PROBE = """
+import json, sys
+from dev_cli import main as cli
+sys.argv = ["zackry", *sys.argv[1:]]
+try:
+    cli.main()
+except SystemExit:
+    pass
+print("__MODULES__" + json.dumps(sorted(m for m in sys.modules if m.startswith("dev_cli.commands"))))
+"""
+
+
+def loaded_modules(*args: str) -> list[str]:
+    proc = subprocess.run([sys.executable, "-c", PROBE, *args], capture_output=True, text=True,
+                          cwd=ROOT, check=True)
+    marker = next(line for line in proc.stdout.splitlines() if line.startswith("__MODULES__"))
+    return json.loads(marker[len("__MODULES__"):])
+
+
+def test_help_imports_no_command_modules():
+    assert loaded_modules("--help") == []
+
+
+@pytest.mark.parametrize("command", ["b", "crypt", "vault", "history", "image", "context"])
+def test_command_help_imports_no_command_modules(command):
+    assert loaded_modules(command, "--help") == []
+
+
+def test_every_command_is_registered_lazily():
+    from dev_cli import main as cli
+
+    registered = {info.name for info in cli.app.registered_commands}
+    assert registered == set(cli.COMMANDS)
+    assert set(cli.SIGNATURES) <= set(cli.COMMANDS)
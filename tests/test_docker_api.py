@@ -0,0 +1,142 @@
+"""DockerClient against a fake Engine API served on a unix socket."""
+
+import json
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+from dev_cli.utils.docker_api import DockerClient, DockerError, json_events
+
+
+class FakeDaemon(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like dockerd
+
+    def address_string(self):
+        return "fake"  # unix sockets have no client address
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            body, chunks = b"", 0
+            while size := int(self.rfile.readline().split(b";")[0], 16):
+                body += self.rfile.read(size)
+                self.rfile.readline()
+                chunks += 1
+            self.rfile.readline()
+            self.server.chunks.append(chunks)
+            return body
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def reply(self, status: int, body: bytes, content_type: str = "application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def handle_request(self, method: str):
+        body = self.read_body()
+        self.server.requests.append((method, self.path, body))
+        if self.path == "/_ping":
+            self.reply(200, b"OK", "text/plain")
+        elif self.path.startswith("/images/missing"):
+            self.reply(404, b'{"message": "No such image: missing:latest"}')
+        elif self.path.startswith("/images/"):
+            self.reply(200, json.dumps({"Id": "sha256:abc"}).encode())
+        elif self.path.startswith("/build"):
+            self.reply(200, b'{"stream": "Step 1/1"}\n{"aux": {"ID": "sha256:abc"}}\n')
+        else:
+            self.reply(404, b'{"message": "page not found"}')
+        # Drop the keep-alive connection without telling the client
+        self.close_connection = self.server.drop_after_reply
+
+    def do_GET(self):
+        self.handle_request("GET")
+
+    def do_POST(self):
+        self.handle_request("POST")
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    server = socketserver.ThreadingUnixStreamServer(str(tmp_path / "docker.sock"), FakeDaemon)
+    server.daemon_threads = True
+    server.requests, server.chunks, server.connections, server.drop_after_reply = [], [], 0, False
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(daemon):
+    with DockerClient(daemon.server_address, timeout=5) as client:
+        yield client
+
+
+def test_ping(client, daemon):
+    assert client.ping() is True
+    assert daemon.requests == [("GET", "/_ping", b"")]
+
+
+def test_ping_without_daemon(tmp_path):
+    assert DockerClient(str(tmp_path / "absent.sock"), timeout=1).ping() is False
+
+
+def test_inspect_image(client):
+    assert client.inspect_image("api:latest") == {"Id": "sha256:abc"}
+    assert client.image_exists("api:latest")
+
+
+def test_inspect_missing_image_returns_none(client):
+    assert client.inspect_image("missing:latest") is None
+
+
+def test_error_carries_status_and_message(client):
+    with pytest.raises(DockerError) as error:
+        client.request("GET", "/nowhere")
+    assert error.value.status == 404
+    assert str(error.value) == "page not found"
+
+
+def test_build_uploads_context_chunked(client, daemon):
+    context = [b"a" * 10, b"b" * 20, b"c" * 30]
+    events = list(client.build(iter(context), "api:latest"))
+
+    assert events == [{"stream": "Step 1/1"}, {"aux": {"ID": "sha256:abc"}}]
+    method, path, body = daemon.requests[-1]
+    assert (method, path.split("?")[0], body) == ("POST", "/build", b"".join(context))
+    assert "t=api%3Alatest" in path
+    assert daemon.chunks == [3]
+
+
+def test_json_events_across_split_chunks():
+    data = '{"stream": "café"}\n{"status": "done", "progress": {"n": 1}}{"aux": 2}'.encode()
+    chunks = [data[i:i + 3] for i in range(0, len(data), 3)]  # splits objects and the UTF-8 é
+    assert list(json_events(chunks)) == [
+        {"stream": "café"}, {"status": "done", "progress": {"n": 1}}, {"aux": 2},
+    ]
+
+
+def test_connections_are_reused(client, daemon):
+    for _ in range(5):
+        assert client.ping()
+    assert daemon.connections == 1
+
+
+def test_stale_pooled_connection_is_retried(client, daemon):
+    daemon.drop_after_reply = True
+    assert client.ping()  # the server closes this connection once it has answered
+    assert client._pool.qsize() == 1  # ... but the client pooled it as keep-alive
+    assert client.ping()  # the pooled one is stale: retried on a fresh connection
+    assert daemon.connections == 2
+    assert len(daemon.requests) == 2
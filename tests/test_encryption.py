@@ -0,0 +1,78 @@
+"""Fernet token detection: decides whether a value is decrypted or encrypted again."""
+
+import base64
+import time
+
+import pytest
+from cryptography.fernet import Fernet
+
+from dev_cli.utils.encryption import decrypt_data, encrypt_data, is_encrypted, is_fernet_token
+
+KEY = Fernet.generate_key().decode()
+
+
+def token(plain: str = "secret", at: int | None = None) -> str:
+    fernet = Fernet(KEY.encode())
+    data = plain.encode()
+    return (fernet.encrypt_at_time(data, at) if at is not None else fernet.encrypt(data)).decode()
+
+
+def with_header(value: str, version: int) -> str:
+    raw = bytearray(base64.urlsafe_b64decode(value))
+    raw[0] = version
+    return base64.urlsafe_b64encode(bytes(raw)).decode()
+
+
+@pytest.mark.parametrize("plain", ["x", "a" * 15, "a" * 16, "a" * 1000])
+def test_real_tokens(plain):
+    value = token(plain)
+    assert is_fernet_token(value)
+    assert is_encrypted(value)
+    assert decrypt_data(value, KEY) == plain
+
+
+def test_truncated_token():
+    value = token("a" * 40)
+    assert not is_fernet_token(value[:-4])
+    assert not is_fernet_token(value[:-1])
+    assert not is_fernet_token(value[:100])
+
+
+@pytest.mark.parametrize("bad", ["!", "+", "/", " ", "="])
+def test_bad_base64(bad):
+    value = token()
+    broken = value[:50] + bad + value[51:]
+    assert not is_fernet_token(broken)
+
+
+def test_wrong_version_byte():
+    value = token()
+    assert is_fernet_token(with_header(value, 0x80))
+    assert not is_fernet_token(with_header(value, 0x81))
+    assert not is_fernet_token(with_header(value, 0x00))
+
+
+def test_timestamp_range():
+    now = time.time()
+    assert not is_fernet_token(token(at=1_000_000_000), now)  # 2001, before Fernet existed
+    assert not is_fernet_token(token(at=int(now) + 7 * 24 * 3600), now)
+    assert is_fernet_token(token(at=int(now) + 3600), now)
+
+
+@pytest.mark.parametrize("plain", [
+    "gAAAAA",
+    "gAAAAA-this-is-not-a-token",
+    "gAAAAA" + "x" * 94,         # token-sized, but 75 bytes is not 57 + 16n
+    "gAAAAA" + "x" * 93 + "=",   # 73 bytes, but the timestamp is years ahead
+    "gAAAAA" + "x" * 90 + " ok",
+])
+def test_plain_values_starting_like_a_token(plain):
+    assert not is_fernet_token(plain)
+    assert decrypt_data(plain, KEY) == plain
+    assert decrypt_data(encrypt_data(plain, KEY), KEY) == plain
+
+
+def test_candidate_that_fails_authentication_is_returned_unchanged():
+    other = Fernet(Fernet.generate_key()).encrypt(b"secret").decode()
+    assert is_fernet_token(other)
+    assert decrypt_data(other, KEY) == other
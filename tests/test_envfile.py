@@ -0,0 +1,120 @@
+"""EnvFile: parsing and minimal-rewrite saves."""
+
+from dev_cli.utils.envfile import EnvFile, parse_line
+
+SAMPLE = """\
+# Service settings
+export APP_NAME=api
+DB_URL="postgres://user:p#ss@db/app"  # primary
+SINGLE='it''s raw \\n'
+ESCAPED="line1\\nline2 \\"quoted\\""
+EMPTY=
+INLINE=value # trailing comment
+PORT=8000
+PORT=9000
+
+not a pair
+"""
+
+
+def write(tmp_path, text: str, newline: str = "\n"):
+    path = tmp_path / ".env"
+    path.write_bytes(text.replace("\n", newline).encode())
+    return path
+
+
+def test_values():
+    env = EnvFile.parse(SAMPLE)
+    assert env.get("APP_NAME") == "api"
+    assert env.get("DB_URL") == "postgres://user:p#ss@db/app"
+    assert env.get("SINGLE") == "it"  # single quotes end at the next quote, no escapes
+    assert env.get("ESCAPED") == 'line1\nline2 "quoted"'
+    assert env.get("EMPTY") == ""
+    assert env.get("INLINE") == "value"
+    assert env.get("MISSING", "x") == "x"
+
+
+def test_comments_and_export_are_kept():
+    env = EnvFile.parse(SAMPLE)
+    assert env.lines[0].key is None and env.lines[0].raw == "# Service settings"
+    assert env.lines[1].export
+    assert "not a pair" not in env
+    assert env.to_text() == SAMPLE
+
+
+def test_duplicate_keys_last_wins():
+    env = EnvFile.parse(SAMPLE)
+    assert env.get("PORT") == "9000"
+    assert env.keys().count("PORT") == 1
+    assert env.to_dict()["PORT"] == "9000"
+    env.remove("PORT")
+    assert "PORT" not in env and "PORT=" not in env.to_text()
+
+
+def test_unterminated_quote_is_literal():
+    line = parse_line('TOKEN="abc')
+    assert (line.key, line.value, line.quote) == ("TOKEN", '"abc', "")
+
+
+def test_set_rewrites_only_the_changed_line(tmp_path):
+    path = write(tmp_path, SAMPLE)
+    env = EnvFile.load(path)
+    env.set("INLINE", "new value")
+    env.set("APP_NAME", "api")  # unchanged: not rewritten
+    assert env.save()
+
+    before, after = SAMPLE.splitlines(), path.read_text().splitlines()
+    assert [i for i, (a, b) in enumerate(zip(before, after)) if a != b] == [6]
+    assert after[6] == "INLINE=new value # trailing comment"
+    assert EnvFile.load(path).get("INLINE") == "new value"
+
+
+def test_quoting_is_added_when_needed(tmp_path):
+    path = write(tmp_path, "A=1\n")
+    env = EnvFile.load(path)
+    env.set("A", " padded # not a comment ")
+    env.save()
+    assert path.read_text() == 'A=" padded # not a comment "\n'
+    assert EnvFile.load(path).get("A") == " padded # not a comment "
+
+
+def test_new_keys_are_appended(tmp_path):
+    path = write(tmp_path, "A=1")  # no trailing newline
+    env = EnvFile.load(path)
+    env.set("B", "2")
+    assert env.save()
+    assert path.read_text() == "A=1\nB=2\n"
+
+
+def test_unchanged_file_is_not_written(tmp_path):
+    path = write(tmp_path, SAMPLE)
+    mtime = path.stat().st_mtime_ns
+    env = EnvFile.load(path)
+    env.set("PORT", "9000")
+    assert not env.save()
+    assert path.stat().st_mtime_ns == mtime
+
+
+def test_crlf_is_preserved(tmp_path):
+    path = write(tmp_path, SAMPLE, "\r\n")
+    env = EnvFile.load(path)
+    assert env.get("PORT") == "9000" and env.get("INLINE") == "value"
+
+    env.set("INLINE", "changed")
+    env.save()
+    data = path.read_bytes()
+    assert data == SAMPLE.replace("INLINE=value", "INLINE=changed").replace("\n", "\r\n").encode()
+
+    env.set("NEW", "1")
+    env.save()
+    assert path.read_bytes().endswith(b"PORT=9000\r\n\r\nnot a pair\r\nNEW=1\r\n")
+    assert b"\n" not in path.read_bytes().replace(b"\r\n", b"")
+
+
+def test_mode_is_kept_on_rewrite(tmp_path):
+    path = write(tmp_path, "KEY=1\n")
+    path.chmod(0o600)
+    env = EnvFile.load(path)
+    env.set("KEY", "2")
+    env.save()
+    assert path.stat().st_mode & 0o777 == 0o600
@@ -0,0 +1,140 @@
+"""Request history: segments, index, recovery, compaction and concurrent writers."""
+
+import json
+import multiprocessing
+
+import pytest
+
+from dev_cli.utils.history import INDEX_NAME, POINTER_NAME, RequestHistory, changes
+
+
+def fill(history: RequestHistory, count: int, jobs: int = 3) -> None:
+    for i in range(count):
+        history.append({"job": f"job{i % jobs}", "environment": "DEV" if i % 2 else "UAT",
+                        "ts": f"2026-01-{i % 28 + 1:02d}T00:00:00+00:00", "n": i, "pad": "x" * 40})
+
+
+def test_append_and_query(tmp_path):
+    history = RequestHistory(tmp_path / "h", segment_bytes=1000)
+    fill(history, 30)
+    assert len(list((tmp_path / "h").glob("*.jsonl"))) > 2  # rolled over into several segments
+
+    reopened = RequestHistory(tmp_path / "h")
+    assert len(reopened) == 30
+    assert [r["seq"] for r in reopened.query(limit=3)] == [30, 29, 28]
+    assert {r["job"] for r in reopened.query(job="job1")} == {"job1"}
+    assert reopened.last("job0", "UAT")["n"] == 24
+    assert reopened.previous(reopened.last("job0", "UAT"))["n"] == 18
+    assert all("2026-01-05" <= r["ts"][:10] <= "2026-01-06" for r in reopened.query(since="2026-01-05",
+                                                                                     until="2026-01-06"))
+
+
+def test_recover_records_missing_from_the_index(tmp_path):
+    root = tmp_path / "h"
+    fill(RequestHistory(root), 5)
+    index = root / INDEX_NAME
+    lines = index.read_bytes().splitlines(keepends=True)
+    index.write_bytes(b"".join(lines[:3]))  # crash between the segment and the index write
+
+    history = RequestHistory(root)
+    assert len(history) == 5
+    assert len(index.read_bytes().splitlines()) == 5
+    assert history.append({"job": "job0", "environment": "DEV"})["seq"] == 6
+
+
+def test_recover_after_torn_segment_write(tmp_path):
+    root = tmp_path / "h"
+    fill(RequestHistory(root), 5)
+    segment = root / "00000001.jsonl"
+    with open(segment, "ab") as f:
+        f.write(b'{"seq": 6, "job": "jo')  # partial record, no newline
+    size = segment.stat().st_size
+
+    history = RequestHistory(root)
+    assert len(history) == 5
+    assert segment.stat().st_size < size  # partial write truncated
+    history.append({"job": "job0", "environment": "DEV"})
+    assert [r["seq"] for r in RequestHistory(root).query()] == [6, 5, 4, 3, 2, 1]
+
+
+def test_torn_index_line_is_rebuilt(tmp_path):
+    root = tmp_path / "h"
+    fill(RequestHistory(root), 5)
+    index = root / INDEX_NAME
+    index.write_bytes(index.read_bytes()[:-7])
+    assert len(RequestHistory(root)) == 5
+    assert all(json.loads(line) for line in index.read_text().splitlines())
+
+
+def test_compact_then_query(tmp_path):
+    root = tmp_path / "h"
+    history = RequestHistory(root, segment_bytes=1000)
+    fill(history, 30)
+    newest = history.query(limit=30)
+
+    stats = history.compact()
+    assert stats["before"]["records"] == stats["after"]["records"] == 30
+    assert (root / POINTER_NAME).read_text().strip() == "gen-00000001"
+    assert list(root.glob("*.jsonl"))  # the replaced layout stays one round for open readers
+
+    reopened = RequestHistory(root)
+    assert reopened.query(limit=30) == newest
+    assert reopened.append({"job": "job0", "environment": "DEV"})["seq"] == 31
+
+    stats = RequestHistory(root).compact(keep=2)
+    assert stats["after"]["records"] == 12  # 6 (job, environment) pairs x 2
+    kept = RequestHistory(root)
+    assert kept.last("job0", "DEV")["seq"] == 31
+    assert len(kept.query(job="job1", environment="DEV")) == 2
+    assert sorted(p.name for p in root.iterdir() if p.name.startswith("gen-")) == ["gen-00000001", "gen-00000002"]
+    assert not list(root.glob("*.jsonl"))
+
+
+def test_compact_includes_records_appended_by_another_writer(tmp_path):
+    root = tmp_path / "h"
+    first, second = RequestHistory(root), RequestHistory(root)
+    fill(first, 3)
+    second.compact()  # opened before the appends
+    assert len(RequestHistory(root)) == 3
+
+
+def test_stale_writer_does_not_reuse_seq(tmp_path):
+    root = tmp_path / "h"
+    first, second = RequestHistory(root), RequestHistory(root)
+    first.append({"job": "a", "environment": "DEV"})
+    assert second.append({"job": "b", "environment": "DEV"})["seq"] == 2
+
+
+def _append_many(root: str, worker: int, count: int) -> None:
+    history = RequestHistory(root, segment_bytes=4000)
+    for i in range(count):
+        history.append({"job": f"w{worker}", "environment": "DEV", "i": i})
+
+
+def test_concurrent_processes_append_safely(tmp_path):
+    root = str(tmp_path / "h")
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=_append_many, args=(root, w, 25)) for w in range(4)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join(60)
+        assert process.exitcode == 0
+
+    history = RequestHistory(root)
+    records = history.query()
+    assert len(records) == 100
+    assert sorted(r["seq"] for r in records) == list(range(1, 101))
+    for w in range(4):
+        assert sorted(r["i"] for r in history.query(job=f"w{w}")) == list(range(25))
+
+
+@pytest.mark.parametrize("previous, current, expected", [
+    (None, {"digests": {"A": "1"}, "values": {"A": "a"}}, [("A", "added", "", "a")]),
+    ({"digests": {"A": "1"}, "values": {"A": "x"}}, {"digests": {"A": "1"}, "values": {"A": "y"}}, []),
+    ({"digests": {"A": "1", "B": "2"}, "values": {"A": "a", "B": "b"}},
+     {"digests": {"A": "9"}, "values": {"A": "c"}},
+     [("A", "changed", "a", "c"), ("B", "removed", "b", "")]),
+])
+def test_changes(previous, current, expected):
+    assert changes(previous, current) == expected
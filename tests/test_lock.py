@@ -0,0 +1,53 @@
+""".zackry-lock: re-running init only reports drift for generated files."""
+
+import json
+
+from dev_cli.commands.init import create_project
+from dev_cli.utils.lock import DRIFT, LOCK_NAME, UNTRACKED, content_hash, tracked
+from dev_cli.utils.vfs import staged
+
+
+def init(root):
+    with staged(), tracked(root) as lockfile:
+        create_project(root)
+    return lockfile
+
+
+def test_rerun_is_clean(tmp_path):
+    init(tmp_path)
+    lockfile = init(tmp_path)
+    assert lockfile.report[DRIFT] == []
+    assert "app/main.py" in lockfile.files
+
+
+def test_env_is_seeded_but_not_locked(tmp_path):
+    init(tmp_path)
+    env = tmp_path / ".env"
+    assert env.is_file()
+    assert ".env" not in json.loads((tmp_path / LOCK_NAME).read_text())["files"]
+
+    env.write_text(env.read_text() + "KEY=generated-later\n")
+    lockfile = init(tmp_path)
+    assert lockfile.report[DRIFT] == []
+    assert lockfile.report[UNTRACKED] == [".env"]
+    assert env.read_text().endswith("KEY=generated-later\n")
+
+
+def test_env_recorded_by_an_older_lock_is_dropped(tmp_path):
+    init(tmp_path)
+    lock_path = tmp_path / LOCK_NAME
+    payload = json.loads(lock_path.read_text())
+    digest = content_hash("old")
+    payload["files"][".env"] = {"hash": digest, "template_hash": digest, "template_version": "0"}
+    lock_path.write_text(json.dumps(payload))
+
+    assert init(tmp_path).report[DRIFT] == []
+    assert ".env" not in json.loads(lock_path.read_text())["files"]
+
+
+def test_edited_generated_file_is_drift(tmp_path):
+    init(tmp_path)
+    main = tmp_path / "app" / "main.py"
+    main.write_text(main.read_text() + "# local change\n")
+    assert init(tmp_path).report[DRIFT] == ["app/main.py"]
+    assert main.read_text().endswith("# local change\n")
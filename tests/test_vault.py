@@ -0,0 +1,113 @@
+"""ZKV vault: round trip, lookups and damaged files."""
+
+import pytest
+from cryptography.fernet import Fernet
+
+from dev_cli.commands import vault as vault_command
+from dev_cli.utils.envfile import EnvFile
+from dev_cli.utils.vault import HEADER, ENTRY, Vault, VaultError, write_vault
+
+KEY = Fernet.generate_key().decode()
+SECRETS = {"DB_PASSWORD": "s3cr3t", "API_TOKEN": "tok=en#1", "EMPTY": "", "UNICODE": "héllo ✓",
+           **{f"VAR_{i}": f"value_{i}" for i in range(200)}}
+
+
+@pytest.fixture
+def vault_file(tmp_path):
+    path = tmp_path / "secrets.zkv"
+    write_vault(path, SECRETS, KEY)
+    return path
+
+
+def test_round_trip(vault_file):
+    with Vault(vault_file, KEY) as vault:
+        assert len(vault) == len(SECRETS)
+        assert vault.to_dict() == SECRETS
+        for name, value in SECRETS.items():
+            assert vault.get(name) == value
+        assert vault["UNICODE"] == "héllo ✓"
+
+
+def test_missing_key(vault_file):
+    with Vault(vault_file, KEY) as vault:
+        assert vault.get("NOPE") is None
+        assert vault.get("NOPE", "default") == "default"
+        assert "NOPE" not in vault and "DB_PASSWORD" in vault
+        with pytest.raises(KeyError):
+            vault["NOPE"]
+
+
+def test_names_are_not_stored_in_clear(vault_file):
+    assert b"DB_PASSWORD" not in vault_file.read_bytes()
+
+
+def test_previous_key_opens_and_wrong_key_is_rejected(vault_file):
+    other = Fernet.generate_key().decode()
+    with Vault(vault_file, f"{other},{KEY}") as vault:
+        assert vault["DB_PASSWORD"] == "s3cr3t"
+    with pytest.raises(VaultError, match="Wrong KEY"):
+        Vault(vault_file, other)
+
+
+@pytest.mark.parametrize("size", [0, 3, HEADER.size - 1])
+def test_too_short(vault_file, size):
+    vault_file.write_bytes(vault_file.read_bytes()[:size])
+    with pytest.raises(VaultError, match="not a vault"):
+        Vault(vault_file, KEY)
+
+
+def test_truncated_index(vault_file):
+    vault_file.write_bytes(vault_file.read_bytes()[:HEADER.size + ENTRY.size * 10])
+    with pytest.raises(VaultError, match="truncated"):
+        Vault(vault_file, KEY)
+
+
+@pytest.mark.parametrize("cut", [1, 50, 5000])
+def test_truncated_records(vault_file, cut):
+    vault_file.write_bytes(vault_file.read_bytes()[:-cut])
+    with Vault(vault_file, KEY) as vault, pytest.raises(VaultError, match="truncated"):
+        vault.to_dict()
+
+
+def test_bad_magic_and_version(vault_file):
+    data = vault_file.read_bytes()
+    vault_file.write_bytes(b"XXX" + data[3:])
+    with pytest.raises(VaultError, match="bad magic"):
+        Vault(vault_file, KEY)
+    vault_file.write_bytes(data[:3] + b"\x09" + data[4:])
+    with pytest.raises(VaultError, match="version"):
+        Vault(vault_file, KEY)
+
+
+def test_corrupt_record_fails_authentication(vault_file):
+    data = bytearray(vault_file.read_bytes())
+    data[-1] ^= 0xFF
+    vault_file.write_bytes(bytes(data))
+    with Vault(vault_file, KEY) as vault, pytest.raises(VaultError, match="failed authentication"):
+        vault.to_dict()
+
+
+def test_corrupt_header_is_detected(vault_file):
+    data = bytearray(vault_file.read_bytes())
+    data[HEADER.size - 9] ^= 0x01  # last salt byte: the key check no longer matches
+    vault_file.write_bytes(bytes(data))
+    with pytest.raises(VaultError, match="Wrong KEY"):
+        Vault(vault_file, KEY)
+
+
+def test_import_get_export(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    fernet = Fernet(KEY.encode())
+    (tmp_path / ".env").write_text(f"KEY={KEY}\nDB_PASSWORD={fernet.encrypt(b's3cr3t').decode()}\nPORT=8000\n")
+
+    assert vault_command.import_env(".env", "app.zkv")
+    capsys.readouterr()
+    assert vault_command.get_secret("app.zkv", "DB_PASSWORD")
+    assert capsys.readouterr().out == "s3cr3t\n"
+    assert not vault_command.get_secret("app.zkv", "MISSING")
+
+    assert vault_command.export_env("app.zkv", "out.env")
+    assert EnvFile.load("out.env").to_dict() == {"DB_PASSWORD": "s3cr3t", "PORT": "8000"}
+    assert vault_command.export_env("app.zkv", "enc.env", encrypt=True)
+    encrypted = EnvFile.load("enc.env")
+    assert fernet.decrypt(encrypted.get("DB_PASSWORD").encode()) == b"s3cr3t"